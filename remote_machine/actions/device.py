@@ -3,6 +3,7 @@
 from __future__ import annotations
 import shlex
 import json
+import sys
 from typing import List
 from remote_machine.models.remote_state import RemoteState
 from remote_machine.protocols.ssh import SSHProtocol
@@ -221,13 +222,13 @@ class DeviceAction:
 
     def mounted(self) -> MountedList:
         """Return list of mounted filesystem info as MountedList dataclass."""
-        parsed = parse_mount(self.protocol.run_command("cat /proc/mounts"), self.state)
+        parsed = parse_mount(self.protocol.run_command("cat /proc/mounts", self.state))
 
         mount_points: list[MountPoint] = [
             MountPoint(
                 device=m.get("device", ""),
                 mount_point=m.get("mount_point", ""),
-                fstype=m.get("filesystem_type", ""),
+                fstype=sys.intern(m.get("filesystem_type", "")),
                 total_size=0,
                 used=0,
                 available=0,
@@ -237,7 +238,7 @@ class DeviceAction:
             for m in parsed
         ]
 
-        return MountedList(mount_points=mount_points, count=len(mount_points))
+        return MountedList(mount_points=mount_points)
 
     def fsck(self, device: str, fix: bool = False) -> FSCKResult:
         """Run fsck on `device`, optionally attempting fixes and return FSCKResult."""
@@ -402,9 +403,9 @@ class DeviceAction:
                         except Exception:
                             continue
 
-            return GPIOInfo(pins=pins, total=len(pins), available=len(pins))
+            return GPIOInfo(pins=pins)
         except Exception:
-            return GPIOInfo(pins=[], total=0, available=0)
+            return GPIOInfo(pins=[])
 
     def gpio_read(self, pin: int) -> IDResult:
         """Read the value of GPIO `pin` and return as IDResult (0 or 1). Args: pin"""
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+import re
 import shlex
 from datetime import datetime
 from typing import List, Optional
@@ -17,6 +18,29 @@ from remote_machine.models.docker_types import (
     DockerInfo,
 )
 
+# docker prints decimal units for image sizes and binary ones for memory usage
+_SIZE_RE = re.compile(r"^([\d.]+)\s*([kKMGT]?i?B)$")
+_SIZE_UNITS = {
+    "B": 1,
+    "kB": 1000,
+    "KB": 1000,
+    "MB": 1000**2,
+    "GB": 1000**3,
+    "TB": 1000**4,
+    "KiB": 1024,
+    "MiB": 1024**2,
+    "GiB": 1024**3,
+    "TiB": 1024**4,
+}
+
+
+def _parse_size(size_str: str) -> int:
+    """Parse a docker size string like '77.8MB' or '120.5MiB' to bytes (0 if unknown)."""
+    m = _SIZE_RE.match(size_str.strip())
+    if not m or m.group(2) not in _SIZE_UNITS:
+        return 0
+    return int(float(m.group(1)) * _SIZE_UNITS[m.group(2)])
+
 
 class DockerAction:
     """Docker operations."""
@@ -93,7 +117,7 @@ class DockerAction:
                         created=datetime.fromisoformat(
                             data.get("CreatedAt", "").replace("Z", "+00:00")
                         ),
-                        size=int(data.get("Size", "0").split()[0]) if data.get("Size") else 0,
+                        size=_parse_size(data.get("Size", "")),
                         virtual_size=0,  # Not provided by images command
                     )
                 )
@@ -253,22 +277,14 @@ class DockerAction:
             output = self.protocol.run_command(cmd, self.state)
             data = json.loads(output.strip())
 
-            def parse_size(size_str: str) -> int:
-                """Parse size string like '123MiB' to bytes."""
-                multipliers = {"B": 1, "KiB": 1024, "MiB": 1024**2, "GiB": 1024**3}
-                for suffix, mult in multipliers.items():
-                    if size_str.endswith(suffix):
-                        return int(float(size_str[: -len(suffix)]) * mult)
-                return 0
-
             return ContainerStats(
                 container_id=data.get("Container", ""),
                 cpu_percent=(
                     float(data.get("CPUPerc", "0").rstrip("%")) if data.get("CPUPerc") else 0.0
                 ),
-                memory_usage=parse_size(data.get("MemUsage", "0B").split()[0]),
+                memory_usage=_parse_size(data.get("MemUsage", "0B").split()[0]),
                 memory_limit=(
-                    parse_size(data.get("MemUsage", "").split()[-1])
+                    _parse_size(data.get("MemUsage", "").split()[-1])
                     if "/" in data.get("MemUsage", "")
                     else 0
                 ),
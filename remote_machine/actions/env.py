@@ -37,7 +37,7 @@ class ENVAction:
 
     def all(self) -> EnvVars:
         """Return a copy of all environment variables as EnvVars dataclass."""
-        return EnvVars(vars=self.state.env.copy(), count=len(self.state.env))
+        return EnvVars(vars=self.state.env.copy())
 
     def list(self) -> EnvVars:
         """Alias for `all()`; return env variables as EnvVars dataclass."""
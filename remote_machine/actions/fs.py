@@ -24,6 +24,19 @@ from remote_machine.models.filesystem_types import (
     FileFindResult,
 )
 
+_MONTHS = {m: i for i, m in enumerate("Jan Feb Mar Apr May Jun Jul Aug Sep Oct Nov Dec".split(), 1)}
+
+
+def _ls_mtime(stamp: str) -> datetime:
+    """Parse an `ls -la` time column ("Mar  5 10:11") without strptime."""
+    try:
+        month, day, clock = stamp.split()
+        hour, _, minute = clock.partition(":")
+        return datetime(1900, _MONTHS[month], int(day), int(hour), int(minute))
+    except (KeyError, ValueError):
+        # non-C locale month names
+        return datetime.strptime(stamp, "%b %d %H:%M")
+
 
 class FSAction:
     """Filesystem operations."""
@@ -57,13 +70,13 @@ class FSAction:
                     path=entry["File"],
                     type=perms.entry_type if perms else None,
                     size=int(entry["Size"]),
-                    modified=datetime.strptime(entry["LastModified"], "%b %d %H:%M"),
+                    modified=_ls_mtime(entry["LastModified"]),
                     owner=entry["Owner"],
                     group=entry["Group"],
                     permissions=perms,
                 )
             )
-        return DirectoryListing(entries=entries, count=len(entries), path=resolved_path)
+        return DirectoryListing(entries=entries, path=resolved_path)
 
     def cd(self, path: str) -> OperationResult:
         """Change working directory to resolved `path` and return OperationResult."""
@@ -170,9 +183,9 @@ class FSAction:
             mode=parsed.get("mode", ""),
             owner=parsed.get("owner", parsed.get("user", "")),
             group=parsed.get("group", ""),
-            modified=datetime.fromtimestamp(parsed.get("mtime", 0)),
-            accessed=datetime.fromtimestamp(parsed.get("atime", 0)),
-            created=datetime.fromtimestamp(parsed.get("ctime", 0)),
+            modified_epoch=int(parsed.get("mtime", 0)),
+            accessed_epoch=int(parsed.get("atime", 0)),
+            created_epoch=int(parsed.get("ctime", 0)),
             is_symlink=parsed.get("type", "").lower().startswith("symbolic"),
             is_file=parsed.get("type", "").lower().startswith("regular"),
             is_dir=parsed.get("type", "").lower().startswith("directory"),
@@ -216,9 +229,7 @@ class FSAction:
         matches = [line.strip() for line in output.splitlines() if line.strip()]
         pattern = name or "*"
 
-        return FileFindResult(
-            pattern=pattern, root_path=resolved_path, matches=matches, count=len(matches)
-        )
+        return FileFindResult(pattern=pattern, root_path=resolved_path, matches=matches)
 
     @requires_protocols("scp")
     def download(self, remote_path: str, local_path: str):
@@ -421,36 +421,26 @@ class GitAction:
         if not ref1:
             ref1 = "HEAD~1"
 
+        # --numstat gives exact per-file counts; --stat only draws a scaled +/- graph
         cmd = (
-            f"git -C {shlex.quote(repo_path)} diff --stat {shlex.quote(ref1)}...{shlex.quote(ref2)}"
+            f"git -C {shlex.quote(repo_path)} diff --numstat "
+            f"{shlex.quote(ref1)}...{shlex.quote(ref2)}"
         )
         output = self.protocol.run_command(cmd, self.state)
 
         diff_stats = []
-        for line in output.strip().split("\n"):
-            if not line.strip() or line.startswith(" "):
-                continue
-
-            # Parse format: " filename | insertions insertions, deletions deletions"
-            parts = line.split("|")
-            if len(parts) != 2:
+        for line in output.splitlines():
+            # "<insertions>\t<deletions>\t<file>"; binary files show "-" for both counts
+            parts = line.split("\t", 2)
+            if len(parts) != 3:
                 continue
 
-            file_path = parts[0].strip()
-            changes = parts[1].strip().split()
-
-            insertions = 0
-            deletions = 0
-
-            for part in changes:
-                if "+" in part:
-                    insertions = int(part.replace("+", ""))
-                elif "-" in part:
-                    deletions = int(part.replace("-", ""))
+            insertions = int(parts[0]) if parts[0].isdigit() else 0
+            deletions = int(parts[1]) if parts[1].isdigit() else 0
 
             diff_stats.append(
                 DiffStat(
-                    file=file_path,
+                    file=parts[2],
                     insertions=insertions,
                     deletions=deletions,
                     changes=insertions + deletions,
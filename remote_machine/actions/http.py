@@ -4,7 +4,13 @@ import base64
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from remote_machine.protocols.http import HTTPProtocol
-from remote_machine.models import HTTPStatusResult, HTTPErrorResult, OperationResult, HTTPResultType, HTTPDownloadResultType
+from remote_machine.models.common_types import OperationResult
+from remote_machine.models.http_types import (
+    HTTPStatusResult,
+    HTTPErrorResult,
+    HTTPResultType,
+    HTTPDownloadResultType,
+)
 
 
 
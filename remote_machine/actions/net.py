@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import shlex
+import sys
 
 from remote_machine.models.remote_state import RemoteState
 from remote_machine.protocols.ssh import SSHProtocol
@@ -169,7 +170,7 @@ class NETAction:
     def ip_list(self, interface: str | None = None) -> IPAddressList:
         """Return a list of IP addresses; optionally filtered by interface."""
         cmd = "ip a" if interface is None else f"ip a show dev {shlex.quote(interface)}"
-        parsed = parse_ip_a(self.protocol.run_command(cmd), self.state)
+        parsed = parse_ip_a(self.protocol.run_command(cmd, self.state))
 
         addresses: list[IPAddress] = []
 
@@ -195,19 +196,22 @@ class NETAction:
                     )
                 )
 
-        return IPAddressList(addresses=addresses, count=len(addresses))
+        return IPAddressList(addresses=addresses)
 
     def route_list(self) -> RoutingTable:
         """Return routing table entries as a list of dicts."""
         cmd = "ip r"
 
-        parsed = parse_ip_r(self.protocol.run_command(cmd), self.state)
+        parsed = parse_ip_r(self.protocol.run_command(cmd, self.state))
 
         routes: list[Route] = []
         for r in parsed:
             routes.append(
                 Route(
-                    destination=r.get("dest") or r.get("destination") or r.get("dst", ""),
+                    # parse_ip_r reports the destination (or "default") as "type"
+                    destination=(
+                        r.get("type") or r.get("dest") or r.get("destination") or r.get("dst", "")
+                    ),
                     gateway=r.get("via") or r.get("gateway") or "",
                     netmask=r.get("mask") or "",
                     flags=r.get("flags", ""),
@@ -216,7 +220,7 @@ class NETAction:
                 )
             )
 
-        return RoutingTable(routes=routes, count=len(routes))
+        return RoutingTable(routes=routes)
 
     def tcp_connections(self) -> ConnectionList:
         """Return a list of TCP connection dicts."""
@@ -251,13 +255,13 @@ class NETAction:
                     local_port=local_port,
                     remote_address=remote_host,
                     remote_port=remote_port,
-                    state=c.get("State") or c.get("state", ""),
+                    state=sys.intern(c.get("State") or c.get("state", "")),
                     pid=int(c.get("pid") or c.get("PID") or 0) or None,
                     process_name=c.get("process") or c.get("ProgramName"),
                 )
             )
 
-        return ConnectionList(connections=conns, count=len(conns))
+        return ConnectionList(connections=conns)
 
     def listening_ports(self) -> ListeningPortList:
         """Return listening port info as a list of dicts."""
@@ -285,14 +289,14 @@ class NETAction:
                 ListeningPort(
                     address=addr,
                     port=port_num,
-                    protocol=(p.get("Proto") or p.get("protocol") or "tcp").lower(),
-                    state=p.get("State") or p.get("state", ""),
+                    protocol=sys.intern((p.get("Proto") or p.get("protocol") or "tcp").lower()),
+                    state=sys.intern(p.get("State") or p.get("state", "")),
                     pid=int(p.get("pid") or p.get("PID") or 0) or None,
                     process_name=p.get("process") or p.get("ProgramName"),
                 )
             )
 
-        return ListeningPortList(ports=ports, count=len(ports))
+        return ListeningPortList(ports=ports)
 
     def ping(self, host: str, count: int = 4, timeout: int = 5) -> PingResult:
         """Ping `host` and return the summary as PingResult."""
@@ -459,4 +463,4 @@ class NETAction:
                 )
             )
 
-        return BandwidthList(items=items, count=len(items))
+        return BandwidthList(items=items)
@@ -179,13 +179,7 @@ class ProxyAction:
         rm2._protocols = dict(self._rm._protocols)
         rm2._protocols["ssh"] = ssh_proto
         rm2.state = self._rm.state  # share state optionally
-        rm2.fs = rm2.fs.__class__(rm2, rm2.state)
-        rm2.ps = rm2.ps.__class__(rm2, rm2.state)
-        rm2.net = rm2.net.__class__(rm2, rm2.state)
-        rm2.env = rm2.env.__class__(rm2, rm2.state)
-        rm2.sys = rm2.sys.__class__(rm2, rm2.state)
-        rm2.service = rm2.service.__class__(rm2, rm2.state)
-        rm2.device = rm2.device.__class__(rm2, rm2.state)
+        # actions (fs, ps, ...) are created lazily on rm2 over the tunnel's ssh layer
         rm2.proxy = ProxyAction(rm2)
         rm2.parent = self._rm  # track chain
 
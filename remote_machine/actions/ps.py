@@ -10,7 +10,6 @@ from remote_machine.protocols.ssh import SSHProtocol
 
 from linux_parsers.parsers.process.ps import parse_ps_aux
 
-from datetime import datetime
 
 from linux_parsers.parsers.system.free import parse_free_btlv
 
@@ -50,12 +49,13 @@ class PSAction:
                 ppid=int(p.get("ppid") or 0),
                 name=(cmd := p.get("command") or "") and cmd.split()[0] or "",
                 state=p.get("stat") or "",
-                user=p.get("user") or p.get("USER") or "",
+                # parse_ps_aux names the USER column "event"
+                user=p.get("event") or p.get("user") or "",
                 cpu_percent=float(p.get("cpu") or 0.0),
                 memory_percent=float(p.get("mem") or 0.0),
                 memory_rss=int(p.get("rss") or 0),
                 memory_vms=int(p.get("vsz") or 0),
-                started=datetime.fromtimestamp(0),
+                started_epoch=0,
                 command=cmd,
             )
             for p in parsed
@@ -76,7 +76,7 @@ class PSAction:
 
     def get_info(self, pid: int) -> ProcessInfo | None:
         """Return process details for `pid` or None if not found. Args: pid"""
-        return [p for p in self.list() if p.pid == pid][0]
+        return next((p for p in self.list() if p.pid == pid), None)
 
     def is_running(self, pid: int) -> BoolResult:
         """Return BoolResult indicating if `pid` is running."""
@@ -199,7 +199,7 @@ class PSAction:
     def get_children(self, pid: int) -> ProcessChildren:
         """Return child PIDs of `pid`. Args: pid"""
         children = [p.pid for p in self.list() if p.ppid == int(pid)]
-        return ProcessChildren(pid=int(pid), children=children, count=len(children))
+        return ProcessChildren(pid=int(pid), children=children)
 
     def get_parent(self, pid: int) -> ProcessParent:
         """Return parent PID for `pid` or None. Args: pid"""
@@ -2,14 +2,23 @@
 
 from __future__ import annotations
 
+import asyncio
+import json
+import re
 import shlex
+import sys
+import time
+from typing import List, Literal, overload
 
+from remote_machine.errors.error_mapper import ErrorMapper
 from remote_machine.models.remote_state import RemoteState
 from remote_machine.protocols.ssh import SSHProtocol
+from remote_machine.models.command_result import CommandResult
 from remote_machine.models.common_types import BoolResult, OperationResult, IDResult
 from remote_machine.models.service_types import (
     ServiceStatus,
     ServiceList,
+    ServiceListColumns,
     ServiceConfig,
     ServiceLog,
     ServiceLogList,
@@ -17,13 +26,81 @@ from remote_machine.models.service_types import (
     ServiceDependency,
 )
 
-
 from datetime import datetime
 
+# `systemctl list-dependencies` line: optional tree glyphs/bullets, then a unit name
+_DEPS_RE = re.compile(r"^(?P<indent>[^\w\n]*)(?P<name>[\w@.:\\-]+\.service)\s*$", re.M)
+
+# `systemctl is-enabled` / UnitFileState values meaning the unit starts at boot
+_ENABLED_SET = frozenset(("enabled", "static", "enabled-runtime", "alias"))
+
+# mutator command prefixes; the validated unit name is appended
+_CMD_RELOAD = "systemctl reload "
+_CMD_ENABLE = "systemctl enable "
+_CMD_DISABLE = "systemctl disable "
+_CMD_MASK = "systemctl mask "
+_CMD_UNMASK = "systemctl unmask "
+
+# systemd unit-name charset, including the `\` of escaped names like `dev-sda\x2d1`
+_SAFE = re.compile(r"\A[A-Za-z0-9@._:\\-]+\Z")
+
+
+def _valid_name(name: str) -> str:
+    """Return `name` unchanged if it is a valid unit name, else raise ValueError."""
+    if not _SAFE.match(name):
+        raise ValueError(f"Invalid service name: {name!r}")
+    return name
+
+
+def _safe_name(name: str) -> str:
+    """Return `name` validated and shell-quoted (a no-op unless it contains a backslash)."""
+    return shlex.quote(_valid_name(name))
+
+
+def _job_prefix(verb: str, wait: bool) -> str:
+    """Return the `systemctl <verb>` prefix; without `wait` the job is only queued."""
+    return f"systemctl {verb} " if wait else f"systemctl --no-block {verb} "
+
+
+def _parse_unit_table(out: str) -> list[dict[str, str]]:
+    """Return `systemctl list-units --no-legend` table rows as JSON-style dicts.
+
+    Older systemd has no JSON output and prints this table regardless of `--output`.
+    """
+    rows = []
+    for line in out.splitlines():
+        # failed units are prefixed with a bullet
+        parts = line.lstrip("●* ").split(None, 4)
+        if len(parts) < 4:
+            continue
+        rows.append({"unit": parts[0], "load": parts[1], "active": parts[2], "sub": parts[3]})
+    return rows
+
+
+def _int_or_none(value: str | None) -> int | None:
+    """Return `value` as int if it is a non-empty digit string, else None."""
+    return int(value) if value and value.isdigit() else None
+
 
 class ServiceAction:
     """System service management operations."""
 
+    # syslog priority (journal PRIORITY field) -> level name
+    _PRIORITY_TO_NAME = ("emerg", "alert", "crit", "err", "warning", "notice", "info", "debug")
+
+    # properties requested from `systemctl show`; one call answers status/running/enabled
+    _show_fields = (
+        "ActiveState",
+        "SubState",
+        "LoadState",
+        "MainPID",
+        "MemoryCurrent",
+        "CPUUsageNSec",
+        "ExecMainStartTimestamp",
+        "UnitFileState",
+    )
+    _show_props = " ".join(f"-p {field}" for field in _show_fields)
+
     def __init__(self, protocol: SSHProtocol, state: RemoteState):
         """Initialize service actions.
 
@@ -33,71 +110,105 @@ class ServiceAction:
         """
         self.protocol = protocol
         self.state = state
+        self._status_cache: dict[str, ServiceStatus] = {}
+        # seconds a `systemctl list-units` result is reused by list()/list_columns()
+        self.list_cache_ttl: float = 2.0
+        # (state prefix, command) -> (time, result); the prefix covers cwd/env changes
+        self._exec_cache: dict[tuple[str, str], tuple[float, CommandResult]] = {}
+
+    def invalidate(self) -> None:
+        """Drop cached command results; called by every mutating method."""
+        self._exec_cache.clear()
+        self._status_cache.clear()
+
+    def _cached_exec(self, command: str, ttl: float) -> CommandResult:
+        """Execute `command`, reusing a successful result younger than `ttl` seconds."""
+        key = (self.state.command_prefix(), command)
+        hit = self._exec_cache.get(key)
+        now = time.monotonic()
+        if hit is not None and now - hit[0] < ttl:
+            return hit[1]
+        result = self.protocol.exec(command, self.state)
+        if result.success:
+            self._exec_cache[key] = (now, result)
+        return result
 
     def list(self) -> ServiceList:
         """Return list of services as ServiceList dataclass."""
-        out = self.protocol.exec(
-            "systemctl list-units --type=service --all --no-legend --no-pager", self.state
+        cols = self.list_columns()
+        services = [
+            ServiceStatus(
+                name=name,
+                state=state,
+                enabled=active,
+                active=active,
+                loaded=loaded,
+                pid=None,
+                memory=None,
+                cpu_percent=None,
+                uptime=None,
+            )
+            for name, state, active, loaded in zip(
+                cols.names, cols.states, cols.active, cols.loaded
+            )
+        ]
+        return ServiceList(services=services)
+
+    def list_columns(self) -> ServiceListColumns:
+        """Return services as a column-oriented ServiceListColumns dataclass.
+
+        Cheaper than `list()` when only aggregates are needed (e.g. how many
+        units are active), since no per-service objects are built.
+        """
+        out = self._cached_exec(
+            "systemctl list-units --type=service --all --no-legend --no-pager --output=json",
+            self.list_cache_ttl,
         )
         ErrorMapper.raise_if_error(out)
-        lines = out.stdout.splitlines()
-        services: list[ServiceStatus] = []
-        for line in lines:
-            if not line.strip():
-                continue
-            parts = line.split(None, 4)
-            if len(parts) < 5:
-                continue
-            name, load, active, sub, desc = parts
-            services.append(
-                ServiceStatus(
-                    name=name,
-                    state=active,
-                    enabled=(True if active.lower() == "active" else False),
-                    active=(active.lower() == "active"),
-                    loaded=(load.lower() == "loaded"),
-                    pid=None,
-                    memory=None,
-                    cpu_percent=None,
-                    uptime=None,
-                )
-            )
-        return ServiceList(services=services, count=len(services))
+        try:
+            rows = json.loads(out.stdout or "[]")
+        except json.JSONDecodeError:
+            rows = _parse_unit_table(out.stdout)
+        states = [sys.intern(row["active"]) for row in rows]
+        return ServiceListColumns(
+            names=[row["unit"] for row in rows],
+            states=states,
+            active=[state == "active" for state in states],
+            loaded=[row["load"] == "loaded" for row in rows],
+        )
 
     def status(self, service: str) -> ServiceStatus:
         """Return status for `service` as ServiceStatus dataclass."""
         out = self.protocol.run_command(
-            f"systemctl show {shlex.quote(service)} --no-page -p ActiveState -p SubState -p LoadState -p MainPID -p MemoryCurrent -p CPUUsageNSec -p ExecMainStartTimestamp",
-            self.state,
+            f"systemctl show {_safe_name(service)} --no-pager {self._show_props}", self.state
         )
+        status = self._parse_show(service, out)
+        self._status_cache[service] = status
+        return status
+
+    def probe(self, service: str) -> tuple[bool, bool, ServiceStatus]:
+        """Return `(active, enabled, status)` for `service` from one `systemctl show` read."""
+        status = self.status(service)
+        return status.active, status.enabled, status
+
+    @staticmethod
+    def _parse_show(service: str, out: str) -> ServiceStatus:
+        """Build a ServiceStatus from `systemctl show` key=value output."""
         data: dict = {}
         for line in out.splitlines():
             if "=" in line:
                 k, v = line.split("=", 1)
                 data[k] = v
-        active = data.get("ActiveState") or "unknown"
-        sub = data.get("SubState") or "unknown"
-        pid = (
-            int(data.get("MainPID"))
-            if data.get("MainPID") and data.get("MainPID").isdigit()
-            else None
-        )
-        mem = (
-            int(data.get("MemoryCurrent"))
-            if data.get("MemoryCurrent") and data.get("MemoryCurrent").isdigit()
-            else None
-        )
-        cpu_nsec = (
-            int(data.get("CPUUsageNSec"))
-            if data.get("CPUUsageNSec") and data.get("CPUUsageNSec").isdigit()
-            else None
-        )
+        active = sys.intern(data.get("ActiveState") or "unknown")
+        pid = _int_or_none(data.get("MainPID"))
+        mem = _int_or_none(data.get("MemoryCurrent"))
+        cpu_nsec = _int_or_none(data.get("CPUUsageNSec"))
         cpu_percent = (cpu_nsec / 1e9 * 100) if cpu_nsec is not None else None
         uptime = None
         return ServiceStatus(
             name=service,
             state=active,
-            enabled=False,
+            enabled=data.get("UnitFileState") in _ENABLED_SET,
             active=(active == "active"),
             loaded=(data.get("LoadState") == "loaded"),
             pid=pid,
@@ -106,52 +217,113 @@ class ServiceAction:
             uptime=uptime,
         )
 
-    def is_running(self, service: str) -> BoolResult:
-        """Return BoolResult indicating if `service` is running."""
-        try:
-            res = self.protocol.exec(f"systemctl is-active {shlex.quote(service)}", self.state)
-            running = res.stdout.strip().lower() == "active"
-            return BoolResult(key=service, result=running)
-        except Exception:
-            return BoolResult(key=service, result=False)
-
-    def is_enabled(self, service: str) -> BoolResult:
-        """Return BoolResult indicating if `service` is enabled at boot."""
-        try:
-            res = self.protocol.exec(f"systemctl is-enabled {shlex.quote(service)}", self.state)
-            enabled = res.stdout.strip().lower() in ("enabled", "static")
-            return BoolResult(key=service, result=enabled)
-        except Exception:
-            return BoolResult(key=service, result=False)
-
-    def start(self, service: str) -> ServiceStatus:
-        """Start `service` and return status."""
-        self.protocol.run_command(f"systemctl start {shlex.quote(service)}", self.state)
-        return self.status(service)
+    def is_running(self, service: str, cached: bool = False) -> BoolResult:
+        """Return BoolResult indicating if `service` is running.
 
-    def stop(self, service: str) -> ServiceStatus:
-        """Stop `service` and return status."""
-        self.protocol.run_command(f"systemctl stop {shlex.quote(service)}", self.state)
-        return self.status(service)
+        With `cached=True` the status from the last `status()` call (including
+        the one made by start/stop/restart/...) is reused instead of querying again.
+        """
+        if cached and service in self._status_cache:
+            return BoolResult(key=service, result=self._status_cache[service].active)
+        # is-active exits non-zero for inactive units; exec() reports that without raising
+        res = self.protocol.exec(f"systemctl is-active {_safe_name(service)}", self.state)
+        return BoolResult(key=service, result=res.stdout.strip() == "active")
+
+    def is_enabled(self, service: str, cached: bool = False) -> BoolResult:
+        """Return BoolResult indicating if `service` is enabled at boot.
+
+        `cached` behaves as in `is_running`.
+        """
+        if cached and service in self._status_cache:
+            return BoolResult(key=service, result=self._status_cache[service].enabled)
+        res = self.protocol.exec(f"systemctl is-enabled {_safe_name(service)}", self.state)
+        return BoolResult(key=service, result=res.stdout.strip() in _ENABLED_SET)
+
+    @overload
+    def start(self, service: str, wait: Literal[True] = ...) -> ServiceStatus: ...
+
+    @overload
+    def start(self, service: str, wait: Literal[False]) -> OperationResult: ...
+
+    @overload
+    def start(self, service: str, wait: bool) -> ServiceStatus | OperationResult: ...
+
+    def start(self, service: str, wait: bool = True) -> ServiceStatus | OperationResult:
+        """Start `service` and return status.
+
+        With `wait=False` the job is only queued (`--no-block`) and an
+        OperationResult is returned without querying the status.
+        """
+        return self._job("start", service, wait)
+
+    @overload
+    def stop(self, service: str, wait: Literal[True] = ...) -> ServiceStatus: ...
+
+    @overload
+    def stop(self, service: str, wait: Literal[False]) -> OperationResult: ...
+
+    @overload
+    def stop(self, service: str, wait: bool) -> ServiceStatus | OperationResult: ...
+
+    def stop(self, service: str, wait: bool = True) -> ServiceStatus | OperationResult:
+        """Stop `service` and return status.
+
+        With `wait=False` the job is only queued (`--no-block`) and an
+        OperationResult is returned without querying the status.
+        """
+        return self._job("stop", service, wait)
+
+    @overload
+    def restart(self, service: str, wait: Literal[True] = ...) -> ServiceStatus: ...
 
-    def restart(self, service: str) -> ServiceStatus:
-        """Restart `service` and return status."""
-        self.protocol.run_command(f"systemctl restart {shlex.quote(service)}", self.state)
+    @overload
+    def restart(self, service: str, wait: Literal[False]) -> OperationResult: ...
+
+    @overload
+    def restart(self, service: str, wait: bool) -> ServiceStatus | OperationResult: ...
+
+    def restart(self, service: str, wait: bool = True) -> ServiceStatus | OperationResult:
+        """Restart `service` and return status.
+
+        With `wait=False` the job is only queued (`--no-block`) and an
+        OperationResult is returned without querying the status.
+        """
+        return self._job("restart", service, wait)
+
+    def restart_many(self, services: List[str], wait: bool = False) -> OperationResult:
+        """Restart several services with a single systemctl invocation."""
+        if not services:
+            # `systemctl restart` with no units fails with "Too few arguments"
+            return OperationResult(success=True, message=None)
+        names = " ".join(map(_safe_name, services))
+        self.protocol.run_command(_job_prefix("restart", wait) + names, self.state)
+        self.invalidate()
+        return OperationResult(success=True, message=None)
+
+    def _job(self, verb: str, service: str, wait: bool) -> ServiceStatus | OperationResult:
+        """Run a start/stop/restart job, optionally without waiting for it."""
+        self.protocol.run_command(_job_prefix(verb, wait) + _safe_name(service), self.state)
+        self.invalidate()
+        if not wait:
+            return OperationResult(success=True, message=None)
         return self.status(service)
 
     def reload(self, service: str) -> ServiceStatus:
         """Reload `service` configuration and return status."""
-        self.protocol.run_command(f"systemctl reload {shlex.quote(service)}", self.state)
+        self.protocol.run_command(_CMD_RELOAD + _safe_name(service), self.state)
+        self.invalidate()
         return self.status(service)
 
     def enable(self, service: str) -> ServiceStatus:
         """Enable `service` at boot and return status."""
-        self.protocol.run_command(f"systemctl enable {shlex.quote(service)}", self.state)
+        self.protocol.run_command(_CMD_ENABLE + _safe_name(service), self.state)
+        self.invalidate()
         return self.status(service)
 
     def disable(self, service: str) -> ServiceStatus:
         """Disable `service` at boot and return status."""
-        self.protocol.run_command(f"systemctl disable {shlex.quote(service)}", self.state)
+        self.protocol.run_command(_CMD_DISABLE + _safe_name(service), self.state)
+        self.invalidate()
         return self.status(service)
 
     def logs(self, service: str, lines: int = 100, follow: bool = False) -> ServiceLogList:
@@ -159,43 +331,44 @@ class ServiceAction:
         if follow:
             raise NotImplementedError("Follow streaming logs is not supported in this API")
         out = self.protocol.run_command(
-            f"journalctl -u {shlex.quote(service)} -n {int(lines)} --no-pager --output=short",
+            f"journalctl -u {_safe_name(service)} -n {int(lines)} --no-pager --output=json",
             self.state,
         )
         logs: list[ServiceLog] = []
         for line in out.splitlines():
-            # Very lax parsing: try to split timestamp and message
             if not line.strip():
                 continue
-            ts = None
-            msg = line
-            try:
-                # journalctl short output often starts with 'Jan 01 00:00:00 hostname unit[pid]: message'
-                parts = line.split(None, 4)
-                # last part is message
-                msg = parts[-1]
-                ts = datetime.now()
-            except Exception:
-                pass
+            entry = json.loads(line)
+            msg = entry.get("MESSAGE") or ""
+            if isinstance(msg, list):
+                # non-UTF-8 messages are emitted as byte arrays
+                msg = bytes(msg).decode("utf-8", errors="replace")
+            priority = entry.get("PRIORITY", "6")
             logs.append(
-                ServiceLog(timestamp=ts or datetime.now(), level="info", message=msg, unit=service)
+                ServiceLog(
+                    timestamp=datetime.fromtimestamp(int(entry["__REALTIME_TIMESTAMP"]) / 1e6),
+                    level=self._PRIORITY_TO_NAME[int(priority)] if priority.isdigit() else "info",
+                    message=msg,
+                    unit=entry.get("_SYSTEMD_UNIT") or service,
+                )
             )
-        return ServiceLogList(service=service, logs=logs, count=len(logs))
+        return ServiceLogList(service=service, logs=logs)
 
     def get_config(self, service: str) -> ServiceConfig:
         """Return service configuration content as ServiceConfig dataclass."""
-        out = self.protocol.run_command(f"systemctl cat {shlex.quote(service)}", self.state)
-        path = f"/etc/systemd/system/{service}.service"
+        out = self.protocol.run_command(f"systemctl cat {_safe_name(service)}", self.state)
+        path = f"/etc/systemd/system/{_valid_name(service)}.service"
         valid = True
         return ServiceConfig(name=service, path=path, content=out, valid=valid)
 
     def edit_config(self, service: str, content: str) -> OperationResult:
         """Replace `service` config with `content` and reload systemd."""
-        path = f"/etc/systemd/system/{service}.service"
+        path = f"/etc/systemd/system/{_valid_name(service)}.service"
         escaped = content.replace("'", "'\"'\"'")
         try:
             self.protocol.run_command(f"printf '%s' '{escaped}' > {shlex.quote(path)}", self.state)
             self.protocol.run_command("systemctl daemon-reload", self.state)
+            self.invalidate()
             return OperationResult(success=True, message=None)
         except Exception as e:
             return OperationResult(success=False, message=str(e))
@@ -203,13 +376,25 @@ class ServiceAction:
     def validate_config(self, service: str) -> OperationResult:
         """Validate `service` configuration; return OperationResult."""
         # systemd provides 'systemd-analyze verify' for unit files
-        path = f"/etc/systemd/system/{service}.service"
+        path = f"/etc/systemd/system/{_valid_name(service)}.service"
         try:
             self.protocol.run_command(f"systemd-analyze verify {shlex.quote(path)}", self.state)
             return OperationResult(success=True, message=None)
         except Exception as e:
             return OperationResult(success=False, message=str(e))
 
+    async def validate_config_async(self, service: str) -> OperationResult:
+        """Awaitable `validate_config`, run in a worker thread.
+
+        Paramiko multiplexes each command on its own channel of the shared
+        transport, so several validations can be awaited concurrently.
+        """
+        return await asyncio.to_thread(self.validate_config, service)
+
+    async def validate_many(self, services: list[str]) -> list[OperationResult]:
+        """Validate several services concurrently; results follow `services` order."""
+        return list(await asyncio.gather(*(self.validate_config_async(s) for s in services)))
+
     def get_pid(self, service: str) -> IDResult:
         """Return PID of `service` or None if not running as IDResult."""
         st = self.status(service)
@@ -217,55 +402,46 @@ class ServiceAction:
 
     def get_port(self, service: str) -> IDResult:
         """Attempt to discover listening port for `service` and return as IDResult."""
-        # try ss to find process owning sockets and extract port; best-effort
-        try:
-            out = self.protocol.run_command("ss -tulnp", self.state)
-            for line in out.splitlines():
-                if service in line or f"/{service}" in line:
-                    parts = line.split()
-                    # Local address is usually in column 4
-                    if len(parts) >= 4:
-                        addr = parts[3]
-                        if ":" in addr:
-                            try:
-                                port = int(addr.rsplit(":", 1)[1])
-                                return IDResult(key=service, id=port)
-                            except Exception:
-                                continue
-        except Exception:
-            pass
-        return IDResult(key=service, id=None)
+        # resolve the main PID first, then let awk pick the first socket it owns
+        pid = self.status(service).pid
+        if not pid:
+            return IDResult(key=service, id=None)
+        out = self.protocol.exec(
+            f"ss -H -tulnp | awk '/pid={pid},/ {{print $5; exit}}'", self.state
+        )
+        addr = out.stdout.strip()
+        if ":" not in addr:
+            return IDResult(key=service, id=None)
+        port = addr.rsplit(":", 1)[1]
+        return IDResult(key=service, id=int(port) if port.isdigit() else None)
 
     def mask(self, service: str) -> ServiceStatus:
         """Mask `service` to prevent it starting and return status."""
-        self.protocol.run_command(f"systemctl mask {shlex.quote(service)}", self.state)
+        self.protocol.run_command(_CMD_MASK + _safe_name(service), self.state)
+        self.invalidate()
         return self.status(service)
 
     def unmask(self, service: str) -> ServiceStatus:
         """Unmask `service` and return status."""
-        self.protocol.run_command(f"systemctl unmask {shlex.quote(service)}", self.state)
+        self.protocol.run_command(_CMD_UNMASK + _safe_name(service), self.state)
+        self.invalidate()
         return self.status(service)
 
     def dependencies(self, service: str) -> ServiceDependencies:
         """Get service dependencies (requires/systemd) and return ServiceDependencies."""
         out = self.protocol.run_command(
-            f"systemctl list-dependencies {shlex.quote(service)} --no-pager", self.state
+            f"systemctl list-dependencies {_safe_name(service)} --no-pager", self.state
         )
         dependencies: list[ServiceDependency] = []
         dependents: list[str] = []
-        for line in out.splitlines():
-            line = line.strip()
-            if not line:
-                continue
-            # lines include hierarchical glyphs; we just take service names
-            if line.endswith(".service"):
-                # choose whether this is a dependency or dependent based on indentation
-                if line.startswith("\u2502") or line.startswith(" "):
-                    dependencies.append(
-                        ServiceDependency(name=line, type="Requires", is_satisfied=True)
-                    )
-                else:
-                    dependents.append(line)
+        for m in _DEPS_RE.finditer(out):
+            # indented (tree glyph) entries are dependencies; top-level ones are not
+            if m["indent"].strip():
+                dependencies.append(
+                    ServiceDependency(name=m["name"], type="Requires", is_satisfied=True)
+                )
+            else:
+                dependents.append(m["name"])
         return ServiceDependencies(
             service=service, dependencies=dependencies, dependents=dependents
         )
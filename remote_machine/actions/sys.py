@@ -2,9 +2,14 @@
 
 from __future__ import annotations
 
-from typing import List
+import asyncio
+import re
+import shlex
+import time
+from typing import Any, Callable, List, TypeVar
 from datetime import datetime, timedelta
 
+from remote_machine.errors.error_mapper import ErrorMapper
 from remote_machine.models.remote_state import RemoteState
 from remote_machine.protocols.ssh import SSHProtocol
 from remote_machine.models.system_types import (
@@ -18,11 +23,215 @@ from remote_machine.models.system_types import (
     SystemInfo,
 )
 
-from linux_parsers.parsers.system.proc_uptime import parse_proc_uptime_file
-from linux_parsers.parsers.system.etc_os_release import parse_etc_os_release_file
-from linux_parsers.parsers.system.free import parse_free_btlv
-from linux_parsers.parsers.system.proc_cpuinfo import parse_proc_cpuinfo_file
-from linux_parsers.parsers.session.who import parse_who_a
+T = TypeVar("T")
+
+
+_HOSTNAME_CMD = "cat /proc/sys/kernel/hostname"
+
+# fields come out in this fixed order; only the kernel version may contain spaces
+_UNAME_CMD = "uname -snrvm"
+
+
+def _parse_uname(out: str) -> UnameInfo:
+    """Build UnameInfo from `uname -snrvm` output."""
+    head = out.strip().split(None, 3) + [""] * 4
+    version, _, machine = head[3].rpartition(" ")
+    return UnameInfo(
+        sysname=head[0],
+        nodename=head[1],
+        release=head[2],
+        version=version,
+        machine=machine,
+    )
+
+
+def _uptime_seconds(out: str) -> float:
+    """Return the uptime in seconds from /proc/uptime content ("<uptime> <idle>")."""
+    head = out.split(None, 1)
+    return float(head[0]) if head else 0.0
+
+
+def _uptime_info(seconds: float) -> UptimeInfo:
+    """Build UptimeInfo for an uptime of `seconds`."""
+    uptime_delta = timedelta(seconds=seconds)
+    days, rem = divmod(int(seconds), 86400)
+    hours, rem = divmod(rem, 3600)
+    return UptimeInfo(
+        uptime=uptime_delta,
+        boot_time=datetime.now() - uptime_delta,
+        seconds=seconds,
+        days=days,
+        hours=hours,
+        minutes=rem // 60,
+    )
+
+
+def _parse_uptime(out: str) -> UptimeInfo:
+    """Build UptimeInfo from /proc/uptime content."""
+    return _uptime_info(_uptime_seconds(out))
+
+
+# `who` line: user tty YYYY-MM-DD HH:MM [(host)]
+_WHO_RE = re.compile(r"^(\S+)\s+(\S+)\s+(\d{4})-(\d{2})-(\d{2})\s+(\d{2}):(\d{2})(?:.*\((.*)\))?")
+
+
+def _os_release_fields(out: str) -> dict[str, str]:
+    """Return KEY -> value from /etc/os-release content, skipping blanks and comments."""
+    fields = {}
+    for line in out.splitlines():
+        key, sep, value = line.partition("=")
+        if not sep or key.startswith("#"):
+            continue
+        fields[key.strip()] = value.strip().strip("\"'")
+    return fields
+
+
+def _parse_os_release(out: str) -> OSRelease:
+    """Build OSRelease from /etc/os-release content."""
+    fields = _os_release_fields(out)
+    get = fields.get
+    name = get("NAME") or ""
+    # empty values count as unset; the URL/ID_LIKE fields are optional
+    return OSRelease(
+        name=name,
+        version=get("VERSION") or "",
+        version_id=get("VERSION_ID") or "",
+        pretty_name=get("PRETTY_NAME") or name,
+        id=get("ID") or "",
+        id_like=get("ID_LIKE") or None,
+        home_url=get("HOME_URL") or None,
+        bug_report_url=get("BUG_REPORT_URL") or None,
+        support_url=get("SUPPORT_URL") or None,
+    )
+
+
+_UNITS = ("B", "KB", "MB", "GB", "TB", "PB")
+
+
+def _human(n: int) -> str:
+    """Format a byte count with a binary unit, truncating (e.g. 1536 -> '1KB')."""
+    i = min(len(_UNITS) - 1, max(0, (n.bit_length() - 1) // 10))
+    return f"{n >> (i * 10)}{_UNITS[i]}"
+
+
+# `free -b` row: label, then total used free [shared buff/cache available]
+_FREE_RE = re.compile(
+    r"^(Mem|Swap):\s+(\d+)(?:\s+(\d+))?(?:\s+(\d+))?(?:\s+(\d+))?(?:\s+(\d+))?(?:\s+(\d+))?",
+    re.MULTILINE,
+)
+_FREE_COLUMNS = ("total", "used", "free", "shared", "cache", "available")
+
+
+def _parse_memory(out: str) -> MemoryInfo:
+    """Build MemoryInfo from `free -btlv` output."""
+    data: dict[str, dict[str, str]] = {"Mem": {}, "Swap": {}}
+    for m in _FREE_RE.finditer(out):
+        label, *nums = m.groups()
+        data[label].update((k, n) for k, n in zip(_FREE_COLUMNS, nums) if n)
+
+    mem = data["Mem"]
+    swap = data["Swap"]
+
+    total = int(mem.get("total") or 0)
+    used = int(mem.get("used") or 0)
+    free = int(mem.get("free") or 0)
+    available = int(mem.get("available") or 0)
+    buffers = int(mem.get("cache") or 0)
+    cached = 0  # not provided separately by `free -btlv`
+
+    swap_total = int(swap.get("total") or 0)
+    swap_used = int(swap.get("used") or 0)
+
+    percent = (used / total * 100.0) if total else 0.0
+    swap_free = swap_total - swap_used
+    swap_percent = (swap_used / swap_total * 100.0) if swap_total else 0.0
+
+    return MemoryInfo(
+        total=total,
+        available=available,
+        used=used,
+        free=free,
+        percent=percent,
+        buffers=buffers,
+        cached=cached,
+        swap_total=swap_total,
+        swap_used=swap_used,
+        swap_free=swap_free,
+        swap_percent=swap_percent,
+        human_total=_human(total),
+        human_available=_human(available),
+        human_used=_human(used),
+    )
+
+
+def _cpuinfo_fields(block: str) -> dict[str, str]:
+    """Return lower-cased key -> value for one /proc/cpuinfo processor block."""
+    fields = {}
+    for line in block.splitlines():
+        key, sep, value = line.partition(":")
+        if sep:
+            fields[key.rstrip().lower()] = value.strip()
+    return fields
+
+
+_PROCESSOR_RE = re.compile(r"^processor\s*:", re.MULTILINE)
+
+
+def _parse_cpuinfo(out: str) -> List[CPUInfo]:
+    """Build per-CPU CPUInfo entries from /proc/cpuinfo content."""
+    # blank lines separate processors; keys are lower-cased ("cpu MHz" -> "cpu mhz")
+    processors = [_cpuinfo_fields(block) for block in out.split("\n\n") if block.strip()]
+
+    cpu_infos: List[CPUInfo] = []
+
+    total_threads = len(processors)
+    # every processor usually lists the same flags; split each distinct line once
+    split_flags: dict[str, list[str]] = {}
+
+    for cpu in processors:
+        flags = cpu.get("flags", "")
+        if flags not in split_flags:
+            split_flags[flags] = flags.split()
+
+        cpu_infos.append(
+            CPUInfo(
+                processor=cpu.get("processor", "0"),
+                vendor_id=cpu.get("vendor_id", ""),
+                model_name=cpu.get("model name", ""),
+                cores=int(cpu.get("cpu cores", cpu.get("cores", "1"))),
+                threads=total_threads,
+                cpu_mhz=float(cpu.get("cpu mhz", cpu.get("mhz", "0"))),
+                l1_cache=cpu.get("l1 cache", ""),
+                l2_cache=cpu.get("l2 cache", ""),
+                l3_cache=cpu.get("cache size", ""),
+                stepping=int(cpu["stepping"]) if cpu.get("stepping", "").isdigit() else None,
+                flags=list(split_flags[flags]),
+            )
+        )
+
+    return cpu_infos
+
+
+def _parse_loadavg(out: str) -> LoadAverage:
+    """Build LoadAverage from /proc/loadavg content ("0.10 0.05 0.01 2/100 12345")."""
+    try:
+        one, five, fifteen, running_total, _ = out.split()
+        running, _, total = running_total.partition("/")
+        values = float(one), float(five), float(fifteen), int(running), int(total)
+    except ValueError:
+        values = 0.0, 0.0, 0.0, 0, 0
+    return LoadAverage(*values)
+
+
+# sections of the batched `info()` script, in output order
+_INFO_SECTIONS = (
+    ("os_release", "cat /etc/os-release"),
+    ("uname", _UNAME_CMD),
+    ("uptime", "cat /proc/uptime"),
+    ("cpuinfo", "cat /proc/cpuinfo"),
+    ("free", "free -btlv"),
+    ("loadavg", "cat /proc/loadavg"),
+)
 
 
 class SYSAction:
@@ -37,6 +246,28 @@ class SYSAction:
         """
         self.protocol = protocol
         self.state = state
+        # facts that don't change while the host is up (uname, os-release, CPUs)
+        self._cache: dict[str, Any] = {}
+
+    def _cached(self, key: str, fn: Callable[[], T]) -> T:
+        """Return the memoized value for `key`, computing it with `fn` on first use."""
+        if key not in self._cache:
+            self._cache[key] = fn()
+        return self._cache[key]
+
+    def _cached_for(self, key: str, max_age: float, fn: Callable[[], T]) -> T:
+        """Return the value cached under `key` if younger than `max_age` seconds."""
+        hit = self._cache.get(key)
+        now = time.monotonic()
+        if hit is not None and now - hit[0] < max_age:
+            return hit[1]
+        value = fn()
+        self._cache[key] = (now, value)
+        return value
+
+    def invalidate_cache(self) -> None:
+        """Forget memoized system facts (e.g. after a reboot or reconnect)."""
+        self._cache.clear()
 
     def _run(self, command: str):
         """Run a command and raise mapped errors if it fails."""
@@ -44,200 +275,162 @@ class SYSAction:
         ErrorMapper.raise_if_error(result)
         return result.stdout
 
+    def _run_many(self, commands: list[str]) -> list[str]:
+        """Run `commands` in a single SSH exec and return each command's stdout.
+
+        The commands are submitted to the protocol and reaped with one `drain`,
+        so N commands cost one round-trip instead of N. A command that fails
+        raises its mapped error, as `_run` does.
+        """
+        futures = [self.protocol.submit(cmd, self.state) for cmd in commands]
+        self.protocol.drain()
+        results = [f.result() for f in futures]
+        for result in results:
+            ErrorMapper.raise_if_error(result)
+        return [result.stdout for result in results]
+
     def info(self) -> SystemInfo:
-        """Get a consolidated system information dataclass."""
+        """Get a consolidated system information dataclass.
+
+        All underlying reads run as one remote script (a single round-trip)
+        and each section is fed to the same parser the individual methods use.
+        """
+        outputs = self._run_many([cmd for _, cmd in _INFO_SECTIONS])
+        sections = dict(zip((name for name, _ in _INFO_SECTIONS), outputs))
+        uname = _parse_uname(sections.get("uname", ""))
+        cpuinfo_raw = sections.get("cpuinfo", "")
+        cpu_info = _parse_cpuinfo(cpuinfo_raw)
+        os_release = _parse_os_release(sections.get("os_release", ""))
+        # seed the memo so later cpu_info()/uname()/os_release() reuse this read
+        self._cache.update(
+            uname=uname,
+            cpuinfo_raw=cpuinfo_raw,
+            cpu_info=cpu_info,
+            os_release=os_release,
+        )
         return SystemInfo(
-            hostname=self.hostname(),
-            os_release=self.os_release(),
-            uname=self.uname(),
-            uptime=self.uptime(),
-            kernel_version=self.kernel_version(),
-            cpu_info=self.cpu_info(),
-            memory_info=self.memory_info(),
-            load_average=self.load_average(),
+            hostname=uname.nodename,
+            os_release=os_release,
+            uname=uname,
+            uptime=_parse_uptime(sections.get("uptime", "")),
+            kernel_version=uname.release,
+            cpu_info=cpu_info,
+            memory_info=_parse_memory(sections.get("free", "")),
+            load_average=_parse_loadavg(sections.get("loadavg", "")),
         )
 
+    async def info_async(self) -> SystemInfo:
+        """Awaitable `info`, run in a worker thread.
+
+        `info` is already a single round-trip, so fanning its sections out
+        would only add channels; instead several hosts' `info_async` calls
+        can be gathered concurrently.
+        """
+        return await asyncio.to_thread(self.info)
+
     def uname(self) -> UnameInfo:
         """Get system name and information as a dataclass."""
-        sysname = self.protocol.run_command("uname -s", self.state)
-        nodename = self.protocol.run_command("uname -n", self.state)
-        release = self.protocol.run_command("uname -r", self.state)
-        version = self.protocol.run_command("uname -v", self.state)
-        machine = self.protocol.run_command("uname -m", self.state)
-
-        return UnameInfo(
-            sysname=sysname,
-            nodename=nodename,
-            release=release,
-            version=version,
-            machine=machine,
-        )
+        return self._cached("uname", lambda: _parse_uname(self._run(_UNAME_CMD)))
 
-    def uptime(self) -> UptimeInfo:
-        """Get system uptime using /proc/uptime parser."""
-        out = self.protocol.run_command("cat /proc/uptime", self.state)
-
-        parsed = parse_proc_uptime_file(out)
-
-        if parsed and "uptime" in parsed:
-            seconds = float(parsed["uptime"])
-        else:
-            # Fallback: first value in /proc/uptime
-            parts = out.split()
-            seconds = float(parts[0]) if parts else 0.0
-
-        uptime_delta = timedelta(seconds=int(seconds))
-        return UptimeInfo(
-            uptime=uptime_delta,
-            boot_time=datetime.now() - uptime_delta,
-            seconds=seconds,
-            days=int(seconds // 86400),
-            hours=int((seconds % 86400) // 3600),
-            minutes=int((seconds % 3600) // 60),
-        )
+    def uptime(self, max_age: float = 1.0) -> UptimeInfo:
+        """Get system uptime using /proc/uptime parser.
+
+        Within `max_age` seconds of the last read the uptime is advanced from
+        that reading locally instead of reading /proc/uptime again.
+        """
+        now = time.monotonic()
+        hit = self._cache.get("uptime")
+        if hit is None or now - hit[0] >= max_age:
+            seconds = _uptime_seconds(self._run("cat /proc/uptime"))
+            hit = self._cache["uptime"] = (now, seconds)
+        return _uptime_info(hit[1] + (now - hit[0]))
 
     def hostname(self) -> str:
-        """Get system hostname."""
-        return self.protocol.run_command("hostname", self.state)
+        """Get system hostname (a kernel file read; no process is spawned remotely)."""
+        if "uname" in self._cache:
+            return self._cache["uname"].nodename
+        return self._cached("hostname", lambda: self._run(_HOSTNAME_CMD).strip())
 
     def set_hostname(self, hostname: str) -> None:
         """Set system hostname."""
         self.protocol.run_command(f"hostname {hostname}", self.state)
+        self._cache.pop("hostname", None)
+        self._cache.pop("uname", None)
 
     def kernel_version(self) -> str:
         """Get kernel version string."""
-        return self.protocol.run_command("uname -r", self.state)
+        if "uname" in self._cache:
+            return self._cache["uname"].release
+        return self._cached("kernel_version", lambda: self._run("uname -r").strip())
 
     def os_release(self) -> OSRelease:
         """Parse /etc/os-release."""
-        out = self.protocol.run_command("cat /etc/os-release", self.state)
-        data = parse_etc_os_release_file(out)
-
-        return OSRelease(
-            name=data.get("NAME", ""),
-            version=data.get("VERSION", ""),
-            version_id=data.get("VERSION_ID", ""),
-            pretty_name=data.get("PRETTY_NAME", data.get("NAME", "")),
-            id=data.get("ID", ""),
-            id_like=data.get("ID_LIKE"),
-            home_url=data.get("HOME_URL"),
-            bug_report_url=data.get("BUG_REPORT_URL"),
-            support_url=data.get("SUPPORT_URL"),
+        return self._cached(
+            "os_release",
+            lambda: _parse_os_release(self._run("cat /etc/os-release")),
         )
 
-    def memory_info(self) -> MemoryInfo:
-        """Parse memory info from `free -btlv`."""
-        out = self.protocol.run_command("free -btlv", self.state)
-        data = parse_free_btlv(out)
-
-        mem = data.get("Mem", {})
-        swap = data.get("Swap", {})
-
-        total = int(mem.get("total") or 0)
-        used = int(mem.get("used") or 0)
-        free = int(mem.get("free") or 0)
-        available = int(mem.get("available") or 0)
-        buffers = int(mem.get("cache") or 0)
-        cached = 0  # not provided separately by `free -btlv`
-
-        swap_total = int(swap.get("total") or 0)
-        swap_used = int(swap.get("used") or 0)
-
-        percent = (used / total * 100.0) if total else 0.0
-        swap_free = swap_total - swap_used
-        swap_percent = (swap_used / swap_total * 100.0) if swap_total else 0.0
-
-        def human(n: int) -> str:
-            for unit in ("B", "KB", "MB", "GB", "TB"):
-                if n < 1024:
-                    return f"{n}{unit}"
-                n //= 1024
-            return f"{n}PB"
-
-        return MemoryInfo(
-            total=total,
-            available=available,
-            used=used,
-            free=free,
-            percent=percent,
-            buffers=buffers,
-            cached=cached,
-            swap_total=swap_total,
-            swap_used=swap_used,
-            swap_free=swap_free,
-            swap_percent=swap_percent,
-            human_total=human(total),
-            human_available=human(available),
-            human_used=human(used),
-        )
+    def memory_info(self, max_age: float = 1.0) -> MemoryInfo:
+        """Parse memory info from `free -btlv`.
 
-    def cpu_info(self) -> List[CPUInfo]:
-        """Parse /proc/cpuinfo and return per-CPU info."""
-        processors = parse_proc_cpuinfo_file(
-            self.protocol.run_command("cat /proc/cpuinfo"), self.state
+        Results younger than `max_age` seconds are reused; pass 0 to force a read.
+        """
+        return self._cached_for(
+            "memory_info",
+            max_age,
+            lambda: _parse_memory(self._run("free -btlv")),
         )
 
-        cpu_infos: List[CPUInfo] = []
-
-        total_threads = len(processors)
-
-        for cpu in processors:
-
-            cpu_infos.append(
-                CPUInfo(
-                    processor=cpu.get("processor", "0"),
-                    vendor_id=cpu.get("vendor_id", ""),
-                    model_name=cpu.get("model name", ""),
-                    cores=int(cpu.get("cpu cores", cpu.get("cores", "1"))),
-                    threads=total_threads,
-                    cpu_mhz=float(cpu.get("cpu mhz", cpu.get("mhz", "0"))),
-                    l1_cache=cpu.get("l1 cache", ""),
-                    l2_cache=cpu.get("l2 cache", ""),
-                    l3_cache=cpu.get("cache size", ""),
-                    stepping=int(cpu["stepping"]) if cpu.get("stepping", "").isdigit() else None,
-                    flags=cpu.get("flags", "").split(),
-                )
-            )
+    def _proc_cpuinfo_raw(self) -> str:
+        """Return /proc/cpuinfo content, fetched at most once per cache lifetime."""
+        return self._cached("cpuinfo_raw", lambda: self._run("cat /proc/cpuinfo"))
 
-        return cpu_infos
+    def cpu_info(self) -> List[CPUInfo]:
+        """Parse /proc/cpuinfo and return per-CPU info."""
+        return self._cached("cpu_info", lambda: _parse_cpuinfo(self._proc_cpuinfo_raw()))
 
     def cpu_count(self) -> int:
         """Return the number of logical CPU threads."""
-        out = self.protocol.run_command("cat /proc/cpuinfo", self.state)
-        return out.count("processor\t:") or out.count("processor :") or out.count("processor")
-
-    def load_average(self) -> LoadAverage:
-        out = self.protocol.run_command("cat /proc/loadavg", self.state)
-
-        parts = out.split()
-        running_total = parts[3] if len(parts) > 3 else "0/0"
-        running, total = running_total.split("/") if "/" in running_total else ("0", "0")
-
-        return LoadAverage(
-            one_minute=float(parts[0]) if len(parts) > 0 else 0.0,
-            five_minutes=float(parts[1]) if len(parts) > 1 else 0.0,
-            fifteen_minutes=float(parts[2]) if len(parts) > 2 else 0.0,
-            running_processes=int(running),
-            total_processes=int(total),
+
+        def count() -> int:
+            # reuse /proc/cpuinfo if cpu_info()/info() already fetched it
+            if "cpuinfo_raw" not in self._cache:
+                res = self.protocol.exec("nproc --all", self.state)
+                if res.success and res.stdout.strip().isdigit():
+                    return int(res.stdout)
+            return len(_PROCESSOR_RE.findall(self._proc_cpuinfo_raw()))
+
+        return self._cached("cpu_count", count)
+
+    def load_average(self, max_age: float = 1.0) -> LoadAverage:
+        """Parse /proc/loadavg; results younger than `max_age` seconds are reused."""
+        return self._cached_for(
+            "load_average",
+            max_age,
+            lambda: _parse_loadavg(self._run("cat /proc/loadavg")),
         )
 
     def timezone(self) -> str:
-        """Get system timezone via timedatectl or /etc/localtime link (best-effort)."""
-        try:
-            out = self.protocol.run_command("timedatectl show -p Timezone --value", self.state)
-            if out:
-                return out
-        except Exception:
-            pass
-
-        # fallback to readlink /etc/localtime
-        try:
-            out = self.protocol.run_command("readlink -f /etc/localtime", self.state)
-            parts = out.split("zoneinfo/")
-            if len(parts) == 2:
-                return parts[1]
-        except Exception:
-            pass
+        """Get system timezone via /etc/timezone, /etc/localtime or timedatectl (best-effort).
+
+        Sources are tried cheapest first and the result is memoized.
+        """
+        return self._cached("timezone", self._read_timezone)
+
+    def _read_timezone(self) -> str:
+        res = self.protocol.exec("cat /etc/timezone", self.state)
+        if res.success and res.stdout.strip():
+            return res.stdout.strip()
+
+        res = self.protocol.exec("readlink -f /etc/localtime", self.state)
+        idx = res.stdout.rfind("zoneinfo/")
+        if res.success and idx != -1:
+            return res.stdout[idx + len("zoneinfo/") :].strip()
+
+        # last resort: timedatectl spins up a D-Bus round-trip on the remote side
+        res = self.protocol.exec("timedatectl show -p Timezone --value", self.state)
+        if res.success:
+            return res.stdout.strip()
 
         return ""
 
@@ -245,36 +438,49 @@ class SYSAction:
         """Reboot the system (uses shutdown command with +delay)."""
         cmd = "reboot" if delay == 0 else f"shutdown -r +{int(delay // 60)}"
         self.protocol.run_command(cmd, self.state)
+        # facts may differ after the host comes back (kernel, hostname)
+        self.invalidate_cache()
 
     def shutdown(self, delay: int = 0) -> None:
         """Shutdown the system (uses shutdown command with +delay)."""
         cmd = "shutdown -h now" if delay == 0 else f"shutdown -h +{int(delay // 60)}"
         self.protocol.run_command(cmd, self.state)
+        self.invalidate_cache()
 
-    def dmesg(self, lines: int = 100) -> str:
-        """Return the last `lines` of kernel messages (best-effort)."""
-        out = self.protocol.run_command(f"dmesg --color=never | tail -n {int(lines)}", self.state)
-        return out
+    def dmesg(self, lines: int = 100, max_bytes: int | None = None) -> str:
+        """Return the last `lines` of kernel messages (best-effort).
+
+        `max_bytes` additionally caps the transfer to the newest bytes of those lines.
+        """
+        cmd = f"dmesg --color=never | tail -n {int(lines)}"
+        if max_bytes is not None:
+            cmd += f" | tail -c {int(max_bytes)}"
+        return self.protocol.run_command(cmd, self.state)
 
     def logged_in_users(self) -> List[UserInfo]:
-        """Get currently logged in users using `who -a`."""
-        parsed = parse_who_a(self.protocol.run_command("who -a"), self.state)
+        """Get currently logged in users using `who`."""
+        out = self.protocol.run_command("who", self.state)
 
         users: List[UserInfo] = []
 
-        for record in parsed.get("users_records", []):
-            try:
-                login_time = datetime.strptime(
-                    f"{record['date']} {record['time']}", "%Y-%m-%d %H:%M"
-                )
-            except Exception:
+        for line in out.splitlines():
+            m = _WHO_RE.match(line)
+            if m:
+                username, tty, year, month, day, hour, minute, host = m.groups()
+                login_time = datetime(int(year), int(month), int(day), int(hour), int(minute))
+            else:
+                # non-ISO time format (e.g. C locale): keep user/tty, time unknown
+                parts = line.split()
+                if len(parts) < 2:
+                    continue
+                username, tty, host = parts[0], parts[1], None
                 login_time = datetime.now()
 
             users.append(
                 UserInfo(
-                    username=record.get("event", ""),
-                    tty=record.get("tty", ""),
-                    hostname=record.get("from", ""),
+                    username=username,
+                    tty=tty,
+                    hostname=host or "",
                     login_time=login_time,
                     idle_time=None,
                 )
@@ -282,10 +488,9 @@ class SYSAction:
 
         return users
 
-    def last_login(self, username: str | None = None) -> List:
-        """Return last login history via `last` (not fully parsed)."""
-        cmd = "last -w" + (f" {username}" if username else "")
-        out = self.protocol.run_command(cmd, self.state)
-        # returning raw lines for now
-        lines = [l for l in out.splitlines() if l and not l.startswith("wtmp")]
-        return lines
+    def last_login(self, username: str | None = None, limit: int = 100) -> List:
+        """Return up to `limit` raw lines of login history via `last` (not fully parsed)."""
+        cmd = f"last -w -n {int(limit)}" + (f" {shlex.quote(username)}" if username else "")
+        # drop the trailing "wtmp begins ..." footer and blank lines remotely
+        out = self.protocol.run_command(f"{cmd} | sed -e '/^wtmp/d' -e '/^$/d'", self.state)
+        return out.splitlines()
@@ -25,6 +25,23 @@ class RemoteMachine:
 
     parent: Optional["RemoteMachine"] = None
 
+    # action attribute -> class, built on first access with the current ssh layer
+    _ACTION_CLASSES = {
+        "fs": actions.FSAction,
+        "ps": actions.PSAction,
+        "net": actions.NETAction,
+        "env": actions.ENVAction,
+        "sys": actions.SYSAction,
+        "service": actions.ServiceAction,
+        "device": actions.DeviceAction,
+        "docker": actions.DockerAction,
+        "git": actions.GitAction,
+        "firewall": actions.FirewallAction,
+        "cron": actions.CronAction,
+        "python": actions.PythonAction,
+        "onie": actions.ONIEAction,
+    }
+
     def __init__(
         self,
         host: str,
@@ -44,22 +61,18 @@ class RemoteMachine:
 
         self.state = RemoteState()
 
-        # Actions
-        self.fs = actions.FSAction(ssh, self.state)
-        self.ps = actions.PSAction(ssh, self.state)
-        self.net = actions.NETAction(ssh, self.state)
-        self.env = actions.ENVAction(ssh, self.state)
-        self.sys = actions.SYSAction(ssh, self.state)
-        self.service = actions.ServiceAction(ssh, self.state)
-        self.device = actions.DeviceAction(ssh, self.state)
-        self.docker = actions.DockerAction(ssh, self.state)
-        self.git = actions.GitAction(ssh, self.state)
-        self.firewall = actions.FirewallAction(ssh, self.state)
-        self.cron = actions.CronAction(ssh, self.state)
-        self.python = actions.PythonAction(ssh, self.state)
-        self.onie = actions.ONIEAction(ssh, self.state)
+        # Actions (fs, ps, ... are built on first access, see __getattr__)
         self.proxy = actions.ProxyAction(self)
 
+    def __getattr__(self, name: str) -> Any:
+        """Instantiate action attributes (fs, ps, sys, ...) lazily."""
+        cls = self._ACTION_CLASSES.get(name)
+        if cls is None:
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+        action = cls(self._protocols["ssh"], self.state)
+        setattr(self, name, action)
+        return action
+
     def connection_layer(self, layer_index: int = -1) -> SSHProtocol:
         """Return SSHProtocol at a specific layer (supports multi-hop)."""
         return self._ssh_layers[layer_index]
@@ -89,6 +102,8 @@ class RemoteMachine:
         # Stop all proxies
         for proxy in self.state.proxies:
             proxy.running = False
+        if "scp" in self._protocols:
+            self._protocols["scp"].close()
         # Disconnect all SSH layers
         for ssh in self._ssh_layers:
             ssh.disconnect()
@@ -132,17 +147,15 @@ class RemoteMachine:
         """Populate RemoteState fields (cwd, uid, sudo)."""
         ssh: SSHProtocol = self._protocols["ssh"]
 
-        # UID
-        result = ssh.exec("id -u", self.state)
-        self.state.uid = int(result.stdout.strip())
-
-        # CWD
-        result = ssh.exec("pwd", self.state)
-        self.state.cwd = result.stdout.strip()
+        # one round-trip for all three probes
+        uid = ssh.submit("id -u", self.state)
+        cwd = ssh.submit("pwd", self.state)
+        sudo = ssh.submit("sudo -n true", self.state)
+        ssh.drain()
 
-        # Sudo availability
-        result = ssh.exec("sudo -n true", self.state)
-        self.state.has_sudo = result.exit_code == 0
+        self.state.uid = int(uid.result().stdout.strip())
+        self.state.cwd = cwd.result().stdout.strip()
+        self.state.has_sudo = sudo.result().exit_code == 0
 
     def add_ssh_layer(self, ssh: SSHProtocol) -> None:
         """Add an SSHProtocol to the layers (for tunnel chaining)."""
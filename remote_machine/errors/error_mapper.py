@@ -1,5 +1,7 @@
 """Error mapping utilities."""
 
+import re
+
 from remote_machine.errors.exceptions import (
     AlreadyExists,
     CommandError,
@@ -11,6 +13,23 @@ from remote_machine.errors.exceptions import (
 from remote_machine.models.command_result import CommandResult
 
 
+# (exception, exit code, stderr substrings, message), in precedence order
+_RULES = (
+    (PermissionDenied, 13, ("permission denied",), "Permission denied executing '{}'"),
+    (NotFound, 127, ("not found", "no such file"), "Resource not found in '{}'"),
+    (AlreadyExists, None, ("already exists", "file exists"), "Resource already exists in '{}'"),
+    (InvalidArgument, 2, ("invalid argument",), "Invalid argument in '{}'"),
+    (Timeout, 124, ("timed out",), "Command timed out: '{}'"),
+)
+# exit code -> index of the rule it selects
+_RULE_BY_EXIT_CODE = {code: i for i, (_, code, _, _) in enumerate(_RULES) if code is not None}
+# one alternation over every rule's substrings; group N+1 matches rule N
+_STDERR_RE = re.compile(
+    "|".join(f"({'|'.join(map(re.escape, needles))})" for _, _, needles, _ in _RULES),
+    re.IGNORECASE,
+)
+
+
 class ErrorMapper:
     """Map command results to typed exceptions."""
 
@@ -27,31 +46,18 @@ class ErrorMapper:
         if result.success:
             return None
 
-        stderr_lower = result.stderr.lower()
-        exit_code = result.exit_code
-
-        # Permission denied (exit code 13) or stderr message
-        if exit_code == 13 or "permission denied" in stderr_lower:
-            return PermissionDenied(
-                f"Permission denied executing '{result.command}'",
-                result,
-            )
-
-        # Not found (exit code 1 or 127)
-        if exit_code == 127 or "not found" in stderr_lower or "no such file" in stderr_lower:
-            return NotFound(f"Resource not found in '{result.command}'", result)
-
-        # Already exists (exit code 1)
-        if "already exists" in stderr_lower or "file exists" in stderr_lower:
-            return AlreadyExists(f"Resource already exists in '{result.command}'", result)
-
-        # Invalid argument (exit code 2)
-        if exit_code == 2 or "invalid argument" in stderr_lower:
-            return InvalidArgument(f"Invalid argument in '{result.command}'", result)
-
-        # Timeout (exit code 124)
-        if exit_code == 124 or "timed out" in stderr_lower:
-            return Timeout(f"Command timed out: '{result.command}'", result)
+        # a known exit code picks its rule unless stderr mentions a rule that
+        # outranks it; stderr is scanned once and only while that's possible
+        rank = _RULE_BY_EXIT_CODE.get(result.exit_code, len(_RULES))
+        if rank:
+            for m in _STDERR_RE.finditer(result.stderr):
+                rank = min(rank, m.lastindex - 1)
+                if not rank:
+                    break
+
+        if rank < len(_RULES):
+            exc, _, _, message = _RULES[rank]
+            return exc(message.format(result.command), result)
 
         # Generic command error
         return CommandError(f"Command failed: '{result.command}'", result)
@@ -6,34 +6,56 @@ from remote_machine.models.command_result import CommandResult
 class RemoteError(Exception):
     """Base exception for all RemoteMachine errors."""
 
+    __slots__ = ("message", "result")
+
     def __init__(self, message: str, result: CommandResult | None = None):
         self.message = message
         self.result = result
         super().__init__(message)
 
+    def __reduce__(self):
+        # slot values aren't part of the default (args, __dict__) pickle state;
+        # the dict BaseException still carries (notes, extra attributes) is
+        return type(self), (self.message, self.result), self.__dict__ or None
+
 
 class CommandError(RemoteError):
     """Error executing a remote command."""
 
+    __slots__ = ()
+
 
 class PermissionDenied(CommandError):
     """Operation denied due to insufficient permissions."""
 
+    __slots__ = ()
+
+
 class NotFound(CommandError):
     """Resource not found."""
 
+    __slots__ = ()
+
 
 class AlreadyExists(CommandError):
     """Resource already exists."""
 
+    __slots__ = ()
+
 
 class InvalidArgument(CommandError):
     """Invalid argument provided."""
 
+    __slots__ = ()
+
 
 class Timeout(CommandError):
     """Operation timed out."""
 
+    __slots__ = ()
+
 
 class ProtocolNotAvailable(RemoteError):
     """Protocol not available."""
+
+    __slots__ = ()
@@ -1,139 +1,219 @@
-"""Models package - all dataclasses."""
+"""Models package - all dataclasses.
 
-# Core models
-from remote_machine.models.capabilities import Capabilities
-from remote_machine.models.command_result import CommandResult
-from remote_machine.models.remote_state import RemoteState
+Submodules are imported on first attribute access (PEP 562), so importing
+one model module doesn't load every other one.
+"""
 
-# Common types
-from remote_machine.models.common_types import (
-    BoolResult,
-    CountResult,
-    OperationResult,
-    IDResult,
-    StringResult,
-)
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
 
-# Filesystem types
-from remote_machine.models.filesystem_types import (
-    DiskUsage,
-    DirectoryEntry,
-    DirectoryListing,
-    FileInfo,
-    FileFindResult,
-)
+if TYPE_CHECKING:
+    # static checkers don't follow __getattr__; give them the real classes
+    from remote_machine.models.capabilities import Capabilities
+    from remote_machine.models.command_result import CommandResult
+    from remote_machine.models.remote_state import RemoteState
+    from remote_machine.models.common_types import (
+        BoolResult,
+        CountResult,
+        OperationResult,
+        IDResult,
+        StringResult,
+    )
+    from remote_machine.models.filesystem_types import (
+        DiskUsage,
+        DirectoryEntry,
+        DirectoryListing,
+        FileInfo,
+        FileFindResult,
+    )
+    from remote_machine.models.process_types import CPUUsage, MemoryUsage, ProcessInfo, ProcessList
+    from remote_machine.models.network_types import (
+        BandwidthInfo,
+        ConnectionList,
+        DNSResult,
+        IPAddress,
+        IPAddressList,
+        InterfaceInfo,
+        ListeningPort,
+        ListeningPortList,
+        NetworkStats,
+        PingResult,
+        Route,
+        RoutingTable,
+        TCPConnection,
+    )
+    from remote_machine.models.system_types import (
+        CPUInfo,
+        DiskPartition,
+        LoadAverage,
+        LoginHistory,
+        MemoryInfo,
+        OSRelease,
+        SystemInfo,
+        UnameInfo,
+        UptimeInfo,
+        UserInfo,
+    )
+    from remote_machine.models.service_types import (
+        ServiceConfig,
+        ServiceDependencies,
+        ServiceDependency,
+        ServiceInfo,
+        ServiceList,
+        ServiceListColumns,
+        ServiceLog,
+        ServiceLogList,
+        ServiceStatus,
+    )
+    from remote_machine.models.device_types import (
+        BlockDevice,
+        DeviceInfo,
+        FSCKResult,
+        FirmwareInfo,
+        GPIOInfo,
+        GPIOPin,
+        MountPoint,
+        MountedList,
+        PCIDevice,
+        PowerStatus,
+        SMARTAttribute,
+        SMARTData,
+        TemperatureInfo,
+        USBDevice,
+    )
+    from remote_machine.models.docker_types import Container, Image, ContainerStats, DockerInfo
+    from remote_machine.models.git_types import (
+        Commit,
+        Branch,
+        RepositoryStatus,
+        RemoteInfo,
+        DiffStat,
+    )
+    from remote_machine.models.firewall_types import (
+        FirewallRule,
+        FirewallChain,
+        OpenPort,
+        FirewallStatus,
+    )
+    from remote_machine.models.cron_types import (
+        CronJob,
+        CronJobExecution,
+        CronSchedule,
+        SystemCronFile,
+        UserCronJobs,
+    )
+    from remote_machine.models.http_types import (
+        HTTPErrorResult,
+        HTTPDownloadResult,
+        HTTPResponse,
+        HTTPStatusResult,
+        HTTPResultType,
+        HTTPDownloadResultType,
+    )
 
-# Process types
-from remote_machine.models.process_types import (
-    CPUUsage,
-    MemoryUsage,
-    ProcessInfo,
-    ProcessList,
-)
-
-# Network types
-from remote_machine.models.network_types import (
-    BandwidthInfo,
-    ConnectionList,
-    DNSResult,
-    IPAddress,
-    IPAddressList,
-    InterfaceInfo,
-    ListeningPort,
-    ListeningPortList,
-    NetworkStats,
-    PingResult,
-    Route,
-    RoutingTable,
-    TCPConnection,
-)
-
-# System types
-from remote_machine.models.system_types import (
-    CPUInfo,
-    DiskPartition,
-    LoadAverage,
-    LoginHistory,
-    MemoryInfo,
-    OSRelease,
-    SystemInfo,
-    UnameInfo,
-    UptimeInfo,
-    UserInfo,
-)
-
-# Service types
-from remote_machine.models.service_types import (
-    ServiceConfig,
-    ServiceDependencies,
-    ServiceDependency,
-    ServiceInfo,
-    ServiceList,
-    ServiceLog,
-    ServiceLogList,
-    ServiceStatus,
-)
-
-# Device types
-from remote_machine.models.device_types import (
-    BlockDevice,
-    DeviceInfo,
-    FSCKResult,
-    FirmwareInfo,
-    GPIOInfo,
-    GPIOPin,
-    MountPoint,
-    MountedList,
-    PCIDevice,
-    PowerStatus,
-    SMARTAttribute,
-    SMARTData,
-    TemperatureInfo,
-    USBDevice,
-)
-
-# Docker types
-from remote_machine.models.docker_types import (
-    Container,
-    Image,
-    ContainerStats,
-    DockerInfo,
-)
-
-# Git types
-from remote_machine.models.git_types import (
-    Commit,
-    Branch,
-    RepositoryStatus,
-    RemoteInfo,
-    DiffStat,
-)
-
-# Firewall types
-from remote_machine.models.firewall_types import (
-    FirewallRule,
-    FirewallChain,
-    OpenPort,
-    FirewallStatus,
-)
-
-# Cron types
-from remote_machine.models.cron_types import (
-    CronJob,
-    CronJobExecution,
-    CronSchedule,
-    SystemCronFile,
-    UserCronJobs,
-)
-
-from remote_machine.models.http_types import (
-    HTTPErrorResult,
-    HTTPDownloadResult,
-    HTTPResponse,
-    HTTPStatusResult,
-    HTTPResultType,
-    HTTPDownloadResultType,
-)
+# public name -> submodule that defines it
+_LAZY = {
+    # Core models
+    "Capabilities": "capabilities",
+    "CommandResult": "command_result",
+    "RemoteState": "remote_state",
+    # Common types
+    "BoolResult": "common_types",
+    "CountResult": "common_types",
+    "OperationResult": "common_types",
+    "IDResult": "common_types",
+    "StringResult": "common_types",
+    # Filesystem types
+    "DiskUsage": "filesystem_types",
+    "DirectoryEntry": "filesystem_types",
+    "DirectoryListing": "filesystem_types",
+    "FileInfo": "filesystem_types",
+    "FileFindResult": "filesystem_types",
+    # Process types
+    "CPUUsage": "process_types",
+    "MemoryUsage": "process_types",
+    "ProcessInfo": "process_types",
+    "ProcessList": "process_types",
+    # Network types
+    "BandwidthInfo": "network_types",
+    "ConnectionList": "network_types",
+    "DNSResult": "network_types",
+    "IPAddress": "network_types",
+    "IPAddressList": "network_types",
+    "InterfaceInfo": "network_types",
+    "ListeningPort": "network_types",
+    "ListeningPortList": "network_types",
+    "NetworkStats": "network_types",
+    "PingResult": "network_types",
+    "Route": "network_types",
+    "RoutingTable": "network_types",
+    "TCPConnection": "network_types",
+    # System types
+    "CPUInfo": "system_types",
+    "DiskPartition": "system_types",
+    "LoadAverage": "system_types",
+    "LoginHistory": "system_types",
+    "MemoryInfo": "system_types",
+    "OSRelease": "system_types",
+    "SystemInfo": "system_types",
+    "UnameInfo": "system_types",
+    "UptimeInfo": "system_types",
+    "UserInfo": "system_types",
+    # Service types
+    "ServiceConfig": "service_types",
+    "ServiceDependencies": "service_types",
+    "ServiceDependency": "service_types",
+    "ServiceInfo": "service_types",
+    "ServiceList": "service_types",
+    "ServiceListColumns": "service_types",
+    "ServiceLog": "service_types",
+    "ServiceLogList": "service_types",
+    "ServiceStatus": "service_types",
+    # Device types
+    "BlockDevice": "device_types",
+    "DeviceInfo": "device_types",
+    "FSCKResult": "device_types",
+    "FirmwareInfo": "device_types",
+    "GPIOInfo": "device_types",
+    "GPIOPin": "device_types",
+    "MountPoint": "device_types",
+    "MountedList": "device_types",
+    "PCIDevice": "device_types",
+    "PowerStatus": "device_types",
+    "SMARTAttribute": "device_types",
+    "SMARTData": "device_types",
+    "TemperatureInfo": "device_types",
+    "USBDevice": "device_types",
+    # Docker types
+    "Container": "docker_types",
+    "Image": "docker_types",
+    "ContainerStats": "docker_types",
+    "DockerInfo": "docker_types",
+    # Git types
+    "Commit": "git_types",
+    "Branch": "git_types",
+    "RepositoryStatus": "git_types",
+    "RemoteInfo": "git_types",
+    "DiffStat": "git_types",
+    # Firewall types
+    "FirewallRule": "firewall_types",
+    "FirewallChain": "firewall_types",
+    "OpenPort": "firewall_types",
+    "FirewallStatus": "firewall_types",
+    # Cron types
+    "CronJob": "cron_types",
+    "CronJobExecution": "cron_types",
+    "CronSchedule": "cron_types",
+    "SystemCronFile": "cron_types",
+    "UserCronJobs": "cron_types",
+    # HTTP types
+    "HTTPErrorResult": "http_types",
+    "HTTPDownloadResult": "http_types",
+    "HTTPResponse": "http_types",
+    "HTTPStatusResult": "http_types",
+    "HTTPResultType": "http_types",
+    "HTTPDownloadResultType": "http_types",
+}
 
 __all__ = [
     # Core
@@ -185,6 +265,7 @@ __all__ = [
     # Service
     "ServiceStatus",
     "ServiceList",
+    "ServiceListColumns",
     "ServiceConfig",
     "ServiceLog",
     "ServiceLogList",
@@ -236,3 +317,16 @@ __all__ = [
     "HTTPResultType",
     "HTTPDownloadResultType",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f"{__name__}.{module}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
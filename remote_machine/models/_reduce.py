@@ -0,0 +1,26 @@
+"""Pickle support shared by the high-volume result dataclasses."""
+
+from __future__ import annotations
+
+from dataclasses import fields
+from operator import attrgetter
+from typing import Any, Callable
+
+# dataclass -> getter returning its init fields as a tuple, built on first pickle
+_FIELD_GETTERS: dict[type, Callable[[Any], tuple]] = {}
+
+
+def reduce_by_fields(self) -> tuple[type, tuple]:
+    """`__reduce__` rebuilding a dataclass from its init fields as positional args.
+
+    Positional args pickle faster than the default per-field state of a
+    slotted dataclass. Use as `__reduce__ = reduce_by_fields` in the class body.
+    """
+    cls = type(self)
+    getter = _FIELD_GETTERS.get(cls)
+    if getter is None:
+        names = [f.name for f in fields(cls) if f.init]
+        # attrgetter with a single name returns the bare value, not a 1-tuple
+        getter = attrgetter(*names) if len(names) > 1 else lambda obj: (getattr(obj, names[0]),)
+        _FIELD_GETTERS[cls] = getter
+    return cls, getter(self)
@@ -1,9 +1,11 @@
 """Machine capabilities."""
 
+from __future__ import annotations
+
 from dataclasses import dataclass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Capabilities:
     """Available protocols and actions on a remote machine."""
 
@@ -1,9 +1,13 @@
 """Command execution result."""
 
+from __future__ import annotations
+
 from dataclasses import dataclass
 
+from remote_machine.models._reduce import reduce_by_fields
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CommandResult:
     """Result of a remote command execution."""
 
@@ -16,3 +20,5 @@ class CommandResult:
     def success(self) -> bool:
         """Check if command executed successfully."""
         return self.exit_code == 0
+
+    __reduce__ = reduce_by_fields
@@ -1,9 +1,11 @@
 """Common lightweight result types used across actions."""
 
+from __future__ import annotations
+
 from dataclasses import dataclass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BoolResult:
     """A simple boolean result with an optional name/key."""
 
@@ -11,7 +13,7 @@ class BoolResult:
     result: bool
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OperationResult:
     """Generic operation result indicating success/failure and message."""
 
@@ -19,7 +21,7 @@ class OperationResult:
     message: str | None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CountResult:
     """Simple count wrapper."""
 
@@ -27,7 +29,7 @@ class CountResult:
     count: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class IDResult:
     """Simple integer result wrapper (e.g., PID, port)."""
 
@@ -35,7 +37,7 @@ class IDResult:
     id: int | None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StringResult:
     """Simple string wrapper."""
 
@@ -1,11 +1,15 @@
 """Cron action result types."""
 
+from __future__ import annotations
+
 from dataclasses import dataclass
-from typing import List, Optional
 from datetime import datetime
 
+from remote_machine.utils.cron_utils import schedule_matches
+from remote_machine.models._reduce import reduce_by_fields
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CronJob:
     """Cron job information."""
 
@@ -15,24 +19,32 @@ class CronJob:
     month: str  # 1-12, *, JAN-DEC, etc.
     day_of_week: str  # 0-7, *, MON-SUN, etc.
     command: str  # Command to execute
-    comment: Optional[str]  # Comment/description
+    comment: str | None  # Comment/description
+
+    def matches(self, when: datetime) -> bool:
+        """Check whether this schedule fires at `when` (minute resolution)."""
+        return schedule_matches(
+            self.minute, self.hour, self.day_of_month, self.month, self.day_of_week, when
+        )
 
+    __reduce__ = reduce_by_fields
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class CronJobExecution:
     """Cron job execution information."""
 
     job_id: str  # Unique job identifier
     command: str  # Command executed
     start_time: datetime  # When job started
-    end_time: Optional[datetime]  # When job ended
+    end_time: datetime | None  # When job ended
     exit_code: int  # Exit code of command
     stdout: str  # Standard output
     stderr: str  # Standard error
     duration_seconds: float  # Execution duration
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CronSchedule:
     """Cron schedule representation."""
 
@@ -43,19 +55,25 @@ class CronSchedule:
     day_of_week: str
     description: str  # Human-readable description
 
+    def matches(self, when: datetime) -> bool:
+        """Check whether this schedule fires at `when` (minute resolution)."""
+        return schedule_matches(
+            self.minute, self.hour, self.day_of_month, self.month, self.day_of_week, when
+        )
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SystemCronFile:
     """System-level cron file information."""
 
     path: str  # File path (/etc/cron.d/*, /etc/crontab, etc.)
-    jobs: List[CronJob]  # Jobs in this file
+    jobs: list[CronJob]  # Jobs in this file
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class UserCronJobs:
     """All cron jobs for a user."""
 
     username: str
-    jobs: List[CronJob]
-    last_modified: Optional[datetime]
+    jobs: list[CronJob]
+    last_modified: datetime | None
@@ -1,10 +1,14 @@
 """Device action result types."""
 
+from __future__ import annotations
+
 from dataclasses import dataclass
 from datetime import datetime
 
+from remote_machine.models._reduce import reduce_by_fields
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DeviceInfo:
     """Hardware device information."""
 
@@ -17,7 +21,7 @@ class DeviceInfo:
     power_state: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PCIDevice:
     """PCI device information."""
 
@@ -30,7 +34,7 @@ class PCIDevice:
     driver: str | None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class USBDevice:
     """USB device information."""
 
@@ -43,7 +47,7 @@ class USBDevice:
     speed: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BlockDevice:
     """Block device (disk) information."""
 
@@ -58,7 +62,7 @@ class BlockDevice:
     serial: str | None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MountPoint:
     """Mounted filesystem information."""
 
@@ -71,13 +75,14 @@ class MountPoint:
     percent: float
     options: str
 
+    __reduce__ = reduce_by_fields
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class MountedList:
     """List of mounted filesystems."""
 
     mount_points: list[MountPoint]
-    count: int
 
     def options(self, path: str) -> str | None:
         """Return mount options for `path` (best-effort)."""
@@ -85,8 +90,13 @@ class MountedList:
             if m.mount_point == path:
                 return m.options
 
+    @property
+    def count(self) -> int:
+        """Number of mount points."""
+        return len(self.mount_points)
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FSCKResult:
     """Filesystem check result."""
 
@@ -99,7 +109,7 @@ class FSCKResult:
     fragments: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SMARTAttribute:
     """S.M.A.R.T. attribute."""
 
@@ -110,8 +120,10 @@ class SMARTAttribute:
     threshold: int
     status: str  # 'ok', 'warning', 'critical'
 
+    __reduce__ = reduce_by_fields
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class SMARTData:
     """S.M.A.R.T. information."""
 
@@ -126,7 +138,7 @@ class SMARTData:
     attributes: list[SMARTAttribute]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TemperatureInfo:
     """Device temperature information."""
 
@@ -138,7 +150,7 @@ class TemperatureInfo:
     status: str  # 'ok', 'warning', 'critical'
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PowerStatus:
     """Device power status."""
 
@@ -148,7 +160,7 @@ class PowerStatus:
     power_supply: str | None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FirmwareInfo:
     """Device firmware information."""
 
@@ -159,7 +171,7 @@ class FirmwareInfo:
     update_available: bool
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GPIOPin:
     """GPIO pin information."""
 
@@ -170,10 +182,18 @@ class GPIOPin:
     available: bool
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GPIOInfo:
     """GPIO pins information."""
 
     pins: list[GPIOPin]
-    total: int
-    available: int
+
+    @property
+    def total(self) -> int:
+        """Number of pins."""
+        return len(self.pins)
+
+    @property
+    def available(self) -> int:
+        """Number of pins that are available."""
+        return sum(pin.available for pin in self.pins)
@@ -1,11 +1,14 @@
 """Docker action result types."""
 
+from __future__ import annotations
+
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional, List
+
+from remote_machine.models._reduce import reduce_by_fields
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Container:
     """Docker container information."""
 
@@ -15,12 +18,14 @@ class Container:
     status: str
     state: str
     created: datetime
-    started: Optional[datetime]
-    ports: List[str]
+    started: datetime | None
+    ports: list[str]
     command: str
 
+    __reduce__ = reduce_by_fields
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Image:
     """Docker image information."""
 
@@ -32,7 +37,7 @@ class Image:
     virtual_size: int  # in bytes
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ContainerStats:
     """Docker container resource statistics."""
 
@@ -47,7 +52,7 @@ class ContainerStats:
     block_output: int  # in bytes
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DockerInfo:
     """Docker system information."""
 
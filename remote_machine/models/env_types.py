@@ -1,15 +1,21 @@
 """Environment action result types."""
 
+from __future__ import annotations
+
 from dataclasses import dataclass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EnvVar:
     key: str
     value: str | None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EnvVars:
     vars: dict[str, str]
-    count: int
+
+    @property
+    def count(self) -> int:
+        """Number of variables."""
+        return len(self.vars)
@@ -1,10 +1,14 @@
 """Filesystem action result types."""
 
-from dataclasses import dataclass
+from __future__ import annotations
+
+from dataclasses import dataclass, field
 from datetime import datetime
 
+_UNITS = ("B", "KB", "MB", "GB", "TB", "PB")
+
 
-@dataclass
+@dataclass(slots=True)
 class PermissionBits:
 
     read: bool
@@ -12,17 +16,34 @@ class PermissionBits:
     execute: bool
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Permissions:
+    """Parsed `ls -l` permission string; rwx bits packed into a 0o777-style int."""
 
     entry_type: str
-    owner: PermissionBits
-    group: PermissionBits
-    others: PermissionBits
+    mode: int
     raw: str
 
+    @property
+    def owner(self) -> PermissionBits:
+        return self._bits(6)
+
+    @property
+    def group(self) -> PermissionBits:
+        return self._bits(3)
+
+    @property
+    def others(self) -> PermissionBits:
+        return self._bits(0)
+
+    def _bits(self, shift: int) -> PermissionBits:
+        triplet = self.mode >> shift
+        return PermissionBits(
+            read=bool(triplet & 4), write=bool(triplet & 2), execute=bool(triplet & 1)
+        )
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class FileInfo:
     """File or directory information from stat."""
 
@@ -31,15 +52,35 @@ class FileInfo:
     mode: str
     owner: str
     group: str
-    modified: datetime
-    accessed: datetime
-    created: datetime
+    modified_epoch: int  # Unix timestamps, as reported by stat
+    accessed_epoch: int
+    created_epoch: int
     is_symlink: bool
     is_file: bool
     is_dir: bool
+    # hash of the identifying subset only, computed once; __eq__ still compares every field
+    _hash: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_hash", hash((self.path, self.size, self.modified_epoch)))
+
+    def __hash__(self):
+        return self._hash
 
+    @property
+    def modified(self) -> datetime:
+        return datetime.fromtimestamp(self.modified_epoch)
+
+    @property
+    def accessed(self) -> datetime:
+        return datetime.fromtimestamp(self.accessed_epoch)
 
-@dataclass(frozen=True)
+    @property
+    def created(self) -> datetime:
+        return datetime.fromtimestamp(self.created_epoch)
+
+
+@dataclass(frozen=True, slots=True)
 class DirectoryEntry:
     """Entry in a directory listing."""
 
@@ -53,16 +94,20 @@ class DirectoryEntry:
     permissions: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DirectoryListing:
     """Result of listing a directory."""
 
     path: str
     entries: list[DirectoryEntry]
-    count: int
 
+    @property
+    def count(self) -> int:
+        """Number of entries."""
+        return len(self.entries)
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class DiskUsage:
     """Disk usage information."""
 
@@ -73,43 +118,42 @@ class DiskUsage:
     used: int
     available: int
     percent: float
+    # formatted once in __post_init__ instead of on every access
+    human_total: str = field(init=False, repr=False, compare=False)
+    human_used: str = field(init=False, repr=False, compare=False)
+    human_available: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "human_total", self._humanize(self.total))
+        object.__setattr__(self, "human_used", self._humanize(self.used))
+        object.__setattr__(self, "human_available", self._humanize(self.available))
 
     @property
     def total(self) -> int:
         return self.used + self.available
 
-    @property
-    def human_total(self) -> str:
-        return self._humanize(self.total)
-
-    @property
-    def human_used(self) -> str:
-        return self._humanize(self.used)
-
-    @property
-    def human_available(self) -> str:
-        return self._humanize(self.available)
-
     @staticmethod
-    def _humanize(size: int):
-        for unit in ["B", "KB", "MB", "GB", "TB"]:
-            if size < 1024.0:
-                return f"{size:.1f}{unit}"
-            size /= 1024.0
-        return f"{size:.1f}PB"
+    def _humanize(size: int) -> str:
+        # the bit length picks the 1024-power directly instead of dividing in a loop
+        i = min(len(_UNITS) - 1, max(0, (int(size).bit_length() - 1) // 10))
+        return f"{size / (1 << (i * 10)):.1f}{_UNITS[i]}"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FileFindResult:
     """Result of finding files."""
 
     pattern: str
     root_path: str
     matches: list[str]
-    count: int
+
+    @property
+    def count(self) -> int:
+        """Number of matches."""
+        return len(self.matches)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FileContent:
     """File contents wrapper."""
 
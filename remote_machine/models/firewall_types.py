@@ -1,24 +1,25 @@
 """Firewall action result types."""
 
+from __future__ import annotations
+
 from dataclasses import dataclass
-from typing import List, Optional
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FirewallRule:
     """Firewall rule information."""
 
-    rule_number: Optional[int]  # Line number in iptables (if available)
+    rule_number: int | None  # Line number in iptables (if available)
     protocol: str  # tcp, udp, icmp, all
     source: str  # Source IP or CIDR
     destination: str  # Destination IP or CIDR
-    source_port: Optional[str]  # Source port or port range
-    destination_port: Optional[str]  # Destination port or port range
+    source_port: str | None  # Source port or port range
+    destination_port: str | None  # Destination port or port range
     action: str  # ACCEPT, DROP, REJECT, etc.
-    comment: Optional[str]  # Rule comment/description
+    comment: str | None  # Rule comment/description
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FirewallChain:
     """Firewall chain information."""
 
@@ -26,24 +27,24 @@ class FirewallChain:
     policy: str  # Default policy (ACCEPT, DROP, REJECT)
     packet_count: int  # Number of packets processed
     byte_count: int  # Number of bytes processed
-    rules: List[FirewallRule]  # Rules in this chain
+    rules: list[FirewallRule]  # Rules in this chain
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OpenPort:
     """Open/listening port information."""
 
     port: int
     protocol: str  # tcp or udp
     state: str  # OPEN, ESTABLISHED, LISTENING, etc.
-    service: Optional[str]  # Service name (http, ssh, etc.)
+    service: str | None  # Service name (http, ssh, etc.)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FirewallStatus:
     """Overall firewall status."""
 
     enabled: bool  # Is firewall active
-    chains: List[FirewallChain]  # All chains
-    open_ports: List[OpenPort]  # Open ports
+    chains: list[FirewallChain]  # All chains
+    open_ports: list[OpenPort]  # Open ports
     total_rules: int  # Total rules across all chains
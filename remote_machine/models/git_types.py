@@ -1,11 +1,12 @@
 """Git action result types."""
 
+from __future__ import annotations
+
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional, List
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Commit:
     """Git commit information."""
 
@@ -15,20 +16,20 @@ class Commit:
     email: str
     date: datetime
     message: str
-    branch: Optional[str] = None
+    branch: str | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Branch:
     """Git branch information."""
 
     name: str
     is_current: bool
-    tracking: Optional[str] = None
-    last_commit: Optional[str] = None
+    tracking: str | None = None
+    last_commit: str | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RepositoryStatus:
     """Git repository status."""
 
@@ -42,7 +43,7 @@ class RepositoryStatus:
     is_dirty: bool
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RemoteInfo:
     """Git remote information."""
 
@@ -52,7 +53,7 @@ class RemoteInfo:
     push_url: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DiffStat:
     """Git diff statistics."""
 
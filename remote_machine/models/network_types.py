@@ -1,10 +1,17 @@
 """Network action result types."""
 
-from dataclasses import dataclass
-from ipaddress import IPv4Address, IPv6Address
+from __future__ import annotations
 
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
 
-@dataclass(frozen=True)
+from remote_machine.models._reduce import reduce_by_fields
+
+if TYPE_CHECKING:
+    from ipaddress import IPv4Address, IPv6Address
+
+
+@dataclass(frozen=True, slots=True)
 class InterfaceInfo:
     """Network interface information."""
 
@@ -13,14 +20,28 @@ class InterfaceInfo:
     isup: bool
     is_running: bool
     mac_address: str
-    ipv4_addresses: list[IPv4Address]
-    ipv6_addresses: list[IPv6Address]
+    ipv4_addresses: list[str]
+    ipv6_addresses: list[str]
     broadcast: str | None
     netmask: str | None
     speed: int | None  # in Mbps
 
+    @property
+    def parsed_ipv4(self) -> list[IPv4Address]:
+        """IPv4 addresses as ipaddress objects, for subnet math."""
+        from ipaddress import IPv4Address
+
+        return [IPv4Address(a) for a in self.ipv4_addresses]
+
+    @property
+    def parsed_ipv6(self) -> list[IPv6Address]:
+        """IPv6 addresses as ipaddress objects, for subnet math."""
+        from ipaddress import IPv6Address
+
+        return [IPv6Address(a) for a in self.ipv6_addresses]
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class IPAddress:
     """IP address information."""
 
@@ -32,15 +53,19 @@ class IPAddress:
     gateway: str | None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class IPAddressList:
     """List of IP addresses."""
 
     addresses: list[IPAddress]
-    count: int
 
+    @property
+    def count(self) -> int:
+        """Number of addresses."""
+        return len(self.addresses)
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class Route:
     """Routing table entry."""
 
@@ -52,15 +77,19 @@ class Route:
     interface: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RoutingTable:
     """Routing table information."""
 
     routes: list[Route]
-    count: int
+
+    @property
+    def count(self) -> int:
+        """Number of routes."""
+        return len(self.routes)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TCPConnection:
     """TCP connection information."""
 
@@ -71,17 +100,35 @@ class TCPConnection:
     state: str  # 'ESTABLISHED', 'LISTEN', etc.
     pid: int | None
     process_name: str | None
+    # hash of the socket 4-tuple, computed once; __eq__ still compares every field
+    _hash: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(
+            self,
+            "_hash",
+            hash((self.local_address, self.local_port, self.remote_address, self.remote_port)),
+        )
+
+    def __hash__(self):
+        return self._hash
+
+    __reduce__ = reduce_by_fields
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ConnectionList:
     """List of TCP connections."""
 
     connections: list[TCPConnection]
-    count: int
 
+    @property
+    def count(self) -> int:
+        """Number of connections."""
+        return len(self.connections)
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class ListeningPort:
     """Listening port information."""
 
@@ -93,15 +140,19 @@ class ListeningPort:
     process_name: str | None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ListeningPortList:
     """List of listening ports."""
 
     ports: list[ListeningPort]
-    count: int
+
+    @property
+    def count(self) -> int:
+        """Number of ports."""
+        return len(self.ports)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DNSResult:
     """DNS lookup result."""
 
@@ -111,7 +162,7 @@ class DNSResult:
     canonical_name: str | None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PingResult:
     """Ping result information."""
 
@@ -126,7 +177,7 @@ class PingResult:
     stddev_time: str | None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BandwidthInfo:
     """Bandwidth usage information."""
 
@@ -141,15 +192,19 @@ class BandwidthInfo:
     dropped_out: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BandwidthList:
     """List of bandwidth usage entries."""
 
     items: list[BandwidthInfo]
-    count: int
 
+    @property
+    def count(self) -> int:
+        """Number of items."""
+        return len(self.items)
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class FirewallStatus:
     """Firewall backend status."""
 
@@ -158,7 +213,7 @@ class FirewallStatus:
     raw: str | None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class NetworkStats:
     """Network statistics."""
 
@@ -169,9 +224,13 @@ class NetworkStats:
     total_packets_received: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class InterfaceList:
     """List of interface names."""
 
     interfaces: list[str]
-    count: int
+
+    @property
+    def count(self) -> int:
+        """Number of interfaces."""
+        return len(self.interfaces)
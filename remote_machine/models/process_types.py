@@ -1,10 +1,14 @@
 """Process action result types."""
 
+from __future__ import annotations
+
 from dataclasses import dataclass
 from datetime import datetime
 
+from remote_machine.models._reduce import reduce_by_fields
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ProcessInfo:
     """Process information."""
 
@@ -17,11 +21,18 @@ class ProcessInfo:
     memory_percent: float
     memory_rss: int  # Resident set size in bytes
     memory_vms: int  # Virtual memory size in bytes
-    started: datetime
+    started_epoch: int  # Unix timestamp
     command: str
 
+    @property
+    def started(self) -> datetime:
+        """Start time as a datetime, built on access."""
+        return datetime.fromtimestamp(self.started_epoch)
+
+    __reduce__ = reduce_by_fields
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MemoryUsage:
     """Memory usage information."""
 
@@ -38,7 +49,7 @@ class MemoryUsage:
     swap_percent: float
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CPUUsage:
     """CPU usage information."""
 
@@ -55,7 +66,7 @@ class CPUUsage:
     count: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ProcessResourceUsage:
     """Per-process CPU/memory usage."""
 
@@ -65,7 +76,7 @@ class ProcessResourceUsage:
     memory_vms: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ProcessWaitResult:
     """Wait result for a process."""
 
@@ -74,16 +85,20 @@ class ProcessWaitResult:
     timed_out: bool
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ProcessChildren:
     """Children PIDs list."""
 
     pid: int
     children: list[int]
-    count: int
+
+    @property
+    def count(self) -> int:
+        """Number of children."""
+        return len(self.children)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ProcessParent:
     """Parent PID info."""
 
@@ -91,9 +106,13 @@ class ProcessParent:
     parent: int | None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ProcessList:
     """List of processes."""
 
     processes: list[ProcessInfo]
-    count: int
+
+    @property
+    def count(self) -> int:
+        """Number of processes."""
+        return len(self.processes)
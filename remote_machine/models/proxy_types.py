@@ -3,7 +3,7 @@ from typing import Optional
 import threading
 
 
-@dataclass
+@dataclass(slots=True)
 class Proxy:
     local_host: str
     local_port: int
@@ -13,3 +13,10 @@ class Proxy:
     running: bool = True
     _thread: Optional[threading.Thread] = field(default=None, repr=False)
     _channel: Optional[any] = field(default=None, repr=False)
+
+    def __copy__(self) -> "Proxy":
+        # a proxy is one live forwarding; its thread and channel can't be duplicated
+        return self
+
+    def __deepcopy__(self, memo: dict) -> "Proxy":
+        return self
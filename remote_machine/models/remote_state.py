@@ -1,13 +1,13 @@
 """Remote state tracking - cwd and environment variables."""
 
+import shlex
 from dataclasses import dataclass, field
-from copy import deepcopy
 from typing import List
 
 from remote_machine.models.proxy_types import Proxy
 
 
-@dataclass
+@dataclass(slots=True)
 class RemoteState:
     """Tracks remote execution state: current working directory and environment variables."""
 
@@ -18,5 +18,25 @@ class RemoteState:
     proxies: List[Proxy] = field(default_factory=list)
 
     def copy(self) -> "RemoteState":
-        """Create a deep copy of the state."""
-        return deepcopy(self)
+        """Create an independent copy of the state.
+
+        `env` and the proxy list are copied; the Proxy entries themselves are shared,
+        since their threads and channels can't be duplicated.
+        """
+        return RemoteState(
+            cwd=self.cwd,
+            env=self.env.copy(),
+            uid=self.uid,
+            has_sudo=self.has_sudo,
+            proxies=list(self.proxies),
+        )
+
+    def command_prefix(self) -> str:
+        """Return the `export ... && cd ...` prefix commands run under in this state.
+
+        Built on every call: callers mutate env in place, and checking a cached
+        copy against it costs about as much as rebuilding the string.
+        """
+        parts = [f"export {key}={shlex.quote(value)}" for key, value in self.env.items()]
+        parts.append(f"cd {shlex.quote(self.cwd)}")
+        return " && ".join(parts)
@@ -1,10 +1,12 @@
 """Service action result types."""
 
+from __future__ import annotations
+
 from dataclasses import dataclass
 from datetime import datetime
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ServiceStatus:
     """Service status information."""
 
@@ -19,15 +21,39 @@ class ServiceStatus:
     uptime: int | None  # seconds
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ServiceList:
     """List of services."""
 
     services: list[ServiceStatus]
-    count: int
 
+    @property
+    def count(self) -> int:
+        """Number of services."""
+        return len(self.services)
+
+
+@dataclass(frozen=True, slots=True)
+class ServiceListColumns:
+    """List of services stored column-wise (one list per field)."""
+
+    names: list[str]
+    states: list[str]
+    active: list[bool]
+    loaded: list[bool]
 
-@dataclass(frozen=True)
+    @property
+    def active_count(self) -> int:
+        """Number of active services."""
+        return sum(self.active)
+
+    @property
+    def count(self) -> int:
+        """Number of services."""
+        return len(self.names)
+
+
+@dataclass(frozen=True, slots=True)
 class ServiceConfig:
     """Service configuration."""
 
@@ -37,7 +63,7 @@ class ServiceConfig:
     valid: bool
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ServiceLog:
     """Service log entry."""
 
@@ -47,16 +73,20 @@ class ServiceLog:
     unit: str | None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ServiceLogList:
     """List of service log entries."""
 
     service: str
     logs: list[ServiceLog]
-    count: int
+
+    @property
+    def count(self) -> int:
+        """Number of logs."""
+        return len(self.logs)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ServiceDependency:
     """Service dependency information."""
 
@@ -65,7 +95,7 @@ class ServiceDependency:
     is_satisfied: bool
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ServiceDependencies:
     """Service dependencies."""
 
@@ -74,7 +104,7 @@ class ServiceDependencies:
     dependents: list[str]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ServiceInfo:
     """Complete service information."""
 
@@ -1,10 +1,12 @@
 """System action result types."""
 
+from __future__ import annotations
+
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CPUInfo:
     """CPU information."""
 
@@ -21,7 +23,7 @@ class CPUInfo:
     flags: list[str]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MemoryInfo:
     """Memory information."""
 
@@ -41,7 +43,7 @@ class MemoryInfo:
     human_used: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DiskPartition:
     """Disk partition information."""
 
@@ -55,7 +57,7 @@ class DiskPartition:
     read_only: bool
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LoadAverage:
     """Load average information."""
 
@@ -66,7 +68,7 @@ class LoadAverage:
     total_processes: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class UptimeInfo:
     """System uptime information."""
 
@@ -78,7 +80,7 @@ class UptimeInfo:
     minutes: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OSRelease:
     """OS release information."""
 
@@ -93,7 +95,7 @@ class OSRelease:
     support_url: str | None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class UnameInfo:
     """Uname system information."""
 
@@ -104,7 +106,7 @@ class UnameInfo:
     machine: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SystemInfo:
     """Complete system information."""
 
@@ -118,7 +120,7 @@ class SystemInfo:
     load_average: LoadAverage
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class UserInfo:
     """Logged in user information."""
 
@@ -129,7 +131,7 @@ class UserInfo:
     idle_time: timedelta | None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LoginHistory:
     """User login history entry."""
 
@@ -1,11 +1,40 @@
-"""Protocols package."""
+"""Protocols package.
 
-from remote_machine.protocols.ssh import SSHProtocol
-from remote_machine.protocols.scp import SCPProtocol
-from remote_machine.protocols.http import HTTPProtocol
+Protocol classes are imported on first attribute access (PEP 562), so using
+one protocol doesn't import the dependencies of the others.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    # static checkers don't follow __getattr__; give them the real classes
+    from remote_machine.protocols.ssh import SSHProtocol
+    from remote_machine.protocols.scp import SCPProtocol
+    from remote_machine.protocols.http import HTTPProtocol
+
+# public name -> submodule that defines it
+_LAZY = {
+    "SSHProtocol": "ssh",
+    "SCPProtocol": "scp",
+    "HTTPProtocol": "http",
+}
 
 __all__ = [
     "SSHProtocol",
     "SCPProtocol",
     "HTTPProtocol",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f"{__name__}.{module}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -1,11 +1,17 @@
 from __future__ import annotations
 import http.client
+import shutil
 import ssl
 import urllib.parse
 from typing import Dict, Optional
 import time
 
-from remote_machine.models import HTTPResponse, HTTPStatusResult, HTTPDownloadResult
+from remote_machine.models.http_types import HTTPResponse, HTTPStatusResult, HTTPDownloadResult
+
+# raised when the server already closed an idle keep-alive connection
+_STALE_CONNECTION_ERRORS = (ConnectionResetError, BrokenPipeError, http.client.CannotSendRequest)
+# methods a stale-connection retry may repeat even if the server already got the request
+_IDEMPOTENT_METHODS = frozenset(("GET", "HEAD", "OPTIONS"))
 
 
 class HTTPProtocol:
@@ -21,6 +27,8 @@ class HTTPProtocol:
         self.default_headers = default_headers or {}
         self.default_timeout = default_timeout
         self._cookies: Dict[str, str] = {}
+        # joined Cookie header for _cookies; None until rebuilt after a change
+        self._cookie_header: Optional[str] = None
         self._conn: Optional[http.client.HTTPConnection] = None
         self._host: Optional[str] = None
         self._port: Optional[int] = None
@@ -54,6 +62,7 @@ class HTTPProtocol:
         if self._conn:
             self._conn.close()
         self._cookies.clear()
+        self._cookie_header = None
         self._init_connection()
 
     def _build_headers(self, headers: Optional[Dict[str, str]] = None) -> Dict[str, str]:
@@ -61,17 +70,18 @@ class HTTPProtocol:
         if headers:
             h.update(headers)
         if self._cookies:
-            h["Cookie"] = "; ".join(f"{k}={v}" for k, v in self._cookies.items())
+            if self._cookie_header is None:
+                self._cookie_header = "; ".join([f"{k}={v}" for k, v in self._cookies.items()])
+            h["Cookie"] = self._cookie_header
         return h
 
-    def _update_cookies(self, response_headers: Dict[str, str]):
-        set_cookie = response_headers.get("set-cookie")
-        if set_cookie:
-            parts = set_cookie.split(";")
-            for part in parts:
-                if "=" in part:
-                    k, v = part.split("=", 1)
-                    self._cookies[k.strip()] = v.strip()
+    def _update_cookies(self, set_cookie_headers: list[str]):
+        # each header sets one cookie; what follows the first ";" are its attributes
+        for header in set_cookie_headers:
+            name, sep, value = header.split(";", 1)[0].partition("=")
+            if sep:
+                self._cookies[name.strip()] = value.strip()
+                self._cookie_header = None
 
     def request(
         self,
@@ -81,30 +91,60 @@ class HTTPProtocol:
         body: Optional[bytes] = None,
         timeout: Optional[float] = None,
     ) -> HTTPResponse:
-        if not self._conn:
-            self._init_connection()
-
-        url_path = path if path.startswith("/") else "/" + path
-        hdrs = self._build_headers(headers)
-
         start = time.monotonic()
-        self._conn.request(method.upper(), url_path, body=body, headers=hdrs)
-        res = self._conn.getresponse()
+        url_path, res = self._open(method.upper(), path, headers, body)
+        # drain the body so the socket can carry the next request
         data = res.read()
         elapsed = int((time.monotonic() - start) * 1000)
 
-        headers_dict = {k.lower(): v for k, v in res.getheaders()}
-        self._update_cookies(headers_dict)
-
         return HTTPResponse(
             url=f"{self._scheme}://{self._host}{url_path}",
             method=method.upper(),
             status_code=res.status,
-            headers=headers_dict,
+            headers={k.lower(): v for k, v in res.getheaders()},
             body=data,
             elapsed_ms=elapsed,
         )
 
+    def _open(
+        self,
+        method: str,
+        path: str,
+        headers: Optional[Dict[str, str]] = None,
+        body: Optional[bytes] = None,
+    ) -> tuple[str, http.client.HTTPResponse]:
+        """Send a request and return its path and the unread response."""
+        if not self._conn:
+            self._init_connection()
+
+        url_path = path if path.startswith("/") else "/" + path
+        hdrs = self._build_headers(headers)
+
+        reused = self._conn.sock is not None
+        sent = False
+        try:
+            self._conn.request(method, url_path, body=body, headers=hdrs)
+            sent = True
+            res = self._conn.getresponse()
+        except _STALE_CONNECTION_ERRORS:
+            # once the request went out the server may have acted on it, so only
+            # methods that are safe to repeat are replayed
+            if not reused or (sent and method not in _IDEMPOTENT_METHODS):
+                raise
+            # reconnect once instead of making the caller reset_session()
+            self._conn.close()
+            res = self._send(method, url_path, body, hdrs)
+
+        # the header dict would keep only the last Set-Cookie; the message keeps them all
+        self._update_cookies(res.msg.get_all("set-cookie") or [])
+        return url_path, res
+
+    def _send(
+        self, method: str, url_path: str, body: Optional[bytes], headers: Dict[str, str]
+    ) -> http.client.HTTPResponse:
+        self._conn.request(method, url_path, body=body, headers=headers)
+        return self._conn.getresponse()
+
     def head(self, path: str) -> HTTPStatusResult:
         res = self.request("HEAD", path)
         return HTTPStatusResult(
@@ -114,13 +154,18 @@ class HTTPProtocol:
         )
 
     def download(self, path: str, output_path: str) -> HTTPDownloadResult:
-        res = self.request("GET", path)
+        start = time.monotonic()
+        url_path, res = self._open("GET", path)
+        # copy straight from the socket so the body is never held in memory whole
         with open(output_path, "wb") as f:
-            f.write(res.body)
+            shutil.copyfileobj(res, f, 1024 * 1024)
+            bytes_written = f.tell()
+        elapsed = int((time.monotonic() - start) * 1000)
+
         return HTTPDownloadResult(
-            url=res.url,
+            url=f"{self._scheme}://{self._host}{url_path}",
             output_path=output_path,
-            status_code=res.status_code,
-            bytes_written=len(res.body),
-            elapsed_ms=res.elapsed_ms,
+            status_code=res.status,
+            bytes_written=bytes_written,
+            elapsed_ms=elapsed,
         )
@@ -1,17 +1,21 @@
 """SCP protocol implemented using Paramiko SFTP (transport-only).
 
 This module implements a small SCPProtocol class which performs uploads
-and chunked downloads via an active SSHProtocol (Paramiko SSHClient).
+and downloads via an active SSHProtocol (Paramiko SSHClient).
 
 Notes:
 - Uses Paramiko SFTP (open_sftp())
 - Does not expose SFTP client objects
+- Keeps one SFTP channel per SSH session until close()
 - Maps common exceptions to remote_machine error types
 - All results are dataclasses (SCPResult)
 """
 
 from __future__ import annotations
 
+import os
+import shutil
+import stat
 from pathlib import Path
 
 import paramiko
@@ -39,7 +43,7 @@ class SCPProtocol:
 
     @property
     def sftp_client(self) -> paramiko.SFTPClient:
-        """Return a new SFTP client created from the underlying SSH client.
+        """Return the SFTP client, opening it from the underlying SSH client on first use.
 
         Raises:
             ConnectionError: if ssh client is not connected or paramiko raises.
@@ -53,10 +57,19 @@ class SCPProtocol:
                 raise ConnectionError("Failed to create SFTP client") from e
         return self._sftp_client
 
+    def close(self) -> None:
+        """Close the cached SFTP channel; the next transfer opens a new one."""
+        if self._sftp_client is not None:
+            try:
+                self._sftp_client.close()
+            except Exception:
+                pass
+            self._sftp_client = None
+
     def download(
         self, remote_path: str, local_path: Path, chunk_size: int = 1024 * 1024
     ) -> SCPResult:
-        """Download a remote file in fixed-size chunks and write to a local file.
+        """Download a remote file with prefetched reads and write it to a local file.
 
         Args:
             remote_path: path on remote machine
@@ -69,17 +82,13 @@ class SCPProtocol:
         Raises:
             NotFound, PermissionDenied, CommandError, ConnectionError
         """
-        bytes_transferred = 0
-
         try:
             with self.sftp_client.open(remote_path, "rb") as remote_file:
+                # pipeline the READs instead of waiting one round trip per chunk
+                remote_file.prefetch(remote_file.stat().st_size)
                 with open(local_path, "wb") as local_file:
-                    while True:
-                        chunk = remote_file.read(chunk_size)
-                        if not chunk:
-                            break
-                        local_file.write(chunk)
-                        bytes_transferred += len(chunk)
+                    shutil.copyfileobj(remote_file, local_file, chunk_size)
+                    bytes_transferred = local_file.tell()
                 return SCPResult(
                     source=remote_path,
                     destination=str(local_path),
@@ -104,18 +113,15 @@ class SCPProtocol:
         Raises:
             NotFound, PermissionDenied, CommandError, ConnectionError
         """
-        if not local_path.exists() or not local_path.is_file():
+        source = str(local_path)
+        # one stat answers exists, is-a-file and size
+        try:
+            st = os.stat(source)
+        except OSError:
+            st = None
+        if st is None or not stat.S_ISREG(st.st_mode):
             raise NotFound(f"Local file not found: {local_path}")
 
-        try:
-            self.sftp_client.put(str(local_path), remote_path)
-            bytes_transferred = local_path.stat().st_size
-        finally:
-            try:
-                self.sftp_client.close()
-            except Exception:
-                pass
+        self.sftp_client.put(source, remote_path)
 
-        return SCPResult(
-            source=str(local_path), destination=remote_path, bytes_transferred=bytes_transferred
-        )
+        return SCPResult(source=source, destination=remote_path, bytes_transferred=st.st_size)
@@ -1,14 +1,31 @@
 """SSH protocol implementation using Paramiko."""
 
+from __future__ import annotations
 
-
-import paramiko
-
+import re
+import socket
+import threading
+import time
+import uuid
+from concurrent.futures import Future
+from typing import TYPE_CHECKING
 
 from remote_machine.errors.error_mapper import ErrorMapper
 from remote_machine.models.command_result import CommandResult
 from remote_machine.models.remote_state import RemoteState
 
+if TYPE_CHECKING:
+    import paramiko
+
+# terminates each command's output in a `drain` batch; random so real output can't contain it
+_BATCH_SENTINEL = f"--remote-machine-{uuid.uuid4().hex}--"
+_BATCH_STDOUT_RE = re.compile(rf"\n{_BATCH_SENTINEL}(\d+)\n")
+_BATCH_STDERR_SEP = f"\n{_BATCH_SENTINEL}\n"
+_BATCH_MARKER = _BATCH_SENTINEL.encode()
+# how often a read on an exec or shell channel wakes up to drain stderr
+_CHANNEL_POLL = 0.1
+# how long a `drain` batch may run before the shell is dropped and its futures failed
+_BATCH_TIMEOUT = 300.0
 
 
 class SSHProtocol:
@@ -40,6 +57,12 @@ class SSHProtocol:
         self.password = password
         self.port = port
         self._client: paramiko.SSHClient | None = None
+        self._pending: list[tuple[str, RemoteState, Future]] = []
+        self._pending_lock = threading.Lock()
+        # one batch at a time on the shared shell, or concurrent scripts interleave
+        self._shell_lock = threading.Lock()
+        self._shell: paramiko.Channel | None = None
+        self.batch_timeout = _BATCH_TIMEOUT
 
     @property
     def is_connected(self) -> bool:
@@ -48,6 +71,8 @@ class SSHProtocol:
 
     def connect(self) -> None:
         """Establish SSH connection (imports paramiko lazily)."""
+        import paramiko
+
         try:
             self._client = paramiko.SSHClient()
             self._client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
@@ -71,6 +96,9 @@ class SSHProtocol:
 
     def disconnect(self) -> None:
         """Close SSH connection."""
+        if self._shell:
+            self._shell.close()
+            self._shell = None
         if self._client:
             self._client.close()
             self._client = None
@@ -92,18 +120,147 @@ class SSHProtocol:
         full_command = self._build_command(command, state)
 
         try:
-            _, stdout, stderr = self._client.exec_command(full_command)
-            exit_code = stdout.channel.recv_exit_status()
-
-            return CommandResult(
-                command=command,
-                stdout=stdout.read().decode("utf-8", errors="replace"),
-                stderr=stderr.read().decode("utf-8", errors="replace"),
-                exit_code=exit_code,
-            )
+            channel = self._client.get_transport().open_session()
+            out, err = bytearray(), bytearray()
+            try:
+                channel.exec_command(full_command)
+                channel.settimeout(_CHANNEL_POLL)
+                # read while the command runs; waiting for the exit status first can stall
+                # a command whose output doesn't fit in the channel window
+                while True:
+                    while channel.recv_stderr_ready():
+                        err += channel.recv_stderr(65536)
+                    try:
+                        chunk = channel.recv(65536)
+                    except socket.timeout:
+                        continue
+                    if not chunk:
+                        break
+                    out += chunk
+                # EOF covers both streams, so the rest of stderr is already buffered
+                for chunk in iter(lambda: channel.recv_stderr(65536), b""):
+                    err += chunk
+                exit_code = channel.recv_exit_status()
+            finally:
+                channel.close()
         except Exception as e:
             raise ConnectionError(f"Command execution failed  {command=:}") from e
 
+        return CommandResult(
+            command=command,
+            stdout=out.decode("utf-8", errors="replace"),
+            stderr=err.decode("utf-8", errors="replace"),
+            exit_code=exit_code,
+        )
+
+    def submit(self, command: str, state: RemoteState) -> Future:
+        """Queue `command` for the next `drain` and return a future for its CommandResult."""
+        future: Future = Future()
+        with self._pending_lock:
+            self._pending.append((command, state, future))
+        return future
+
+    def exec_pipelined(self, commands: list[str], state: RemoteState) -> list[CommandResult]:
+        """Run `commands` as one batch and return their results in order."""
+        futures = [self.submit(command, state) for command in commands]
+        self.drain()
+        return [future.result() for future in futures]
+
+    def drain(self) -> None:
+        """Run every submitted command in one batch and complete their futures.
+
+        Batches are written to a long-lived `sh` channel, so after the first
+        drain no new SSH session is opened. Each command runs in its own
+        subshell (so cwd/env don't leak between them and it can't read the
+        shell's stdin) and is followed by a sentinel line carrying its exit
+        status on stdout and a bare sentinel on stderr, which is how the
+        combined output is split back per command. A batch that doesn't finish
+        within `batch_timeout` seconds drops the shell and fails its futures.
+        """
+        with self._pending_lock:
+            pending, self._pending = self._pending, []
+        if not pending:
+            return
+        if not self._client:
+            error = ConnectionError("Not connected to remote machine")
+            for _, _, future in pending:
+                future.set_exception(error)
+            return
+
+        # newlines around each command keep a trailing `#` comment from eating the rest
+        script = "\n".join(
+            f"(\n{self._build_command(command, state)}\n) </dev/null\n"
+            f"printf '\\n%s%d\\n' '{_BATCH_SENTINEL}' $?\n"
+            f"printf '\\n%s\\n' '{_BATCH_SENTINEL}' >&2"
+            for command, state, _ in pending
+        )
+        try:
+            with self._shell_lock:
+                out, err = self._exec_persistent(script, len(pending))
+        except Exception as e:
+            error = ConnectionError(f"Batch execution failed ({len(pending)} commands)")
+            error.__cause__ = e
+            for _, _, future in pending:
+                future.set_exception(error)
+            return
+
+        # re.split with one group alternates output, exit code, output, ...
+        parts = _BATCH_STDOUT_RE.split(out)
+        errs = err.split(_BATCH_STDERR_SEP)
+        for i, (command, _, future) in enumerate(pending):
+            if 2 * i + 1 < len(parts):
+                stdout, exit_code = parts[2 * i], int(parts[2 * i + 1])
+            else:
+                # the script died before reaching this command
+                stdout, exit_code = "", -1
+            stderr = errs[i] if i < len(errs) else ""
+            future.set_result(
+                CommandResult(command=command, stdout=stdout, stderr=stderr, exit_code=exit_code)
+            )
+
+    def _shell_channel(self) -> paramiko.Channel:
+        """Return the persistent `sh` channel, opening a new one if it has gone away."""
+        if self._shell is None or self._shell.closed or self._shell.exit_status_ready():
+            channel = self._client.get_transport().open_session()
+            channel.exec_command("sh")
+            channel.settimeout(_CHANNEL_POLL)
+            self._shell = channel
+        return self._shell
+
+    def _exec_persistent(self, script: str, count: int) -> tuple[str, str]:
+        """Send `script` to the persistent shell and read both streams up to `count` sentinels."""
+        channel = self._shell_channel()
+        out, err = bytearray(), bytearray()
+        deadline = time.monotonic() + self.batch_timeout
+
+        def done(buf: bytearray) -> bool:
+            # the sentinel line is complete once its trailing newline arrived
+            return buf.count(_BATCH_MARKER) >= count and buf.endswith(b"\n")
+
+        try:
+            channel.sendall(script.encode() + b"\n")
+            while not (done(out) and done(err)):
+                # keep stderr drained so it can't exhaust the channel window
+                while channel.recv_stderr_ready():
+                    err += channel.recv_stderr(65536)
+                reading_out = not done(out)
+                try:
+                    chunk = channel.recv(65536) if reading_out else channel.recv_stderr(65536)
+                except socket.timeout:
+                    if time.monotonic() > deadline:
+                        raise TimeoutError(f"Batch did not finish in {self.batch_timeout}s")
+                    continue
+                if not chunk:
+                    raise ConnectionError("Remote shell closed during batch")
+                (out if reading_out else err).extend(chunk)
+        except BaseException:
+            # a half-read batch leaves the shell out of sync; start fresh next time
+            channel.close()
+            self._shell = None
+            raise
+
+        return out.decode("utf-8", errors="replace"), err.decode("utf-8", errors="replace")
+
     def _build_command(self, command: str, state: RemoteState) -> str:
         """Build full command with environment and cwd.
 
@@ -114,19 +271,7 @@ class SSHProtocol:
         Returns:
             Full command string
         """
-        parts = []
-
-        # Add environment variables
-        for key, value in state.env.items():
-            parts.append(f"export {key}='{value}'")
-
-        # Add cwd
-        parts.append(f"cd {state.cwd}")
-
-        # Add original command
-        parts.append(command)
-
-        return " && ".join(parts)
+        return f"{state.command_prefix()} && {command}"
 
     def run_command(self, command: str, state: RemoteState, thread: bool = False) -> str:
         """Execute a command and return stdout, handling errors.
@@ -0,0 +1,75 @@
+"""Cron expression utilities."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from functools import lru_cache
+
+_MONTH_NAMES = {
+    m: i for i, m in enumerate("JAN FEB MAR APR MAY JUN JUL AUG SEP OCT NOV DEC".split(), 1)
+}
+_DAY_NAMES = {d: i for i, d in enumerate("SUN MON TUE WED THU FRI SAT".split())}
+
+
+def _value(token: str, names: dict[str, int]) -> int:
+    upper = token.upper()
+    return names[upper] if upper in names else int(token)
+
+
+@lru_cache(maxsize=256)
+def compile_field(spec: str, lo: int, hi: int) -> int:
+    """Expand one cron field into a bitmask with bit N set when value N matches.
+
+    Supports `*`, `N`, `A-B`, `A,B,C`, a `/step` suffix on any of them, and
+    month/day names. Specs repeat heavily across crontabs, so results are cached.
+
+    Args:
+        spec: Field text (e.g. "*/15", "1-5", "MON-FRI")
+        lo: Lowest allowed value
+        hi: Highest allowed value
+
+    Returns:
+        Integer bitmask of matching values
+
+    Raises:
+        ValueError: If the spec is malformed or out of range
+    """
+    names = _MONTH_NAMES if hi == 12 else _DAY_NAMES if hi == 7 else {}
+    mask = 0
+    for item in spec.split(","):
+        item, _, step = item.partition("/")
+        step = int(step) if step else 1
+        if item == "*":
+            start, end = lo, hi
+        else:
+            first, sep, last = item.partition("-")
+            start = _value(first, names)
+            # "5/10" means every 10th value starting at 5
+            end = _value(last, names) if sep else (hi if step > 1 else start)
+        if step < 1 or not lo <= start <= end <= hi:
+            raise ValueError(f"Invalid cron field: {spec}")
+        for value in range(start, end + 1, step):
+            mask |= 1 << value
+    return mask
+
+
+def schedule_matches(
+    minute: str, hour: str, day_of_month: str, month: str, day_of_week: str, when: datetime
+) -> bool:
+    """Check whether a five-field cron schedule fires at `when` (minute resolution)."""
+    if not (
+        compile_field(minute, 0, 59) >> when.minute & 1
+        and compile_field(hour, 0, 23) >> when.hour & 1
+        and compile_field(month, 1, 12) >> when.month & 1
+    ):
+        return False
+
+    # cron counts Sunday as 0 and also accepts 7 for it
+    dow_mask = compile_field(day_of_week, 0, 7)
+    dow_hit = (dow_mask | dow_mask >> 7) >> (when.isoweekday() % 7) & 1
+    dom_hit = compile_field(day_of_month, 1, 31) >> when.day & 1
+
+    # when both day fields are restricted, either one matching is enough
+    if day_of_month.startswith("*") or day_of_week.startswith("*"):
+        return bool(dom_hit and dow_hit)
+    return bool(dom_hit or dow_hit)
@@ -1,31 +1,37 @@
-from remote_machine.models.filesystem_types import PermissionBits, Permissions
+from itertools import product
+
+from remote_machine.models.filesystem_types import Permissions
+
+_TYPE_MAP = {
+    "-": "file",
+    "d": "dir",
+    "l": "symlink",
+    "c": "char_device",
+    "b": "block_device",
+    "s": "socket",
+    "p": "fifo",
+}
+
+# every "rwx"-style triplet ls can print, mapped to its octal digit (s/t imply execute)
+_TRIPLETS = {
+    r + w + x: (r == "r") << 2 | (w == "w") << 1 | (x in "xst")
+    for r, w, x in product("r-", "w-", "xsStT-")
+}
+
+
+def _triplet(chunk: str) -> int:
+    bits = _TRIPLETS.get(chunk)
+    if bits is None:
+        bits = (chunk[0] == "r") << 2 | (chunk[1] == "w") << 1 | (chunk[2] in ("x", "s", "t"))
+    return bits
 
 
 def parse_permissions(perms: str) -> Permissions:
     if len(perms) < 10:
         raise ValueError(f"Invalid permission string: {perms}")
 
-    type_map = {
-        "-": "file",
-        "d": "dir",
-        "l": "symlink",
-        "c": "char_device",
-        "b": "block_device",
-        "s": "socket",
-        "p": "fifo",
-    }
-
-    def bits(chunk: str) -> PermissionBits:
-        return PermissionBits(
-            read=chunk[0] == "r",
-            write=chunk[1] == "w",
-            execute=chunk[2] in ("x", "s", "t"),  # handles suid/sticky
-        )
-
     return Permissions(
-        entry_type=type_map.get(perms[0], "unknown"),
-        owner=bits(perms[1:4]),
-        group=bits(perms[4:7]),
-        others=bits(perms[7:10]),
+        entry_type=_TYPE_MAP.get(perms[0], "unknown"),
+        mode=_triplet(perms[1:4]) << 6 | _triplet(perms[4:7]) << 3 | _triplet(perms[7:10]),
         raw=perms,
     )
@@ -1,6 +1,6 @@
 """Path resolution utilities."""
 
-from pathlib import PurePosixPath
+import posixpath
 
 
 class PathResolver:
@@ -17,17 +17,9 @@ class PathResolver:
         Returns:
             Absolute path
         """
-        p = PurePosixPath(path)
-
-        if p.is_absolute():
-            return str(p)
-
-        # Relative path - resolve against cwd
-        base = PurePosixPath(cwd)
-        resolved = base / p
-
-        # Normalize path components (handle .. and . lexically)
-        return PathResolver.normalize(str(resolved))
+        if not posixpath.isabs(path):
+            path = f"{cwd}/{path}"
+        return PathResolver.normalize(path)
 
     @staticmethod
     def normalize(path: str) -> str:
@@ -39,26 +31,8 @@ class PathResolver:
         Returns:
             Normalized path
         """
-        p = PurePosixPath(path)
-        parts = p.parts
-        is_abs = path.startswith("/")
-        stack: list[str] = []
-        for part in parts:
-            # Skip empty and current-dir markers
-            if part in ("", "."):
-                continue
-            # Skip root token produced by PurePosixPath.parts
-            if part == "/":
-                continue
-            if part == "..":
-                if stack and stack[-1] != "..":
-                    stack.pop()
-                else:
-                    if not is_abs:
-                        stack.append("..")
-                continue
-            stack.append(part)
-
-        if is_abs:
-            return "/" + "/".join(stack)
-        return "/".join(stack) or "."
+        normalized = posixpath.normpath(path)
+        # POSIX lets normpath keep exactly two leading slashes; collapse them like any other run
+        if normalized.startswith("//"):
+            return normalized[1:]
+        return normalized
@@ -1,5 +1,21 @@
-import os
-import sys
+import importlib
 
-# Ensure package root is on sys.path for tests in this environment
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+import pytest
+
+
+@pytest.fixture
+def patch_parsers(monkeypatch):
+    """Swap the linux_parsers callables an action module bound at import.
+
+    ``patch_parsers("remote_machine.actions.net", parse_ip_a=fake)`` returns
+    the (already imported) action module with ``fake`` in place for the
+    current test only, so nothing has to be stubbed in sys.modules or reloaded.
+    """
+
+    def patch(module: str, **parsers):
+        mod = importlib.import_module(module)
+        for name, func in parsers.items():
+            monkeypatch.setattr(mod, name, func)
+        return mod
+
+    return patch
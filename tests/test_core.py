@@ -1,8 +1,24 @@
 """Unit tests for RemoteState and PathResolver."""
 
+import ast
+import copy
+import importlib
+import inspect
+import pickle
+import threading
+from datetime import datetime
+
 import pytest
 from remote_machine.types import RemoteState, CommandResult
+from remote_machine.models.cron_types import CronJob
+from remote_machine.models.device_types import MountPoint, SMARTAttribute
+from remote_machine.models.docker_types import Container
+from remote_machine.models.network_types import TCPConnection
+from remote_machine.models.process_types import ProcessInfo
+from remote_machine.models.proxy_types import Proxy
 from remote_machine.utils import PathResolver
+from remote_machine.core import RemoteMachine
+from remote_machine.actions import SYSAction
 
 
 class TestRemoteState:
@@ -34,33 +50,69 @@ class TestRemoteState:
         copy.env["DEBUG"] = "0"
         assert state.env["DEBUG"] == "1"
 
+    def test_command_prefix_follows_env_and_cwd(self):
+        """Test the command prefix reflects in-place env and cwd changes."""
+        state = RemoteState(cwd="/srv", env={"A": "1"})
+        assert state.command_prefix() == "export A=1 && cd /srv"
+
+        state.env["B"] = "2"
+        assert state.command_prefix() == "export A=1 && export B=2 && cd /srv"
+        state.cwd = "/tmp"
+        assert state.command_prefix().endswith("cd /tmp")
+
+    def test_command_prefix_quotes_values(self):
+        """Test env values and cwd are shell-quoted."""
+        state = RemoteState(cwd="/srv/my app", env={"MSG": "it's $HOME"})
+        assert state.command_prefix() == "export MSG='it'\"'\"'s $HOME' && cd '/srv/my app'"
+
+    def test_state_copy_shares_proxies(self):
+        """Test that copies get their own proxy list but share the Proxy objects."""
+        proxy = Proxy("127.0.0.1", 8080, "db", 5432, "forward")
+        state = RemoteState(proxies=[proxy])
+        copy = state.copy()
+
+        copy.proxies.clear()
+        assert state.proxies == [proxy]
+        assert state.copy().proxies[0] is proxy
+
+    def test_deepcopy_shares_live_proxies(self):
+        """Test deepcopy doesn't try to duplicate a running proxy's thread."""
+        proxy = Proxy("127.0.0.1", 8080, "db", 5432, "forward")
+        proxy._thread = threading.Thread(target=lambda: None)
+        state = RemoteState(proxies=[proxy])
+
+        assert copy.deepcopy(state).proxies[0] is proxy
+
+
+@pytest.fixture(scope="class")
+def resolver():
+    return PathResolver()
+
 
 class TestPathResolver:
     """Tests for PathResolver."""
 
-    def test_absolute_path(self):
-        """Test resolution of absolute paths."""
-        resolver = PathResolver()
-        assert resolver.resolve("/var/log", "/home") == "/var/log"
-        assert resolver.resolve("/etc/passwd") == "/etc/passwd"
-
-    def test_relative_path(self):
-        """Test resolution of relative paths."""
-        resolver = PathResolver()
-        assert resolver.resolve("logs", "/var") == "/var/logs"
-        assert resolver.resolve(".", "/home") == "/home"
-
-    def test_parent_directory(self):
-        """Test resolution with parent directory (..)."""
-        resolver = PathResolver()
-        assert resolver.resolve("..", "/var/log") == "/var"
-        assert resolver.resolve("../etc", "/var/log") == "/var/etc"
-
-    def test_normalize(self):
+    @pytest.mark.parametrize(
+        "path,cwd,expected",
+        [
+            ("/var/log", "/home", "/var/log"),
+            ("/etc/passwd", "/", "/etc/passwd"),
+            ("logs", "/var", "/var/logs"),
+            (".", "/home", "/home"),
+            ("..", "/var/log", "/var"),
+            ("../etc", "/var/log", "/var/etc"),
+        ],
+    )
+    def test_resolve(self, resolver, path, cwd, expected):
+        """Test resolution of absolute, relative and parent paths."""
+        assert resolver.resolve(path, cwd) == expected
+
+    @pytest.mark.parametrize(
+        "path,expected", [("/var/./log", "/var/log"), ("/var/log/", "/var/log")]
+    )
+    def test_normalize(self, resolver, path, expected):
         """Test path normalization."""
-        resolver = PathResolver()
-        assert resolver.normalize("/var/./log") == "/var/log"
-        assert resolver.normalize("/var/log/") == "/var/log"
+        assert resolver.normalize(path) == expected
 
 
 class TestCommandResult:
@@ -80,3 +132,90 @@ class TestCommandResult:
         repr_str = repr(result)
         assert "CommandResult" in repr_str
         assert "exit_code=0" in repr_str
+
+
+@pytest.mark.parametrize(
+    "record",
+    [
+        CommandResult(command="ls -l", stdout="file.txt", stderr="", exit_code=0),
+        ProcessInfo(42, 1, "sshd", "S", "root", 0.5, 1.0, 2048, 4096, 1700000000, "sshd -D"),
+        CronJob("*/5", "*", "*", "*", "*", "backup.sh", None),
+        Container(
+            "abc123", "web", "nginx", "Up", "running", datetime(2024, 1, 20), None, [], "nginx"
+        ),
+        TCPConnection("10.0.0.1", 22, "10.0.0.2", 50000, "ESTABLISHED", 1234, "sshd"),
+        MountPoint("/dev/sda1", "/", "ext4", 1000, 400, 600, 40.0, "rw,relatime"),
+        SMARTAttribute(5, "Reallocated_Sector_Ct", 100, 100, 10, "ok"),
+    ],
+    ids=lambda record: type(record).__name__,
+)
+def test_record_pickle_round_trip(record):
+    clone = pickle.loads(pickle.dumps(record))
+
+    assert clone == record
+    assert type(clone) is type(record)
+
+
+def test_tcp_connection_hashes_on_socket_tuple():
+    conn = TCPConnection("10.0.0.1", 22, "10.0.0.2", 50000, "ESTABLISHED", 1234, "sshd")
+    closing = TCPConnection("10.0.0.1", 22, "10.0.0.2", 50000, "TIME-WAIT", None, None)
+
+    assert hash(conn) == hash(closing) and conn != closing
+    assert {conn, closing, pickle.loads(pickle.dumps(conn))} == {conn, closing}
+    assert "_hash" not in repr(conn)
+
+
+class TestRemoteMachine:
+    """Tests for RemoteMachine."""
+
+    def test_actions_are_created_lazily(self):
+        """Test action attributes are built on first access and then reused."""
+        machine = RemoteMachine(host="example.com", user="root")
+
+        assert "sys" not in vars(machine)
+        assert isinstance(machine.sys, SYSAction)
+        assert machine.sys is machine.sys
+        assert machine.sys.state is machine.state
+
+    def test_unknown_attribute(self):
+        """Test unknown attributes still raise AttributeError."""
+        machine = RemoteMachine(host="example.com", user="root")
+
+        with pytest.raises(AttributeError):
+            machine.not_an_action
+
+    def test_disconnect_closes_sftp_channel(self):
+        """Test the SFTP channel is kept across transfers and closed on disconnect."""
+        machine = RemoteMachine(host="example.com", user="root")
+        machine.expand_scp()
+        scp = machine.protocol("scp")
+
+        class FakeSFTP:
+            closed = False
+
+            def close(self):
+                self.closed = True
+
+        sftp = scp._sftp_client = FakeSFTP()
+        machine.disconnect()
+
+        assert sftp.closed
+        assert scp._sftp_client is None
+
+
+@pytest.mark.parametrize("package", ["remote_machine.models", "remote_machine.protocols"])
+def test_type_checking_imports_match_lazy_names(package):
+    """Every lazily loaded name is also imported for static checkers."""
+    module = importlib.import_module(package)
+    block = next(
+        node
+        for node in ast.parse(inspect.getsource(module)).body
+        if isinstance(node, ast.If) and ast.unparse(node.test) == "TYPE_CHECKING"
+    )
+    imported = {
+        alias.name: node.module.rsplit(".", 1)[1]
+        for node in block.body
+        if isinstance(node, ast.ImportFrom)
+        for alias in node.names
+    }
+    assert imported == module._LAZY
@@ -0,0 +1,40 @@
+"""Unit tests for cron schedule matching."""
+
+from datetime import datetime
+
+import pytest
+
+from remote_machine.models.cron_types import CronJob, CronSchedule
+from remote_machine.utils.cron_utils import compile_field
+
+
+def test_compile_field_expands_specs():
+    assert compile_field("*", 0, 59) == (1 << 60) - 1
+    assert compile_field("*/15", 0, 59) == 1 | 1 << 15 | 1 << 30 | 1 << 45
+    assert compile_field("1-3,5", 1, 31) == 0b101110
+    assert compile_field("10-20/5", 0, 59) == 1 << 10 | 1 << 15 | 1 << 20
+    assert compile_field("MON-FRI", 0, 7) == 0b111110
+    assert compile_field("jan,Dec", 1, 12) == 1 << 1 | 1 << 12
+
+
+@pytest.mark.parametrize("spec", ["60", "5-1", "*/0", "x", "1-"])
+def test_compile_field_rejects_invalid(spec):
+    with pytest.raises(ValueError):
+        compile_field(spec, 0, 59)
+
+
+def test_job_matches():
+    job = CronJob("*/5", "2", "*", "*", "1-5", "backup.sh", None)
+
+    # 2024-03-04 is a Monday
+    assert job.matches(datetime(2024, 3, 4, 2, 10))
+    assert not job.matches(datetime(2024, 3, 4, 2, 11))
+    assert not job.matches(datetime(2024, 3, 3, 2, 10))
+
+
+def test_schedule_day_fields_are_ored_when_both_restricted():
+    schedule = CronSchedule("0", "0", "1", "*", "7", "")
+
+    assert schedule.matches(datetime(2024, 3, 1, 0, 0))  # Friday the 1st
+    assert schedule.matches(datetime(2024, 3, 3, 0, 0))  # Sunday
+    assert not schedule.matches(datetime(2024, 3, 4, 0, 0))
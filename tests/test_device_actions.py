@@ -1,15 +1,20 @@
 """Tests for DeviceAction linux_parsers usage."""
 
-import sys
-import types
+from types import MappingProxyType
+from typing import Mapping
+
+import pytest
 
 from remote_machine.actions.device import DeviceAction
 from remote_machine.models.remote_state import RemoteState
 from remote_machine.models.command_result import CommandResult
 
+# DeviceAction binds parse_mount at import, so tests swap it via patch_parsers
+DEVICE_MODULE = "remote_machine.actions.device"
+
 
 class FakeProtocol:
-    def __init__(self, responses: dict[str, str]):
+    def __init__(self, responses: Mapping[str, str]):
         self.responses = responses
 
     def exec(self, command: str, state: RemoteState) -> CommandResult:
@@ -18,43 +23,54 @@ class FakeProtocol:
                 return CommandResult(command=command, stdout=out, stderr="", exit_code=0)
         return CommandResult(command=command, stdout="", stderr="", exit_code=0)
 
+    def run_command(self, command: str, state: RemoteState = None) -> str:
+        return self.exec(command, state).stdout
 
-def test_mounted_uses_parser(monkeypatch):
-    mount_mod = types.ModuleType("linux_parsers.parsers.filesystem.mount")
 
-    def parse_mount(text: str):
-        return [{"device": "/dev/sda1", "mount_point": "/", "fstype": "ext4", "options": "rw"}]
+# read-only so every test can share the same response map
+_MOUNT_RESPONSES = MappingProxyType({"/proc/mounts": "/dev/sda1 / ext4 rw,relatime 0 0\n"})
 
-    mount_mod.parse = parse_mount
-    # ensure package hierarchy
-    monkeypatch.setitem(sys.modules, "linux_parsers", types.ModuleType("linux_parsers"))
-    monkeypatch.setitem(sys.modules, "linux_parsers.parsers.filesystem.mount", mount_mod)
 
-    proto = FakeProtocol({"/proc/mounts": "/dev/sda1 / ext4 rw,relatime 0 0\n"})
+def test_mounted_uses_parser(patch_parsers):
+    patch_parsers(
+        DEVICE_MODULE,
+        parse_mount=lambda out: [
+            {
+                "device": "/dev/sda1",
+                "mount_point": "/",
+                "filesystem_type": "ext4",
+                "mount_options": ["rw", "relatime"],
+                "dump": "0",
+                "pass": "0",
+            }
+        ],
+    )
+    proto = FakeProtocol(_MOUNT_RESPONSES)
     d = DeviceAction(proto, RemoteState())
 
     mounts = d.mounted()
     assert mounts.mount_points[0].mount_point == "/"
+    assert mounts.mount_points[0].fstype == "ext4"
+    assert mounts.options("/") == "rw,relatime"
 
 
-def test_list_block_json_and_fallback(monkeypatch):
-    proto = FakeProtocol(
+@pytest.mark.parametrize(
+    "responses",
+    [
         {
-            "lsblk -J": '{"blockdevices": [{"name": "sda", "type": "disk", "children": [{"name": "sda1", "type": "part", "mountpoint": "/"}]}]}'
-        }
-    )
-    d = DeviceAction(proto, RemoteState())
-
-    devs = d.list_block()
-    assert any(d.name == "sda" for d in devs)
-
-    # fallback to /proc/partitions
-    proto2 = FakeProtocol(
+            "lsblk -J": '{"blockdevices": [{"name": "sda", "type": "disk", "children": '
+            '[{"name": "sda1", "type": "part", "mountpoint": "/"}]}]}'
+        },
+        # fallback to /proc/partitions
         {
             "lsblk -J": "",
             "cat /proc/partitions": "major minor  #blocks  name\n   8 0 488386584 sda\n",
-        }
-    )
-    d2 = DeviceAction(proto2, RemoteState())
-    devs2 = d2.list_block()
-    assert any(d.name == "sda" for d in devs2)
+        },
+    ],
+    ids=["lsblk_json", "proc_partitions"],
+)
+def test_list_block_json_and_fallback(responses):
+    d = DeviceAction(FakeProtocol(responses), RemoteState())
+
+    devs = d.list_block()
+    assert any(dev.name == "sda" for dev in devs)
@@ -1,5 +1,8 @@
 """Error mapping and exception tests."""
 
+import pickle
+import re
+
 import pytest
 from remote_machine.types import CommandResult
 from remote_machine.errors import (
@@ -23,59 +26,49 @@ class TestErrorMapper:
         # Should not raise
         ErrorMapper.map_result(result)
 
-    def test_permission_denied(self):
-        """Test PermissionDenied mapping."""
-        result = CommandResult(
-            command="cat /root/secret",
-            stdout="",
-            stderr="cat: /root/secret: Permission denied",
-            exit_code=1,
-        )
-
-        with pytest.raises(PermissionDenied):
+    @pytest.mark.parametrize(
+        "command,stderr,exit_code,exc",
+        [
+            ("cat /root/secret", "cat: /root/secret: Permission denied", 1, PermissionDenied),
+            ("cat /nonexistent", "cat: /nonexistent: No such file or directory", 2, NotFound),
+            (
+                "mkdir /tmp/test",
+                "mkdir: cannot create directory '/tmp/test': File exists",
+                1,
+                AlreadyExists,
+            ),
+            ("sleep 100", "Command timed out", 124, Timeout),
+            ("ls -X", "ls: invalid option -- 'X'", 2, InvalidArgument),
+        ],
+        ids=["permission_denied", "not_found", "already_exists", "timeout", "invalid_argument"],
+    )
+    def test_maps_to_exception(self, command, stderr, exit_code, exc):
+        """Test that stderr and exit code select the exception type."""
+        result = CommandResult(command=command, stdout="", stderr=stderr, exit_code=exit_code)
+
+        with pytest.raises(exc, match=re.escape(command)) as info:
             ErrorMapper.map_result(result)
+        assert info.value.result == result
 
-    def test_not_found(self):
-        """Test NotFound mapping."""
-        result = CommandResult(
-            command="cat /nonexistent",
-            stdout="",
-            stderr="cat: /nonexistent: No such file or directory",
-            exit_code=2,
-        )
+    def test_error_pickle_keeps_result(self):
+        """Test that slotted exceptions keep message and result across pickling."""
+        result = CommandResult(command="ls /x", stdout="", stderr="No such file", exit_code=2)
+        error = pickle.loads(pickle.dumps(NotFound("missing", result)))
 
-        with pytest.raises(NotFound):
-            ErrorMapper.map_result(result)
+        assert isinstance(error, NotFound)
+        assert error.message == "missing"
+        assert error.result == result
 
-    def test_already_exists(self):
-        """Test AlreadyExists mapping."""
-        result = CommandResult(
-            command="mkdir /tmp/test",
-            stdout="",
-            stderr="mkdir: cannot create directory '/tmp/test': File exists",
-            exit_code=1,
-        )
-
-        with pytest.raises(AlreadyExists):
-            ErrorMapper.map_result(result)
+    def test_error_pickle_keeps_instance_dict(self):
+        """Test that notes and extra attributes survive pickling."""
+        error = NotFound("x")
+        error.__notes__ = ["ctx"]  # what add_note() does on 3.11+
+        error.extra = 1
 
-    def test_timeout(self):
-        """Test Timeout mapping."""
-        result = CommandResult(
-            command="sleep 100", stdout="", stderr="Command timed out", exit_code=124
-        )
+        restored = pickle.loads(pickle.dumps(error))
 
-        with pytest.raises(Timeout):
-            ErrorMapper.map_result(result)
-
-    def test_invalid_argument(self):
-        """Test InvalidArgument mapping."""
-        result = CommandResult(
-            command="ls -X", stdout="", stderr="ls: invalid option -- 'X'", exit_code=2
-        )
-
-        with pytest.raises(InvalidArgument):
-            ErrorMapper.map_result(result)
+        assert restored.__notes__ == ["ctx"]
+        assert restored.extra == 1
 
     def test_command_error_has_result(self):
         """Test that CommandError exceptions include the result."""
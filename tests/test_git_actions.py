@@ -1,14 +1,78 @@
 """Tests for Git actions."""
 
+import re
+
 import pytest
-from unittest.mock import Mock
-from datetime import datetime
 
 from remote_machine.actions.git import GitAction
 from remote_machine.models.remote_state import RemoteState
 from remote_machine.models.command_result import CommandResult
 
 
+def _ok(stdout: str) -> CommandResult:
+    return CommandResult(command="", stdout=stdout, stderr="", exit_code=0)
+
+
+# CommandResult is frozen, so one instance per canned response is shared by every call
+_EMPTY = _ok("")
+
+# the actions only pass state through to the fake, so tests can share one
+_DEFAULT_STATE = RemoteState()
+
+
+def _git(subcommand: str) -> re.Pattern:
+    """Match a git command line by subcommand, with or without `-C <path>`."""
+    return re.compile(rf"^git (?:-C \S+ )?{subcommand}")
+
+
+# responses per command pattern, first match wins
+_GIT_RESPONSES = (
+    (_git(r"rev-parse --abbrev-ref HEAD"), _ok("main\n")),
+    (_git(r"rev-parse HEAD"), _ok("abc123def456789abcdef\n")),
+    (_git(r"diff --name-only"), _ok("file1.py\nfile2.py\n")),
+    (_git(r"ls-files --others"), _ok("untracked1.py\nuntracked2.py\n")),
+    (_git(r"diff --cached --name-only"), _ok("staged1.py\n")),
+    (_git(r"rev-list --left-right --count"), _ok("2 3\n")),
+    (
+        _git(r"log .*--format="),
+        _ok("abc123def456789abcdef\nabc123\nJohn Doe\njohn@example.com\n2024-01-20T10:00:00Z\nInitial commit\n---\ndef456abc789def456abc\ndef456\nJane Smith\njane@example.com\n2024-01-19T10:00:00Z\nAdd feature X\n---\n"),
+    ),
+    (_git(r"branch -a$"), _ok("* main\n  develop\n  feature/new-feature\n")),
+    (
+        _git(r"remote -v"),
+        _ok("origin\thttps://github.com/user/repo.git (fetch)\norigin\thttps://github.com/user/repo.git (push)\nupstream\thttps://github.com/upstream/repo.git (fetch)\n"),
+    ),
+    (
+        _git(r"clone"),
+        _ok("Cloning into 'repo'...\nremote: Counting objects: 100%, done.\n"),
+    ),
+    (
+        _git(r"commit"),
+        _ok("[main abc123d] Add feature X\n 1 file changed, 10 insertions(+), 5 deletions(-)"),
+    ),
+    (_git(r"add"), _EMPTY),
+    (
+        _git(r"push"),
+        _ok("Counting objects: 3, done.\nDelta compression using up to 8 threads.\nTo https://github.com/user/repo.git\n   abc123d..def456e  main -> main"),
+    ),
+    (
+        _git(r"pull"),
+        _ok("From https://github.com/user/repo.git\n   abc123d..def456e  main       -> origin/main\nUpdating abc123d..def456e\nFast-forward\n file.py | 10 ++++++++--\n 1 file changed, 8 insertions(+), 2 deletions(-)"),
+    ),
+    (_git(r"checkout"), _ok("Switched to branch 'develop'\n")),
+    (_git(r"branch -[dD]"), _ok("Deleted branch feature/test (was abc123d).\n")),
+    (_git(r"branch"), _EMPTY),
+    (
+        _git(r"diff --numstat"),
+        _ok("10\t2\tfile1.py\n4\t1\tfile2.py\n-\t-\tlogo.png\n"),
+    ),
+    (
+        _git(r"diff"),
+        _ok("diff --git a/file.py b/file.py\nindex abc123..def456 100644\n--- a/file.py\n+++ b/file.py\n@@ -1,5 +1,6 @@\n def hello():\n     print('Hello')\n+    print('World')\n"),
+    ),
+)
+
+
 class FakeProtocol:
     """Fake SSH protocol for testing."""
 
@@ -17,163 +81,24 @@ class FakeProtocol:
 
     def exec(self, command: str, state: RemoteState) -> CommandResult:
         self.commands.append(command)
+        for pattern, response in _GIT_RESPONSES:
+            if pattern.search(command):
+                return response
+        return _EMPTY
 
-        # Mock git status - branch
-        if "rev-parse --abbrev-ref HEAD" in command:
-            return CommandResult(exit_code=0, stdout="main\n", stderr="")
-
-        # Mock git status - commit hash
-        if "rev-parse HEAD" in command:
-            return CommandResult(
-                exit_code=0,
-                stdout="abc123def456789abcdef\n",
-                stderr="",
-            )
-
-        # Mock git diff (modified files)
-        if "diff --name-only" in command and "--cached" not in command:
-            return CommandResult(
-                exit_code=0,
-                stdout="file1.py\nfile2.py\n",
-                stderr="",
-            )
-
-        # Mock git ls-files (untracked files)
-        if "ls-files --others" in command:
-            return CommandResult(
-                exit_code=0,
-                stdout="untracked1.py\nuntracked2.py\n",
-                stderr="",
-            )
-
-        # Mock git diff --cached (staged files)
-        if "diff --cached --name-only" in command:
-            return CommandResult(
-                exit_code=0,
-                stdout="staged1.py\n",
-                stderr="",
-            )
-
-        # Mock git rev-list (ahead/behind)
-        if "rev-list --left-right --count" in command:
-            return CommandResult(
-                exit_code=0,
-                stdout="2 3\n",
-                stderr="",
-            )
-
-        # Mock git log
-        if "git log" in command and "--format=" in command:
-            return CommandResult(
-                exit_code=0,
-                stdout="abc123def456789abcdef\nabc123\nJohn Doe\njohn@example.com\n2024-01-20T10:00:00Z\nInitial commit\n---\ndef456abc789def456abc\ndef456\nJane Smith\njane@example.com\n2024-01-19T10:00:00Z\nAdd feature X\n---\n",
-                stderr="",
-            )
-
-        # Mock git branch
-        if (
-            "branch" in command
-            and "-a" not in command
-            and "create" not in command
-            and "delete" not in command
-        ):
-            return CommandResult(
-                exit_code=0,
-                stdout="* main\n  develop\n  feature/new-feature\n",
-                stderr="",
-            )
-
-        # Mock git remote -v
-        if "remote -v" in command:
-            return CommandResult(
-                exit_code=0,
-                stdout="origin\thttps://github.com/user/repo.git (fetch)\norigin\thttps://github.com/user/repo.git (push)\nupstream\thttps://github.com/upstream/repo.git (fetch)\n",
-                stderr="",
-            )
-
-        # Mock git clone
-        if "git clone" in command:
-            return CommandResult(
-                exit_code=0,
-                stdout="Cloning into 'repo'...\nremote: Counting objects: 100%, done.\n",
-                stderr="",
-            )
-
-        # Mock git commit
-        if "git commit" in command:
-            return CommandResult(
-                exit_code=0,
-                stdout="[main abc123d] Add feature X\n 1 file changed, 10 insertions(+), 5 deletions(-)",
-                stderr="",
-            )
-
-        # Mock git add
-        if "git add" in command:
-            return CommandResult(exit_code=0, stdout="", stderr="")
-
-        # Mock git push
-        if "git push" in command:
-            return CommandResult(
-                exit_code=0,
-                stdout="Counting objects: 3, done.\nDelta compression using up to 8 threads.\nTo https://github.com/user/repo.git\n   abc123d..def456e  main -> main",
-                stderr="",
-            )
-
-        # Mock git pull
-        if "git pull" in command:
-            return CommandResult(
-                exit_code=0,
-                stdout="From https://github.com/user/repo.git\n   abc123d..def456e  main       -> origin/main\nUpdating abc123d..def456e\nFast-forward\n file.py | 10 ++++++++--\n 1 file changed, 8 insertions(+), 2 deletions(-)",
-                stderr="",
-            )
-
-        # Mock git checkout
-        if "git checkout" in command:
-            return CommandResult(
-                exit_code=0,
-                stdout="Switched to branch 'develop'\n",
-                stderr="",
-            )
-
-        # Mock git branch create
-        if "git branch" in command and "-D" not in command and "-d" not in command:
-            return CommandResult(exit_code=0, stdout="", stderr="")
-
-        # Mock git branch delete
-        if "git branch" in command and ("-D" in command or "-d" in command):
-            return CommandResult(
-                exit_code=0,
-                stdout="Deleted branch feature/test (was abc123d).\n",
-                stderr="",
-            )
-
-        # Mock git diff
-        if "git diff" in command and "--stat" not in command:
-            return CommandResult(
-                exit_code=0,
-                stdout="diff --git a/file.py b/file.py\nindex abc123..def456 100644\n--- a/file.py\n+++ b/file.py\n@@ -1,5 +1,6 @@\n def hello():\n     print('Hello')\n+    print('World')\n",
-                stderr="",
-            )
-
-        # Mock git diff --stat
-        if "git diff --stat" in command:
-            return CommandResult(
-                exit_code=0,
-                stdout=" file1.py | 10 ++++++++--\n file2.py |  5 ++++-\n file3.py |  2 +-\n 3 files changed, 14 insertions(+), 3 deletions(-)\n",
-                stderr="",
-            )
-
-        # Default
-        return CommandResult(exit_code=0, stdout="", stderr="")
-
-
-def test_git_status():
-    """Test getting repository status."""
-    protocol = FakeProtocol()
-    state = RemoteState()
-    action = GitAction(protocol, state)
+    def run_command(self, command: str, state: RemoteState = None) -> str:
+        return self.exec(command, state).stdout
 
-    status = action.status()
+
+@pytest.fixture
+def git_action():
+    """A GitAction wired to a fresh FakeProtocol."""
+    return GitAction(FakeProtocol(), _DEFAULT_STATE)
+
+
+def test_git_status(git_action):
+    """Test getting repository status."""
+    status = git_action.status()
 
     assert status.branch == "main"
     assert status.commit_hash == "abc123def456789abcdef"
@@ -183,13 +108,9 @@ def test_git_status():
     assert status.is_dirty is True
 
 
-def test_git_log():
+def test_git_log(git_action):
     """Test getting commit log."""
-    protocol = FakeProtocol()
-    state = RemoteState()
-    action = GitAction(protocol, state)
-
-    commits = action.log(limit=10)
+    commits = git_action.log(limit=10)
 
     assert len(commits) == 2
     assert commits[0].hash == "abc123def456789abcdef"
@@ -198,13 +119,9 @@ def test_git_log():
     assert commits[0].message == "Initial commit"
 
 
-def test_git_list_branches():
+def test_git_list_branches(git_action):
     """Test listing branches."""
-    protocol = FakeProtocol()
-    state = RemoteState()
-    action = GitAction(protocol, state)
-
-    branches = action.list_branches()
+    branches = git_action.list_branches()
 
     assert len(branches) == 3
     assert branches[0].name == "main"
@@ -213,136 +130,56 @@ def test_git_list_branches():
     assert branches[2].name == "feature/new-feature"
 
 
-def test_git_list_remotes():
+def test_git_list_remotes(git_action):
     """Test listing remotes."""
-    protocol = FakeProtocol()
-    state = RemoteState()
-    action = GitAction(protocol, state)
-
-    remotes = action.list_remotes()
+    remotes = git_action.list_remotes()
 
     assert len(remotes) >= 1
     assert remotes[0].name == "origin"
     assert "github.com" in remotes[0].url
 
 
-def test_git_clone():
-    """Test cloning a repository."""
-    protocol = FakeProtocol()
-    state = RemoteState()
-    action = GitAction(protocol, state)
-
-    result = action.clone(
-        repository_url="https://github.com/user/repo.git",
-        target_path="/tmp/repo",
-    )
+@pytest.mark.parametrize(
+    "method,kwargs,needle",
+    [
+        (
+            "clone",
+            {"repository_url": "https://github.com/user/repo.git", "target_path": "/tmp/repo"},
+            "cloned",
+        ),
+        ("commit", {"message": "Add feature X"}, "add feature x"),
+        ("add", {"paths": ["file1.py", "file2.py"]}, "staged"),
+        ("push", {"remote": "origin", "branch": "main"}, ""),
+        ("pull", {"remote": "origin"}, ""),
+        ("checkout", {"ref": "develop"}, "develop"),
+        ("create_branch", {"branch_name": "feature/new-feature"}, "created"),
+        ("delete_branch", {"branch_name": "feature/test", "force": False}, ""),
+    ],
+)
+def test_git_simple_ops(git_action, method, kwargs, needle):
+    """Test repository operations that only report success."""
+    result = getattr(git_action, method)(**kwargs)
 
     assert result.success is True
-    assert "cloned" in result.message.lower()
-
+    assert needle in result.message.lower()
 
-def test_git_commit():
-    """Test committing changes."""
-    protocol = FakeProtocol()
-    state = RemoteState()
-    action = GitAction(protocol, state)
 
-    result = action.commit(message="Add feature X")
-
-    assert result.success is True
-    assert "Add feature X" in result.message or "changed" in result.message
-
-
-def test_git_add():
-    """Test adding files for commit."""
-    protocol = FakeProtocol()
-    state = RemoteState()
-    action = GitAction(protocol, state)
-
-    result = action.add(paths=["file1.py", "file2.py"])
-
-    assert result.success is True
-    assert "staged" in result.message.lower()
-
-
-def test_git_push():
-    """Test pushing commits."""
-    protocol = FakeProtocol()
-    state = RemoteState()
-    action = GitAction(protocol, state)
-
-    result = action.push(remote="origin", branch="main")
-
-    assert result.success is True
-
-
-def test_git_pull():
-    """Test pulling changes."""
-    protocol = FakeProtocol()
-    state = RemoteState()
-    action = GitAction(protocol, state)
-
-    result = action.pull(remote="origin")
-
-    assert result.success is True
-
-
-def test_git_checkout():
-    """Test checking out a branch."""
-    protocol = FakeProtocol()
-    state = RemoteState()
-    action = GitAction(protocol, state)
-
-    result = action.checkout(ref="develop")
-
-    assert result.success is True
-    assert "develop" in result.message
-
-
-def test_git_create_branch():
-    """Test creating a new branch."""
-    protocol = FakeProtocol()
-    state = RemoteState()
-    action = GitAction(protocol, state)
-
-    result = action.create_branch(branch_name="feature/new-feature")
-
-    assert result.success is True
-    assert "created" in result.message.lower()
-
-
-def test_git_delete_branch():
-    """Test deleting a branch."""
-    protocol = FakeProtocol()
-    state = RemoteState()
-    action = GitAction(protocol, state)
-
-    result = action.delete_branch(branch_name="feature/test", force=False)
-
-    assert result.success is True
-
-
-def test_git_diff():
+def test_git_diff(git_action):
     """Test getting diff of changes."""
-    protocol = FakeProtocol()
-    state = RemoteState()
-    action = GitAction(protocol, state)
-
-    diff = action.diff()
+    diff = git_action.diff()
 
     assert "diff --git" in diff
     assert "hello()" in diff
 
 
-def test_git_diff_stat():
+def test_git_diff_stat(git_action):
     """Test getting diff statistics."""
-    protocol = FakeProtocol()
-    state = RemoteState()
-    action = GitAction(protocol, state)
-
-    stats = action.diff_stat()
+    stats = git_action.diff_stat()
 
     assert len(stats) == 3
     assert stats[0].file == "file1.py"
     assert stats[0].insertions == 10
     assert stats[0].deletions == 2
+    assert stats[0].changes == 12
+    # binary files report "-" for both counts
+    assert (stats[2].file, stats[2].changes) == ("logo.png", 0)
@@ -0,0 +1,99 @@
+"""Unit tests for HTTPProtocol connection reuse."""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from remote_machine.protocols.http import HTTPProtocol
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = self.path.encode()
+        self.send_response(200)
+        if self.path == "/login":
+            self.send_header("Set-Cookie", "session=abc; Path=/; HttpOnly")
+            self.send_header("Set-Cookie", "theme=dark")
+        else:
+            self.server.cookies.append(self.headers.get("Cookie"))
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        # drop the socket without announcing it, like an idle keep-alive timeout
+        self.close_connection = self.server.drop_after_response
+
+    def do_POST(self):
+        self.server.posts += 1
+        self.rfile.read(int(self.headers["Content-Length"]))
+        if self.path == "/drop":
+            # the request was received and acted on, but no response is sent
+            self.close_connection = True
+            return
+        self.send_response(204)
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    srv = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    srv.drop_after_response = False
+    srv.cookies = []
+    srv.posts = 0
+    threading.Thread(target=srv.serve_forever, args=(0.05,), daemon=True).start()
+    yield srv
+    srv.shutdown()
+    srv.server_close()
+
+
+def test_requests_reuse_one_connection(server):
+    proto = HTTPProtocol(f"http://127.0.0.1:{server.server_port}")
+
+    assert proto.request("GET", "/a").body == b"/a"
+    sock = proto._conn.sock
+    assert proto.request("GET", "b").body == b"/b"
+    assert proto._conn.sock is sock
+
+
+def test_request_reconnects_after_server_closed_connection(server):
+    server.drop_after_response = True
+    proto = HTTPProtocol(f"http://127.0.0.1:{server.server_port}")
+
+    assert proto.request("GET", "/a").body == b"/a"
+    assert proto.request("GET", "/b").body == b"/b"
+
+
+def test_post_is_not_replayed_once_sent(server):
+    proto = HTTPProtocol(f"http://127.0.0.1:{server.server_port}")
+    proto.request("GET", "/a")
+
+    # the server got the POST, so resending it on a fresh connection could apply it twice
+    with pytest.raises(ConnectionError):
+        proto.request("POST", "/drop", body=b"x")
+    assert server.posts == 1
+
+
+def test_every_set_cookie_header_is_kept(server):
+    proto = HTTPProtocol(f"http://127.0.0.1:{server.server_port}")
+
+    proto.request("GET", "/login")
+    proto.request("GET", "/home")
+
+    assert server.cookies == ["session=abc; theme=dark"]
+
+
+def test_download_streams_body_to_file(server, tmp_path):
+    proto = HTTPProtocol(f"http://127.0.0.1:{server.server_port}")
+    target = tmp_path / "page"
+
+    res = proto.download("/files/page", str(target))
+
+    assert target.read_bytes() == b"/files/page"
+    assert res.bytes_written == 11 and res.status_code == 200
+    # the connection is still usable afterwards
+    assert proto.request("GET", "/next").body == b"/next"
@@ -1,9 +1,18 @@
 """Tests for NETAction linux_parsers usage."""
 
-import sys
 import types
 
-# NETAction will be imported per-test after monkeypatching linux_parsers into sys.modules
+from remote_machine.actions.net import NETAction
+from remote_machine.models.network_types import (
+    ConnectionList,
+    IPAddressList,
+    ListeningPortList,
+    PingResult,
+    RoutingTable,
+)
+from remote_machine.models.remote_state import RemoteState
+
+NET_MODULE = "remote_machine.actions.net"
 
 
 class FakeProtocol:
@@ -20,270 +29,115 @@ class FakeProtocol:
             command=command, stdout="", stderr="", exit_code=0, success=True
         )
 
+    def run_command(self, command: str, state=None) -> str:
+        return self.exec(command, state).stdout
 
-def test_interfaces_uses_parser(monkeypatch):
-    ip_mod = types.ModuleType("linux_parsers.parsers.network.ip")
 
-    def parse_ip_a(out: str):
-        return [{"ifname": "eth0"}, {"ifname": "lo"}]
+# parse_ip_a keys interfaces by their index
+_IP_A = {
+    "1": {"index": "1", "iface": "lo", "state": "UNKNOWN", "addresses": []},
+    "2": {
+        "index": "2",
+        "iface": "eth0",
+        "state": "UP",
+        "addresses": [{"type": "inet", "ip": "10.0.0.1/24", "brd": "10.0.0.255"}],
+    },
+}
 
-    def parse_ip_r(out: str):
-        return []
 
-    ip_mod.parse_ip_a = parse_ip_a
-    ip_mod.parse_ip_r = parse_ip_r
+def test_interfaces_uses_parser(patch_parsers):
+    patch_parsers(NET_MODULE, parse_ip_a=lambda out: _IP_A)
 
-    monkeypatch.setitem(sys.modules, "linux_parsers", types.ModuleType("linux_parsers"))
-    monkeypatch.setitem(
-        sys.modules, "linux_parsers.parsers", types.ModuleType("linux_parsers.parsers")
-    )
-    network_pkg = types.ModuleType("linux_parsers.parsers.network")
-    monkeypatch.setitem(sys.modules, "linux_parsers.parsers.network", network_pkg)
-    monkeypatch.setitem(sys.modules, "linux_parsers.parsers.network.ip", ip_mod)
-    # create minimal stubs for other network parser modules so top-level imports in net.py succeed
-    ss_mod = types.ModuleType("linux_parsers.parsers.network.ss")
-    ss_mod.parse_ss_tulnap = lambda out: []
-    ping_mod = types.ModuleType("linux_parsers.parsers.network.ping")
-    ping_mod.parse_ping = lambda out: {}
-    monkeypatch.setitem(sys.modules, "linux_parsers.parsers.network.ss", ss_mod)
-    monkeypatch.setitem(sys.modules, "linux_parsers.parsers.network.ping", ping_mod)
-    # attach submodules to parent package object so `from linux_parsers.parsers.network.* import ...` works
-    sys.modules["linux_parsers.parsers.network"].ip = ip_mod
-    sys.modules["linux_parsers.parsers.network"].ss = ss_mod
-    sys.modules["linux_parsers.parsers.network"].ping = ping_mod
-    sys.modules.pop("remote_machine.actions.net", None)
-    from importlib import reload
-    import remote_machine.actions.net as _net_mod
-
-    reload(_net_mod)
-    from remote_machine.actions.net import NETAction
-    from remote_machine.models.remote_state import RemoteState
-
-    proto = FakeProtocol({"ip -o link": ""})
+    proto = FakeProtocol({"ip a": ""})
     n = NETAction(proto, RemoteState())
 
-    ifs = n.interfaces()
-    assert "eth0" in ifs
-    assert "lo" in ifs
-
+    assert n.interfaces() == ["lo", "eth0"]
 
-def test_ip_list_uses_parser(monkeypatch):
-    ip_mod = types.ModuleType("linux_parsers.parsers.network.ip")
 
-    def parse_ip_a(out: str):
-        return [{"interface": "eth0", "address": "10.0.0.1/24"}]
-
-    def parse_ip_r(out: str):
-        return []
-
-    ip_mod.parse_ip_a = parse_ip_a
-    ip_mod.parse_ip_r = parse_ip_r
-
-    monkeypatch.setitem(sys.modules, "linux_parsers", types.ModuleType("linux_parsers"))
-    monkeypatch.setitem(
-        sys.modules, "linux_parsers.parsers", types.ModuleType("linux_parsers.parsers")
-    )
-    network_pkg = types.ModuleType("linux_parsers.parsers.network")
-    monkeypatch.setitem(sys.modules, "linux_parsers.parsers.network", network_pkg)
-    monkeypatch.setitem(sys.modules, "linux_parsers.parsers.network.ip", ip_mod)
-    # create minimal stubs for other network parser modules so top-level imports in net.py succeed
-    ss_mod = types.ModuleType("linux_parsers.parsers.network.ss")
-    ss_mod.parse_ss_tulnap = lambda out: []
-    ping_mod = types.ModuleType("linux_parsers.parsers.network.ping")
-    ping_mod.parse_ping = lambda out: {}
-    monkeypatch.setitem(sys.modules, "linux_parsers.parsers.network.ss", ss_mod)
-    monkeypatch.setitem(sys.modules, "linux_parsers.parsers.network.ping", ping_mod)
-    # attach submodules to parent package object so `from linux_parsers.parsers.network.* import ...` works
-    sys.modules["linux_parsers.parsers.network"].ip = ip_mod
-    sys.modules["linux_parsers.parsers.network"].ss = ss_mod
-    sys.modules["linux_parsers.parsers.network"].ping = ping_mod
-    sys.modules.pop("remote_machine.actions.net", None)
-    from importlib import reload
-    import remote_machine.actions.net as _net_mod
-
-    reload(_net_mod)
-    from remote_machine.actions.net import NETAction
-    from remote_machine.models.remote_state import RemoteState
+def test_ip_list_uses_parser(patch_parsers):
+    patch_parsers(NET_MODULE, parse_ip_a=lambda out: _IP_A)
 
     proto = FakeProtocol({"ip a": ""})
     n = NETAction(proto, RemoteState())
 
     res = n.ip_list()
-    from remote_machine.models.network_types import IPAddressList
-
     assert isinstance(res, IPAddressList)
+    assert len(res.addresses) == 1
     assert res.addresses[0].interface == "eth0"
+    assert res.addresses[0].address == "10.0.0.1"
+    assert res.addresses[0].netmask == "24"
+    assert res.addresses[0].broadcast == "10.0.0.255"
 
 
-def test_listening_ports_uses_parser(monkeypatch):
-    ss_mod = types.ModuleType("linux_parsers.parsers.network.ss")
-
-    def parse_ss_tulnap(out: str):
-        return [{"local": "0.0.0.0:22", "pid": 1234}]
-
-    ss_mod.parse_ss_tulnap = parse_ss_tulnap
-
-    monkeypatch.setitem(sys.modules, "linux_parsers", types.ModuleType("linux_parsers"))
-    monkeypatch.setitem(
-        sys.modules, "linux_parsers.parsers", types.ModuleType("linux_parsers.parsers")
+def test_listening_ports_uses_parser(patch_parsers):
+    patch_parsers(
+        NET_MODULE,
+        parse_ss_tulnap=lambda out: [
+            {"State": "LISTEN", "LocalAddress_Port": "0.0.0.0:22", "PeerAddress_Port": "0.0.0.0:*"}
+        ],
     )
-    network_pkg = types.ModuleType("linux_parsers.parsers.network")
-    monkeypatch.setitem(sys.modules, "linux_parsers.parsers.network", network_pkg)
-    monkeypatch.setitem(sys.modules, "linux_parsers.parsers.network.ss", ss_mod)
-    # create minimal stubs for other network parser modules so top-level imports in net.py succeed
-    ip_mod = types.ModuleType("linux_parsers.parsers.network.ip")
-    ip_mod.parse_ip_a = lambda out: []
-    ip_mod.parse_ip_r = lambda out: []
-    ping_mod = types.ModuleType("linux_parsers.parsers.network.ping")
-    ping_mod.parse_ping = lambda out: {}
-    monkeypatch.setitem(sys.modules, "linux_parsers.parsers.network.ip", ip_mod)
-    monkeypatch.setitem(sys.modules, "linux_parsers.parsers.network.ping", ping_mod)
-    # attach submodules to parent package object so `from linux_parsers.parsers.network.* import ...` works
-    sys.modules["linux_parsers.parsers.network"].ip = ip_mod
-    sys.modules["linux_parsers.parsers.network"].ss = ss_mod
-    sys.modules["linux_parsers.parsers.network"].ping = ping_mod
-    from remote_machine.actions.net import NETAction
-    from remote_machine.models.remote_state import RemoteState
 
     proto = FakeProtocol({"ss -tulnap": ""})
     n = NETAction(proto, RemoteState())
 
     ports = n.listening_ports()
-    from remote_machine.models.network_types import ListeningPortList
-
     assert isinstance(ports, ListeningPortList)
     assert ports.ports[0].address == "0.0.0.0"
     assert ports.ports[0].port == 22
-
-
-def test_tcp_connections_uses_parser(monkeypatch):
-    ss_mod = types.ModuleType("linux_parsers.parsers.network.ss")
-
-    def parse_ss_tulnap(out: str):
-        return [{"src": "1.2.3.4:12345", "dst": "5.6.7.8:80"}]
-
-    ss_mod.parse_ss_tulnap = parse_ss_tulnap
-
-    monkeypatch.setitem(sys.modules, "linux_parsers", types.ModuleType("linux_parsers"))
-    monkeypatch.setitem(
-        sys.modules, "linux_parsers.parsers", types.ModuleType("linux_parsers.parsers")
+    assert ports.ports[0].state == "LISTEN"
+
+
+def test_tcp_connections_uses_parser(patch_parsers):
+    patch_parsers(
+        NET_MODULE,
+        parse_ss_tulnap=lambda out: [
+            {
+                "State": "ESTAB",
+                "LocalAddress_Port": "1.2.3.4:12345",
+                "PeerAddress_Port": "5.6.7.8:80",
+            }
+        ],
     )
-    network_pkg = types.ModuleType("linux_parsers.parsers.network")
-    monkeypatch.setitem(sys.modules, "linux_parsers.parsers.network", network_pkg)
-    monkeypatch.setitem(sys.modules, "linux_parsers.parsers.network.ss", ss_mod)
-    # create minimal stubs for other network parser modules so top-level imports in net.py succeed
-    ip_mod = types.ModuleType("linux_parsers.parsers.network.ip")
-    ip_mod.parse_ip_a = lambda out: []
-    ip_mod.parse_ip_r = lambda out: []
-    ping_mod = types.ModuleType("linux_parsers.parsers.network.ping")
-    ping_mod.parse_ping = lambda out: {}
-    monkeypatch.setitem(sys.modules, "linux_parsers.parsers.network.ip", ip_mod)
-    monkeypatch.setitem(sys.modules, "linux_parsers.parsers.network.ping", ping_mod)
-    # attach submodules to parent package object so `from linux_parsers.parsers.network.* import ...` works
-    sys.modules["linux_parsers.parsers.network"].ip = ip_mod
-    sys.modules["linux_parsers.parsers.network"].ss = ss_mod
-    sys.modules["linux_parsers.parsers.network"].ping = ping_mod
-    from remote_machine.actions.net import NETAction
-    from remote_machine.models.remote_state import RemoteState
-
-    proto = FakeProtocol({"ss -tnp": ""})
+
+    proto = FakeProtocol({"ss -tulnap": ""})
     n = NETAction(proto, RemoteState())
 
     conns = n.tcp_connections()
-    from remote_machine.models.network_types import ConnectionList
-
     assert isinstance(conns, ConnectionList)
     assert conns.connections[0].local_address == "1.2.3.4"
+    assert conns.connections[0].remote_port == 80
 
 
-def test_route_list_uses_parser(monkeypatch):
-    ip_mod = types.ModuleType("linux_parsers.parsers.network.ip")
-
-    def parse_ip_r(out: str):
-        return [{"dest": "default", "via": "192.168.1.1"}]
-
-    def parse_ip_a(out: str):
-        return []
-
-    ip_mod.parse_ip_r = parse_ip_r
-    ip_mod.parse_ip_a = parse_ip_a
-
-    monkeypatch.setitem(sys.modules, "linux_parsers", types.ModuleType("linux_parsers"))
-    monkeypatch.setitem(
-        sys.modules, "linux_parsers.parsers", types.ModuleType("linux_parsers.parsers")
+def test_route_list_uses_parser(patch_parsers):
+    patch_parsers(
+        NET_MODULE,
+        parse_ip_r=lambda out: [{"type": "default", "via": "192.168.1.1", "dev": "eth0"}],
     )
-    network_pkg = types.ModuleType("linux_parsers.parsers.network")
-    monkeypatch.setitem(sys.modules, "linux_parsers.parsers.network", network_pkg)
-    monkeypatch.setitem(sys.modules, "linux_parsers.parsers.network.ip", ip_mod)
-    # create minimal stubs for other network parser modules so top-level imports in net.py succeed
-    ss_mod = types.ModuleType("linux_parsers.parsers.network.ss")
-    ss_mod.parse_ss_tulnap = lambda out: []
-    ping_mod = types.ModuleType("linux_parsers.parsers.network.ping")
-    ping_mod.parse_ping = lambda out: {}
-    monkeypatch.setitem(sys.modules, "linux_parsers.parsers.network.ss", ss_mod)
-    monkeypatch.setitem(sys.modules, "linux_parsers.parsers.network.ping", ping_mod)
-    # attach submodule to parent package object so `from linux_parsers.parsers.network.ip import ...` works
-    sys.modules["linux_parsers.parsers.network"].ip = ip_mod
-    sys.modules["linux_parsers.parsers.network"].ss = ss_mod
-    sys.modules["linux_parsers.parsers.network"].ping = ping_mod
-    sys.modules.pop("remote_machine.actions.net", None)
-    from importlib import reload
-    import remote_machine.actions.net as _net_mod
-
-    reload(_net_mod)
-    from remote_machine.actions.net import NETAction
-    from remote_machine.models.remote_state import RemoteState
 
     proto = FakeProtocol({"ip r": ""})
     n = NETAction(proto, RemoteState())
 
     routes = n.route_list()
-    from remote_machine.models.network_types import RoutingTable
-
     assert isinstance(routes, RoutingTable)
+    assert routes.routes[0].destination == "default"
     assert routes.routes[0].gateway == "192.168.1.1"
+    assert routes.routes[0].interface == "eth0"
 
 
-def test_ping_uses_parser(monkeypatch):
-    ping_mod = types.ModuleType("linux_parsers.parsers.network.ping")
-
-    def parse_ping(out: str):
-        return {"packets_transmitted": 4, "packets_received": 4}
-
-    ping_mod.parse_ping = parse_ping
-
-    monkeypatch.setitem(sys.modules, "linux_parsers", types.ModuleType("linux_parsers"))
-    monkeypatch.setitem(
-        sys.modules, "linux_parsers.parsers", types.ModuleType("linux_parsers.parsers")
+def test_ping_uses_parser(patch_parsers):
+    patch_parsers(
+        NET_MODULE,
+        parse_ping=lambda out: {
+            "statistics": {"transmitted": "4", "received": "3", "loss": "25", "time": "3004ms"},
+            "rtt": {"min": "1.0", "avg": "1.5", "max": "2.0", "mdev": "0.3"},
+        },
     )
-    network_pkg = types.ModuleType("linux_parsers.parsers.network")
-    monkeypatch.setitem(sys.modules, "linux_parsers.parsers.network", network_pkg)
-    monkeypatch.setitem(sys.modules, "linux_parsers.parsers.network.ping", ping_mod)
-    # create minimal stubs for other network parser modules so top-level imports in net.py succeed
-    ip_mod = types.ModuleType("linux_parsers.parsers.network.ip")
-    ip_mod.parse_ip_a = lambda out: []
-    ip_mod.parse_ip_r = lambda out: []
-    ss_mod = types.ModuleType("linux_parsers.parsers.network.ss")
-    ss_mod.parse_ss_tulnap = lambda out: []
-    monkeypatch.setitem(sys.modules, "linux_parsers.parsers.network.ip", ip_mod)
-    monkeypatch.setitem(sys.modules, "linux_parsers.parsers.network.ss", ss_mod)
-    # attach submodule to parent package object so `from linux_parsers.parsers.network.ping import ...` works
-    sys.modules["linux_parsers.parsers.network"].ping = ping_mod
-    sys.modules["linux_parsers.parsers.network"].ip = ip_mod
-    sys.modules["linux_parsers.parsers.network"].ss = ss_mod
-    sys.modules.pop("remote_machine.actions.net", None)
-    from importlib import reload
-    import remote_machine.actions.net as _net_mod
-
-    reload(_net_mod)
-    from remote_machine.actions.net import NETAction
-    from remote_machine.models.remote_state import RemoteState
 
     proto = FakeProtocol({"ping": "PING\n---"})
     n = NETAction(proto, RemoteState())
 
     res = n.ping("example.com", count=4, timeout=2)
-    from remote_machine.models.network_types import PingResult
-
     assert isinstance(res, PingResult)
-    assert res.received == 4
+    assert (res.transmitted, res.received, res.packets_lost) == (4, 3, 1)
+    assert res.loss_percent == 25.0
+    assert res.avg_time == 1.5
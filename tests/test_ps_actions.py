@@ -1,91 +1,66 @@
 """Tests for PSAction linux_parsers usage."""
 
-import sys
-import types
-
+from remote_machine.actions.ps import PSAction
 from remote_machine.models.remote_state import RemoteState
 from remote_machine.models.command_result import CommandResult
 
-# Note: PSAction imports linux_parsers at module level, so tests must monkeypatch sys.modules before importing it.
+# PSAction binds its linux_parsers callables at import, so tests swap them via patch_parsers
+PS_MODULE = "remote_machine.actions.ps"
 
 
 class FakeProtocol:
     def __init__(self, responses: dict[str, str]):
         self.responses = responses
+        self.commands: list[str] = []
 
     def exec(self, command: str, state: RemoteState) -> CommandResult:
+        self.commands.append(command)
         for key, out in self.responses.items():
             if key in command:
                 return CommandResult(command=command, stdout=out, stderr="", exit_code=0)
         return CommandResult(command=command, stdout="", stderr="", exit_code=0)
 
-
-def test_list_uses_parser(monkeypatch):
-    ps_mod = types.ModuleType("linux_parsers.parsers.process.ps")
-
-    def parse_ps_aux(out: str):
-        return [
-            {"USER": "root", "PID": "1", "COMMAND": "init"},
-            {"USER": "alice", "PID": "123", "COMMAND": "python"},
-        ]
-
-    ps_mod.parse_ps_aux = parse_ps_aux
-
-    monkeypatch.setitem(sys.modules, "linux_parsers", types.ModuleType("linux_parsers"))
-    monkeypatch.setitem(
-        sys.modules, "linux_parsers.parsers", types.ModuleType("linux_parsers.parsers")
-    )
-    monkeypatch.setitem(
-        sys.modules,
-        "linux_parsers.parsers.process",
-        types.ModuleType("linux_parsers.parsers.process"),
+    def run_command(self, command: str, state: RemoteState = None) -> str:
+        return self.exec(command, state).stdout
+
+
+def _row(user: str, pid: str, command: str) -> dict[str, str]:
+    """One parse_ps_aux row; the parser names the USER column "event"."""
+    return {
+        "event": user,
+        "pid": pid,
+        "cpu": "0.5",
+        "mem": "1.0",
+        "vsz": "4096",
+        "rss": "2048",
+        "tty": "?",
+        "stat": "S",
+        "start": "10:00",
+        "time": "0:00",
+        "command": command,
+    }
+
+
+def test_list_uses_parser(patch_parsers):
+    patch_parsers(
+        PS_MODULE,
+        parse_ps_aux=lambda out: [_row("root", "1", "init"), _row("alice", "123", "python")],
     )
-    monkeypatch.setitem(sys.modules, "linux_parsers.parsers.process.ps", ps_mod)
-
-    # import after monkeypatching so module-level imports succeed
-    sys.modules.pop("remote_machine.actions.ps", None)
-    from importlib import reload
-    import remote_machine.actions.ps as _ps_mod
-
-    reload(_ps_mod)
-    from remote_machine.actions.ps import PSAction
 
     proto = FakeProtocol({"ps aux": ""})
     p = PSAction(proto, RemoteState())
 
     ps = p.list()
-    assert any(x.user == "alice" for x in ps.processes)
-
-
-def test_list_by_user_and_find(monkeypatch):
-    ps_mod = types.ModuleType("linux_parsers.parsers.process.ps")
-
-    def parse_ps_aux(out: str):
-        return [
-            {"USER": "root", "PID": "1", "COMMAND": "init"},
-            {"USER": "alice", "PID": "123", "COMMAND": "python app.py"},
-        ]
+    assert [(x.user, x.pid, x.name) for x in ps] == [("root", 1, "init"), ("alice", 123, "python")]
+    assert ps[1].cpu_percent == 0.5
+    assert ps[1].memory_rss == 2048
 
-    ps_mod.parse_ps_aux = parse_ps_aux
 
-    monkeypatch.setitem(sys.modules, "linux_parsers", types.ModuleType("linux_parsers"))
-    monkeypatch.setitem(
-        sys.modules, "linux_parsers.parsers", types.ModuleType("linux_parsers.parsers")
+def test_list_by_user_and_find(patch_parsers):
+    patch_parsers(
+        PS_MODULE,
+        parse_ps_aux=lambda out: [_row("root", "1", "init"), _row("alice", "123", "python app.py")],
     )
-    monkeypatch.setitem(
-        sys.modules,
-        "linux_parsers.parsers.process",
-        types.ModuleType("linux_parsers.parsers.process"),
-    )
-    monkeypatch.setitem(sys.modules, "linux_parsers.parsers.process.ps", ps_mod)
-
-    # import after monkeypatching so module-level imports succeed
-    sys.modules.pop("remote_machine.actions.ps", None)
-    from importlib import reload
-    import remote_machine.actions.ps as _ps_mod
-
-    reload(_ps_mod)
-    from remote_machine.actions.ps import PSAction
 
     proto = FakeProtocol({"ps aux": ""})
     p = PSAction(proto, RemoteState())
@@ -96,36 +71,14 @@ def test_list_by_user_and_find(monkeypatch):
     assert any("python" in (x.command or "") for x in found)
 
 
-def test_get_info_and_kill(monkeypatch):
-    ps_mod = types.ModuleType("linux_parsers.parsers.process.ps")
+def test_get_info_and_kill(patch_parsers):
+    patch_parsers(PS_MODULE, parse_ps_aux=lambda out: [_row("root", "42", "sleep 100")])
 
-    def parse_ps_aux(out: str):
-        return [{"USER": "root", "PID": "42", "COMMAND": "sleep 100"}]
-
-    ps_mod.parse_ps_aux = parse_ps_aux
-
-    monkeypatch.setitem(sys.modules, "linux_parsers", types.ModuleType("linux_parsers"))
-    monkeypatch.setitem(
-        sys.modules, "linux_parsers.parsers", types.ModuleType("linux_parsers.parsers")
-    )
-    monkeypatch.setitem(
-        sys.modules,
-        "linux_parsers.parsers.process",
-        types.ModuleType("linux_parsers.parsers.process"),
-    )
-    monkeypatch.setitem(sys.modules, "linux_parsers.parsers.process.ps", ps_mod)
-
-    # import after monkeypatching so module-level imports succeed
-    sys.modules.pop("remote_machine.actions.ps", None)
-    from importlib import reload
-    import remote_machine.actions.ps as _ps_mod
-
-    reload(_ps_mod)
-    from remote_machine.actions.ps import PSAction
-
-    proto = FakeProtocol({"ps aux": "", "kill -9 42": ""})
+    proto = FakeProtocol({"ps aux": ""})
     p = PSAction(proto, RemoteState())
 
     info = p.get_info(42)
     assert info is not None and info.pid == 42
-    p.kill(42, signal=9)  # should not raise
+    assert p.get_info(43) is None
+    p.kill(42, signal=9)
+    assert proto.commands[-1] == "kill -9 42"
@@ -0,0 +1,265 @@
+"""Unit tests for ServiceAction parsing behavior."""
+
+import asyncio
+from datetime import datetime
+
+import pytest
+
+from remote_machine.actions.service import ServiceAction
+from remote_machine.errors.error_mapper import ErrorMapper
+from remote_machine.models.command_result import CommandResult
+from remote_machine.models.remote_state import RemoteState
+
+
+class FakeProtocol:
+    def __init__(self, responses: dict[str, str]):
+        self.responses = responses
+        self.commands: list[str] = []
+
+    def exec(self, command: str, state: RemoteState) -> CommandResult:
+        self.commands.append(command)
+        for key, out in self.responses.items():
+            if key in command:
+                return CommandResult(command=command, stdout=out, stderr="", exit_code=0)
+        return CommandResult(command=command, stdout="", stderr="", exit_code=0)
+
+    def run_command(self, command: str, state: RemoteState) -> str:
+        result = self.exec(command, state)
+        ErrorMapper.raise_if_error(result)
+        return result.stdout
+
+
+SHOW_NGINX = (
+    "ActiveState=active\n"
+    "SubState=running\n"
+    "LoadState=loaded\n"
+    "MainPID=1234\n"
+    "MemoryCurrent=4096\n"
+    "CPUUsageNSec=500000000\n"
+)
+
+
+def test_get_port_uses_main_pid():
+    proto = FakeProtocol({"systemctl show": SHOW_NGINX, "ss -H": "0.0.0.0:80\n"})
+    svc = ServiceAction(proto, RemoteState())
+
+    res = svc.get_port("nginx")
+    assert res.id == 80
+    assert any("pid=1234," in c for c in proto.commands)
+
+
+def test_get_port_without_pid():
+    proto = FakeProtocol({"systemctl show": "ActiveState=inactive\nMainPID=0\n"})
+    svc = ServiceAction(proto, RemoteState())
+
+    res = svc.get_port("nginx")
+    assert res.id is None
+    assert not any(c.startswith("ss ") for c in proto.commands)
+
+
+def test_logs_parses_journal_json():
+    journal = (
+        '{"__REALTIME_TIMESTAMP": "1700000000000000", "PRIORITY": "3", '
+        '"_SYSTEMD_UNIT": "nginx.service", "MESSAGE": "bind failed"}\n'
+        '{"__REALTIME_TIMESTAMP": "1700000001000000", "PRIORITY": "6", '
+        '"MESSAGE": [104, 105]}\n'
+    )
+    proto = FakeProtocol({"journalctl": journal})
+    svc = ServiceAction(proto, RemoteState())
+
+    res = svc.logs("nginx", lines=10)
+    assert "--output=json" in proto.commands[0]
+    assert res.count == 2
+    assert res.logs[0].level == "err"
+    assert res.logs[0].message == "bind failed"
+    assert res.logs[0].unit == "nginx.service"
+    assert res.logs[0].timestamp == datetime.fromtimestamp(1700000000)
+    assert res.logs[1].level == "info"
+    assert res.logs[1].message == "hi"
+
+
+def test_status_reads_unit_file_state():
+    proto = FakeProtocol({"systemctl show": SHOW_NGINX + "UnitFileState=enabled\n"})
+    svc = ServiceAction(proto, RemoteState())
+
+    st = svc.status("nginx")
+    assert st.active and st.loaded and st.enabled
+    assert st.pid == 1234
+    assert st.memory == 4096
+    assert "-p UnitFileState" in proto.commands[0]
+
+
+def test_is_running_and_is_enabled_reuse_cached_status():
+    proto = FakeProtocol({"systemctl show": SHOW_NGINX + "UnitFileState=disabled\n"})
+    svc = ServiceAction(proto, RemoteState())
+
+    svc.status("nginx")
+    assert svc.is_running("nginx", cached=True).result is True
+    assert svc.is_enabled("nginx", cached=True).result is False
+    assert len(proto.commands) == 1
+
+
+def test_probe_returns_flags_and_status_from_one_read():
+    proto = FakeProtocol({"systemctl show": SHOW_NGINX + "UnitFileState=disabled\n"})
+    svc = ServiceAction(proto, RemoteState())
+
+    active, enabled, st = svc.probe("nginx")
+    assert (active, enabled) == (True, False)
+    assert st.pid == 1234
+    assert len(proto.commands) == 1
+
+
+def test_list_parses_units():
+    units = (
+        '[{"unit":"cron.service","load":"loaded","active":"active","sub":"running",'
+        '"description":"Regular background program"},'
+        '{"unit":"foo.service","load":"loaded","active":"failed","sub":"failed",'
+        '"description":"Foo daemon"},'
+        '{"unit":"ssh.service","load":"loaded","active":"inactive","sub":"dead",'
+        '"description":"OpenBSD Secure Shell server"}]'
+    )
+    proto = FakeProtocol({"systemctl list-units": units})
+    svc = ServiceAction(proto, RemoteState())
+
+    res = svc.list()
+    assert res.count == 3
+    assert [s.name for s in res.services] == ["cron.service", "foo.service", "ssh.service"]
+    assert res.services[0].active and res.services[0].loaded
+    assert res.services[1].state == "failed"
+
+
+def test_list_columns():
+    units = (
+        '[{"unit":"a.service","load":"loaded","active":"active","sub":"running"},'
+        '{"unit":"b.service","load":"not-found","active":"inactive","sub":"dead"}]'
+    )
+    svc = ServiceAction(FakeProtocol({"systemctl list-units": units}), RemoteState())
+
+    cols = svc.list_columns()
+    assert cols.names == ["a.service", "b.service"]
+    assert cols.active == [True, False]
+    assert cols.loaded == [True, False]
+    assert cols.active_count == 1
+
+
+def test_list_columns_falls_back_to_table():
+    # systemd without JSON output prints the plain table
+    table = (
+        "  cron.service   loaded    active   running Regular background program\n"
+        "● foo.service    loaded    failed   failed  Foo daemon\n"
+        "  ssh.service    not-found inactive dead    ssh.service\n"
+    )
+    svc = ServiceAction(FakeProtocol({"systemctl list-units": table}), RemoteState())
+
+    cols = svc.list_columns()
+    assert cols.names == ["cron.service", "foo.service", "ssh.service"]
+    assert cols.states == ["active", "failed", "inactive"]
+    assert cols.loaded == [True, True, False]
+
+
+def test_dependencies_tree():
+    tree = (
+        "nginx.service\n"
+        "● ├─system.slice\n"
+        "● ├─network-online.target\n"
+        "● │ └─systemd-networkd-wait-online.service\n"
+        "● └─sysinit.target\n"
+        "●   └─systemd-journald.service\n"
+    )
+    svc = ServiceAction(FakeProtocol({"list-dependencies": tree}), RemoteState())
+
+    deps = svc.dependencies("nginx")
+    assert [d.name for d in deps.dependencies] == [
+        "systemd-networkd-wait-online.service",
+        "systemd-journald.service",
+    ]
+    assert deps.dependents == ["nginx.service"]
+
+
+def test_is_running_and_is_enabled_use_exit_status_output():
+    proto = FakeProtocol({"is-active": "inactive\n", "is-enabled": "static\n"})
+    svc = ServiceAction(proto, RemoteState())
+
+    assert svc.is_running("nginx").result is False
+    assert svc.is_enabled("nginx").result is True
+
+
+def test_rejects_unsafe_service_name():
+    proto = FakeProtocol({})
+    svc = ServiceAction(proto, RemoteState())
+
+    with pytest.raises(ValueError):
+        svc.start("nginx; rm -rf /")
+    assert proto.commands == []
+
+
+def test_escaped_unit_name_is_quoted():
+    proto = FakeProtocol({"systemctl show": SHOW_NGINX})
+    svc = ServiceAction(proto, RemoteState())
+
+    svc.restart("systemd-fsck@dev-sda\\x2d1.service")
+    assert proto.commands[0] == "systemctl restart 'systemd-fsck@dev-sda\\x2d1.service'"
+
+
+def test_list_is_cached_until_mutation():
+    units = '[{"unit":"a.service","load":"loaded","active":"active","sub":"running"}]'
+    proto = FakeProtocol({"systemctl list-units": units, "systemctl show": SHOW_NGINX})
+    svc = ServiceAction(proto, RemoteState())
+
+    svc.list()
+    svc.list_columns()
+    assert sum("list-units" in c for c in proto.commands) == 1
+
+    svc.restart("a")
+    svc.list()
+    assert sum("list-units" in c for c in proto.commands) == 2
+
+    svc.list_cache_ttl = 0
+    svc.list()
+    assert sum("list-units" in c for c in proto.commands) == 3
+
+
+def test_list_cache_is_keyed_on_state():
+    units = '[{"unit":"a.service","load":"loaded","active":"active","sub":"running"}]'
+    proto = FakeProtocol({"systemctl list-units": units})
+    state = RemoteState()
+    svc = ServiceAction(proto, state)
+
+    svc.list()
+    svc.list()
+    state.env["SYSTEMD_COLORS"] = "0"
+    svc.list()
+    assert sum("list-units" in c for c in proto.commands) == 2
+
+
+def test_validate_many():
+    proto = FakeProtocol({})
+    svc = ServiceAction(proto, RemoteState())
+
+    results = asyncio.run(svc.validate_many(["a", "b"]))
+    assert [r.success for r in results] == [True, True]
+    assert sorted(proto.commands) == [
+        "systemd-analyze verify /etc/systemd/system/a.service",
+        "systemd-analyze verify /etc/systemd/system/b.service",
+    ]
+
+
+def test_no_block_start_and_restart_many():
+    proto = FakeProtocol({})
+    svc = ServiceAction(proto, RemoteState())
+
+    res = svc.start("nginx", wait=False)
+    assert res.success
+    svc.restart_many(["a", "b"])
+    assert proto.commands == [
+        "systemctl --no-block start nginx",
+        "systemctl --no-block restart a b",
+    ]
+
+
+def test_restart_many_with_no_services_runs_nothing():
+    proto = FakeProtocol({})
+    svc = ServiceAction(proto, RemoteState())
+
+    assert svc.restart_many([]).success
+    assert proto.commands == []
@@ -0,0 +1,203 @@
+"""Unit tests for SSHProtocol command execution and batching."""
+
+import socket
+import subprocess
+import threading
+
+import pytest
+
+from remote_machine.models.remote_state import RemoteState
+from remote_machine.protocols.ssh import SSHProtocol
+
+
+class _Pipe:
+    """Collects one stream of a local process for non-blocking reads."""
+
+    def __init__(self, stream):
+        self.data = bytearray()
+        self.eof = False
+        self.cond = threading.Condition()
+        threading.Thread(target=self._pump, args=(stream,), daemon=True).start()
+
+    def _pump(self, stream):
+        for chunk in iter(lambda: stream.read1(4096), b""):
+            with self.cond:
+                self.data += chunk
+                self.cond.notify_all()
+        with self.cond:
+            self.eof = True
+            self.cond.notify_all()
+
+    def read(self, nbytes: int, timeout: float) -> bytes:
+        with self.cond:
+            if not self.data and not self.eof and not self.cond.wait(timeout):
+                raise socket.timeout()
+            chunk = bytes(self.data[:nbytes])
+            del self.data[:nbytes]
+            return chunk
+
+
+class LocalShellChannel:
+    """Stands in for a paramiko.Channel running `sh` locally."""
+
+    def __init__(self):
+        self.closed = False
+        self.timeout = None
+        self.scripts: list[str] = []
+
+    def exec_command(self, command: str):
+        self.proc = subprocess.Popen(
+            ["sh", "-c", command],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+        self._out = _Pipe(self.proc.stdout)
+        self._err = _Pipe(self.proc.stderr)
+
+    def settimeout(self, timeout: float):
+        self.timeout = timeout
+
+    def sendall(self, data: bytes):
+        self.scripts.append(data.decode())
+        self.proc.stdin.write(data)
+        self.proc.stdin.flush()
+
+    def recv(self, nbytes: int) -> bytes:
+        return self._out.read(nbytes, self.timeout)
+
+    def recv_stderr(self, nbytes: int) -> bytes:
+        return self._err.read(nbytes, self.timeout)
+
+    def recv_stderr_ready(self) -> bool:
+        return bool(self._err.data)
+
+    def exit_status_ready(self) -> bool:
+        return self.proc.poll() is not None
+
+    def recv_exit_status(self) -> int:
+        return self.proc.wait()
+
+    def close(self):
+        self.closed = True
+        self.proc.kill()
+
+
+class LocalTransport:
+    def __init__(self):
+        self.channels: list[LocalShellChannel] = []
+
+    def open_session(self) -> LocalShellChannel:
+        self.channels.append(LocalShellChannel())
+        return self.channels[-1]
+
+
+class LocalClient:
+    """Stands in for paramiko.SSHClient by running commands with the local shell."""
+
+    def __init__(self):
+        self.transport = LocalTransport()
+
+    def get_transport(self) -> LocalTransport:
+        return self.transport
+
+    def close(self):
+        for channel in self.transport.channels:
+            channel.close()
+
+
+@pytest.fixture
+def proto():
+    p = SSHProtocol("localhost", "user")
+    p._client = LocalClient()
+    return p
+
+
+def test_exec_collects_both_streams(proto):
+    state = RemoteState(cwd="/tmp")
+    result = proto.exec("head -c 300000 /dev/zero | tr '\\0' o; echo bad >&2; exit 4", state)
+
+    assert len(result.stdout) == 300000
+    assert result.stderr == "bad\n"
+    assert result.exit_code == 4
+    assert proto._client.transport.channels[0].closed
+
+
+def test_drain_runs_submitted_commands_in_one_batch(proto):
+    state = RemoteState(cwd="/tmp")
+    first = proto.submit("echo one; echo two", state)
+    second = proto.submit("printf 'no newline'; echo oops >&2; exit 3", state)
+    third = proto.submit("pwd", RemoteState(cwd="/"))
+
+    proto.drain()
+
+    channels = proto._client.transport.channels
+    assert len(channels) == 1 and len(channels[0].scripts) == 1
+    assert first.result().stdout == "one\ntwo\n"
+    assert first.result().exit_code == 0
+    assert second.result().stdout == "no newline"
+    assert second.result().stderr == "oops\n"
+    assert second.result().exit_code == 3
+    assert third.result().stdout == "/\n"
+
+
+def test_drain_without_pending_is_a_no_op(proto):
+    proto.drain()
+    assert proto._client.transport.channels == []
+
+
+def test_exec_pipelined_reuses_the_shell_channel(proto):
+    state = RemoteState(cwd="/")
+    first = proto.exec_pipelined(["cd /tmp", "pwd", "cat"], state)
+    second = proto.exec_pipelined(["pwd", "echo $((40 + 2))"], state)
+
+    # cd in one command doesn't leak into the next, and cat doesn't eat the script
+    assert [r.stdout for r in first] == ["", "/\n", ""]
+    assert [r.stdout for r in second] == ["/\n", "42\n"]
+    assert len(proto._client.transport.channels) == 1
+
+    channel = proto._shell
+    proto.disconnect()
+    assert channel.closed and proto._shell is None
+
+
+def test_drain_when_disconnected_fails_futures():
+    p = SSHProtocol("localhost", "user")
+    future = p.submit("true", RemoteState())
+    p.drain()
+    with pytest.raises(ConnectionError):
+        future.result()
+
+
+def test_exec_pipelined_with_trailing_comment(proto):
+    results = proto.exec_pipelined(["echo hi # trailing comment", "echo two"], RemoteState())
+
+    assert [r.stdout for r in results] == ["hi\n", "two\n"]
+    assert [r.exit_code for r in results] == [0, 0]
+
+
+def test_drain_past_deadline_drops_the_shell(proto):
+    proto.batch_timeout = 0.3
+    future = proto.submit("sleep 5", RemoteState())
+    proto.drain()
+
+    with pytest.raises(ConnectionError):
+        future.result()
+    assert proto._shell is None
+    assert proto._client.transport.channels[0].closed
+
+
+def test_concurrent_exec_pipelined_do_not_interleave(proto):
+    results = {}
+
+    def run(n):
+        results[n] = proto.exec_pipelined([f"echo {n}", f"echo {n}{n}"], RemoteState())
+
+    threads = [threading.Thread(target=run, args=(n,)) for n in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    for n in range(4):
+        assert [r.stdout for r in results[n]] == [f"{n}\n", f"{n}{n}\n"]
@@ -1,25 +1,41 @@
 """Unit tests for SYSAction parsing behavior."""
 
-import os
-import sys
-
-# Make the package importable in tests run in this environment
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
-
+import asyncio
+from concurrent.futures import Future
 from datetime import datetime, timedelta
 
 import pytest
 
-from remote_machine.actions.sys import SYSAction
+from remote_machine.actions.sys import (
+    SYSAction,
+    _parse_cpuinfo,
+    _parse_loadavg,
+    _parse_memory,
+    _parse_os_release,
+    _parse_uptime,
+)
+from remote_machine.errors.exceptions import PermissionDenied
 from remote_machine.models.command_result import CommandResult
 from remote_machine.models.remote_state import RemoteState
 
 
 class FakeProtocol:
-    def __init__(self, responses: dict[str, str]):
+    def __init__(self, responses: dict[str, str], failing: tuple[str, ...] = ()):
         self.responses = responses
+        # commands containing one of these fail with a permission error
+        self.failing = failing
+        self.commands: list[str] = []
+        self.pending: list[tuple[str, Future]] = []
 
     def exec(self, command: str, state: RemoteState) -> CommandResult:
+        self.commands.append(command)
+        return self._respond(command)
+
+    def _respond(self, command: str) -> CommandResult:
+        if any(key in command for key in self.failing):
+            return CommandResult(
+                command=command, stdout="", stderr="Permission denied\n", exit_code=1
+            )
         # return mapped stdout if key matches a known command
         for key, out in self.responses.items():
             if key in command:
@@ -27,15 +43,45 @@ class FakeProtocol:
         # default empty
         return CommandResult(command=command, stdout="", stderr="", exit_code=0)
 
+    def run_command(self, command: str, state: RemoteState) -> str:
+        return self.exec(command, state).stdout
+
+    def submit(self, command: str, state: RemoteState) -> Future:
+        future: Future = Future()
+        self.pending.append((command, future))
+        return future
+
+    def drain(self) -> None:
+        # a batch is one round-trip, recorded as a single command
+        pending, self.pending = self.pending, []
+        self.commands.append("; ".join(command for command, _ in pending))
+        for command, future in pending:
+            future.set_result(self._respond(command))
+
+
+FREE_OUT = (
+    "              total        used        free      shared  buff/cache   available\n"
+    "Mem:        8000000     3000000     2000000          0     3000000     4500000\n"
+    "Swap:       2000000       10000     1990000\n"
+)
+
+CPUINFO = (
+    "processor\t: 0\n"
+    "vendor_id\t: GenuineIntel\n"
+    "model name\t: Test CPU\n"
+    "cpu cores\t: 4\n"
+    "cpu MHz\t: 2400.000\n"
+    "flags\t: fpu vme de\n"
+    "cache size\t: 8192 KB\n"
+    "stepping\t: 10\n"
+    "\n"
+    "processor\t: 1\n"
+    "\n"
+)
+
 
 def test_uname_parsing():
-    responses = {
-        "uname -s": "Linux\n",
-        "uname -n": "myhost\n",
-        "uname -r": "5.19.0\n",
-        "uname -v": "#1 SMP\n",
-        "uname -m": "x86_64\n",
-    }
+    responses = {"uname -snrvm": "Linux myhost 5.19.0 #1 SMP PREEMPT x86_64\n"}
     proto = FakeProtocol(responses)
     state = RemoteState()
     s = SYSAction(proto, state)
@@ -44,6 +90,7 @@ def test_uname_parsing():
     assert uname.sysname == "Linux"
     assert uname.nodename == "myhost"
     assert uname.release == "5.19.0"
+    assert uname.version == "#1 SMP PREEMPT"
     assert uname.machine == "x86_64"
 
 
@@ -70,14 +117,26 @@ def test_load_average_parsing():
     assert load.total_processes == 100
 
 
+def test_load_average_malformed():
+    s = SYSAction(FakeProtocol({"cat /proc/loadavg": "garbage\n"}), RemoteState())
+
+    load = s.load_average()
+    assert (load.one_minute, load.running_processes, load.total_processes) == (0.0, 0, 0)
+
+
+def test_load_average_max_age():
+    proto = FakeProtocol({"cat /proc/loadavg": "0.10 0.05 0.01 2/100 12345\n"})
+    s = SYSAction(proto, RemoteState())
+
+    s.load_average()
+    s.load_average(max_age=60)
+    assert len(proto.commands) == 1
+    s.load_average(max_age=0)
+    assert len(proto.commands) == 2
+
+
 def test_memory_parsing():
-    free_out = (
-        "              total        used        free      shared  buff/cache   available\n"
-        "Mem:        8000000     3000000     2000000          0     3000000     4500000\n"
-        "Swap:       2000000       10000     1990000\n"
-    )
-    responses = {"free -b": free_out}
-    proto = FakeProtocol(responses)
+    proto = FakeProtocol({"free -b": FREE_OUT})
     s = SYSAction(proto, RemoteState())
 
     mem = s.memory_info()
@@ -88,28 +147,220 @@ def test_memory_parsing():
 
 
 def test_cpu_info_parsing():
-    cpuinfo = (
-        "processor\t: 0\n"
-        "vendor_id\t: GenuineIntel\n"
-        "model name\t: Test CPU\n"
-        "cpu cores\t: 4\n"
-        "cpu MHz\t: 2400.000\n"
-        "flags\t: fpu vme de\n"
-        "cache size\t: 8192 KB\n"
-        "stepping\t: 10\n"
-        "\n"
-        "processor\t: 1\n"
+    proto = FakeProtocol({"cat /proc/cpuinfo": CPUINFO})
+    s = SYSAction(proto, RemoteState())
+
+    cpu = s.cpu_info()
+    assert len(cpu) == 2
+    assert cpu[0].model_name == "Test CPU"
+    assert cpu[0].cores == 4
+    assert cpu[0].threads == 2
+    assert cpu[0].cpu_mhz == 2400.0
+
+
+def test_uname_is_memoized():
+    proto = FakeProtocol({"uname -snrvm": "Linux myhost 5.19.0 #1 SMP x86_64\n"})
+    s = SYSAction(proto, RemoteState())
+
+    assert s.uname() is s.uname()
+    assert len(proto.commands) == 1
+
+    s.invalidate_cache()
+    s.uname()
+    assert len(proto.commands) == 2
+
+
+def test_kernel_version_reuses_uname_and_reboot_invalidates():
+    proto = FakeProtocol({"uname -snrvm": "Linux myhost 5.19.0 #1 SMP x86_64\n"})
+    s = SYSAction(proto, RemoteState())
+
+    s.uname()
+    assert s.kernel_version() == "5.19.0"
+    assert len(proto.commands) == 1
+
+    s.reboot()
+    s.uname()
+    assert proto.commands[1:] == ["reboot", "uname -snrvm"]
+
+
+def test_cpu_count_prefers_nproc():
+    proto = FakeProtocol({"nproc": "8\n", "cat /proc/cpuinfo": "processor\t: 0\n"})
+    s = SYSAction(proto, RemoteState())
+
+    assert s.cpu_count() == 8
+    assert proto.commands == ["nproc --all"]
+
+
+def test_cpu_info_and_cpu_count_share_one_read():
+    cpuinfo = "processor\t: 0\nmodel name\t: A\n\nprocessor\t: 1\nmodel name\t: A\n"
+    proto = FakeProtocol({"cat /proc/cpuinfo": cpuinfo})
+    s = SYSAction(proto, RemoteState())
+
+    assert len(s.cpu_info()) == 2
+    assert s.cpu_count() == 2
+    assert proto.commands == ["cat /proc/cpuinfo"]
+
+
+def test_timezone_prefers_etc_timezone():
+    proto = FakeProtocol({"cat /etc/timezone": "Europe/Berlin\n"})
+    s = SYSAction(proto, RemoteState())
+
+    assert s.timezone() == "Europe/Berlin"
+    assert s.timezone() == "Europe/Berlin"
+    assert proto.commands == ["cat /etc/timezone"]
+
+
+def test_dmesg_byte_cap():
+    proto = FakeProtocol({"dmesg": "[    0.000000] Linux version\n"})
+    s = SYSAction(proto, RemoteState())
+
+    assert s.dmesg(lines=5) == "[    0.000000] Linux version\n"
+    s.dmesg(lines=5, max_bytes=4096)
+    assert proto.commands == [
+        "dmesg --color=never | tail -n 5",
+        "dmesg --color=never | tail -n 5 | tail -c 4096",
+    ]
+
+
+def test_timezone_from_localtime_link():
+    proto = FakeProtocol({"readlink": "/usr/share/zoneinfo/America/New_York\n"})
+    s = SYSAction(proto, RemoteState())
+
+    assert s.timezone() == "America/New_York"
+
+
+def test_logged_in_users_parsing():
+    who_out = (
+        "alice    pts/0        2024-03-05 10:11 (192.168.1.2)\n"
+        "bob      tty1         2024-03-06 01:02\n"
+    )
+    s = SYSAction(FakeProtocol({"who": who_out}), RemoteState())
+
+    users = s.logged_in_users()
+    assert [u.username for u in users] == ["alice", "bob"]
+    assert users[0].hostname == "192.168.1.2"
+    assert users[0].login_time == datetime(2024, 3, 5, 10, 11)
+    assert users[1].tty == "tty1"
+    assert users[1].hostname == ""
+
+
+def test_os_release_skips_blank_and_comment_lines():
+    content = (
+        "# generated by the image build\n"
+        'NAME="TestOS"\n'
         "\n"
+        "VERSION_ID='1.2'\n"
+        "ID=testos\n"
     )
-    responses = {"cat /proc/cpuinfo": cpuinfo}
+    s = SYSAction(FakeProtocol({"os-release": content}), RemoteState())
+
+    rel = s.os_release()
+    assert rel.name == "TestOS"
+    assert rel.pretty_name == "TestOS"
+    assert rel.version_id == "1.2"
+    assert rel.id == "testos"
+    assert rel.home_url is None
+
+
+def test_info_single_round_trip():
+    responses = {
+        "os-release": "NAME=TestOS\nVERSION_ID=1.2\n",
+        "uname": "Linux myhost 5.19.0 #1 SMP x86_64\n",
+        "uptime": "12345.67 67890.12\n",
+        "cpuinfo": "processor\t: 0\nmodel name\t: Test CPU\n",
+        "free": "               total        used        free      shared  buff/cache   available\n"
+        "Mem:         8000000     3000000     2000000           0     3000000     4500000\n"
+        "Low:         8000000     6000000     2000000\n"
+        "High:              0           0           0\n"
+        "Swap:        2000000       10000     1990000\n"
+        "Total:      10000000     3010000     3990000\n"
+        "Comm:        5000000     1000000     4000000\n",
+        "loadavg": "0.10 0.05 0.01 2/100 12345\n",
+    }
     proto = FakeProtocol(responses)
     s = SYSAction(proto, RemoteState())
 
-    cpu = s.cpu_info()
-    assert cpu.model_name == "Test CPU"
-    assert cpu.cores == 4
-    assert cpu.threads == 2
-    assert cpu.cpu_mhz == 2400.0
+    info = s.info()
+    assert len(proto.commands) == 1
+    assert info.hostname == "myhost"
+    assert info.os_release.name == "TestOS"
+    assert info.kernel_version == "5.19.0"
+    assert info.uptime.seconds == 12345.67
+    assert info.memory_info.total == 8000000
+    assert info.load_average.total_processes == 100
+
+    # the batched read also primes the memoized facts
+    assert s.cpu_info() is info.cpu_info
+    assert s.uname() is info.uname
+    assert s.hostname() == "myhost"
+    assert s.cpu_count() == 1
+    assert len(proto.commands) == 1
+
+
+def test_info_raises_on_failed_section_and_caches_nothing():
+    proto = FakeProtocol({"uname": "Linux myhost 5.19.0 #1 SMP x86_64\n"}, failing=("cpuinfo",))
+    s = SYSAction(proto, RemoteState())
+
+    with pytest.raises(PermissionDenied):
+        s.info()
+    assert s._cache == {}
+
+    proto.failing = ()
+    proto.responses["cpuinfo"] = CPUINFO
+    assert len(s.cpu_info()) == 2
+
+
+def test_info_async_matches_info():
+    proto = FakeProtocol({"uname": "Linux myhost 6.1.0 #1 SMP x86_64\n", "uptime": "42.00 80.00\n"})
+    s = SYSAction(proto, RemoteState())
+
+    info = asyncio.run(s.info_async())
+    assert info.hostname == "myhost"
+    assert info.uptime.seconds == 42.0
+    assert len(proto.commands) == 1
+
+
+@pytest.mark.parametrize(
+    "parse,text,expected",
+    [
+        pytest.param(
+            _parse_uptime,
+            "54321.00 67890.12\n",
+            {"seconds": 54321.0, "days": 0, "hours": 15},
+            id="uptime",
+        ),
+        pytest.param(
+            _parse_memory,
+            FREE_OUT,
+            {"total": 8000000, "used": 3000000, "swap_used": 10000, "human_total": "7MB"},
+            id="memory",
+        ),
+        pytest.param(
+            _parse_os_release,
+            'NAME="TestOS"\nVERSION="1.2"\nID=testos\nID_LIKE=\n',
+            {"name": "TestOS", "version": "1.2", "id": "testos", "id_like": None},
+            id="os_release",
+        ),
+        pytest.param(
+            _parse_loadavg,
+            "0.10 0.20 0.30 2/100 12345\n",
+            {"one_minute": 0.1, "fifteen_minutes": 0.3, "running_processes": 2},
+            id="loadavg",
+        ),
+    ],
+)
+def test_local_parsers(parse, text, expected):
+    result = parse(text)
+    for name, value in expected.items():
+        assert getattr(result, name) == value
+
+
+def test_parse_cpuinfo_without_optional_fields():
+    cpus = _parse_cpuinfo("processor\t: 0\nmodel name\t: Bare\n")
+
+    assert len(cpus) == 1
+    assert (cpus[0].cores, cpus[0].cpu_mhz, cpus[0].stepping) == (1, 0.0, None)
+    assert cpus[0].flags == []
 
 
 if __name__ == "__main__":